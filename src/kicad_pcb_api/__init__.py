@@ -77,7 +77,14 @@ from .collections import (
 )
 
 # Protocols
-from .interfaces import PCBElement, Placeable, Routable
+from .interfaces import (
+    PCBElement,
+    Placeable,
+    Routable,
+    is_pcb_element,
+    is_placeable,
+    is_routable,
+)
 
 __version__ = "0.1.1"
 __author__ = "Circuit-Synth Team"
@@ -141,6 +148,9 @@ __all__ = [
     "PCBElement",
     "Placeable",
     "Routable",
+    "is_pcb_element",
+    "is_placeable",
+    "is_routable",
 
     # Types
     "Arc",
@@ -9,7 +9,19 @@ Based on kicad-sch-api's IndexedCollection pattern.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +57,7 @@ class IndexedCollection(Generic[T], ABC):
         self._uuid_index: Dict[str, int] = {}
         self._modified = False
         self._dirty_indexes = False
+        self._version = 0
 
         # Add initial items if provided
         if items:
@@ -119,6 +132,42 @@ class IndexedCollection(Generic[T], ABC):
 
         return self._add_item_to_collection(item)
 
+    def extend(self, items: Iterable[T]) -> List[T]:
+        """
+        Add several items to the collection at once.
+
+        The duplicate check and index invalidation happen once for the
+        whole batch, whereas each add() call rebuilds indexes invalidated
+        by the previous one.
+
+        Args:
+            items: Items to add
+
+        Returns:
+            The added items
+
+        Raises:
+            ValueError: If an item's UUID already exists in the collection or
+                repeats within the batch (nothing is added)
+        """
+        items = list(items)
+
+        self._ensure_indexes_current()
+
+        batch: Set[str] = set()
+        for item in items:
+            uuid_str = self._get_item_uuid(item)
+            if uuid_str in self._uuid_index or uuid_str in batch:
+                raise ValueError(f"Item with UUID {uuid_str} already exists")
+            batch.add(uuid_str)
+
+        if items:
+            self._items.extend(items)
+            self._mark_modified()
+            self._mark_indexes_dirty()
+            logger.debug(f"Added {len(items)} items to {self.__class__.__name__}")
+        return items
+
     def remove(self, identifier: Union[str, T]) -> bool:
         """
         Remove an item from the collection.
@@ -212,6 +261,7 @@ class IndexedCollection(Generic[T], ABC):
         self._items.clear()
         self._uuid_index.clear()
         self._mark_modified()
+        self._mark_indexes_dirty()
         logger.debug(f"Cleared all items from {self.__class__.__name__}")
 
     # Collection interface methods
@@ -278,6 +328,7 @@ class IndexedCollection(Generic[T], ABC):
     def _mark_modified(self) -> None:
         """Mark collection as modified."""
         self._modified = True
+        self._version += 1
 
     def _mark_indexes_dirty(self) -> None:
         """Mark indexes as needing rebuild."""
@@ -324,6 +375,23 @@ class IndexedCollection(Generic[T], ABC):
         """Whether collection has been modified."""
         return self._modified
 
+    @property
+    def version(self) -> int:
+        """Counter bumped by every change made through the collection or its wrappers.
+
+        Unlike is_modified it is never reset, so callers can key caches on it.
+        """
+        return self._version
+
+    def mark_modified(self) -> None:
+        """Record edits made to items directly rather than through a wrapper.
+
+        Bumps version and marks the indexes for rebuild, so lookups and
+        caches keyed on version see the edited values.
+        """
+        self._mark_modified()
+        self._mark_indexes_dirty()
+
     def mark_clean(self) -> None:
         """Mark collection as clean (not modified)."""
         self._modified = False
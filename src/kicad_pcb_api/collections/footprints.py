@@ -183,6 +183,21 @@ class FootprintCollection(IndexedCollection[Footprint]):
         indices = self._layer_index.get(layer, [])
         return [FootprintWrapper(self._items[i], self) for i in indices]
 
+    def get_unlocked(self) -> List[FootprintWrapper]:
+        """
+        Get all footprints that are not locked in place.
+
+        Reads each footprint's ``locked`` flag directly, so lock changes made
+        on the raw footprints are seen too.
+
+        Returns:
+            List of footprint wrappers for unlocked footprints
+
+        Example:
+            movable = collection.get_unlocked()
+        """
+        return [FootprintWrapper(fp, self) for fp in self._items if not fp.locked]
+
     # Bulk operations
 
     def bulk_update(self, criteria: Dict[str, Any], updates: Dict[str, Any]) -> int:
@@ -9,15 +9,38 @@ Based on kicad-sch-api's WireCollection pattern.
 
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 from ..core.types import Track
 from ..wrappers.track import TrackWrapper
 from .base import IndexedCollection
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
+class TrackArrays(NamedTuple):
+    """Structure-of-arrays view of a TrackCollection.
+
+    Every array has one entry per track, in collection order.
+    """
+
+    start_x: "np.ndarray"
+    start_y: "np.ndarray"
+    end_x: "np.ndarray"
+    end_y: "np.ndarray"
+    width: "np.ndarray"
+    length: "np.ndarray"
+    net: "np.ndarray"  # int64, -1 for tracks without a net
+    layer: "np.ndarray"  # int64 index into layer_names
+    layer_names: List[str]
+    uuids: List[str]
+
+
 class TrackCollection(IndexedCollection[Track]):
     """
     Collection class for efficient track (trace) management.
@@ -40,6 +63,11 @@ class TrackCollection(IndexedCollection[Track]):
         # Additional indexes
         self._net_index: Dict[int, List[int]] = defaultdict(list)
         self._layer_index: Dict[str, List[int]] = defaultdict(list)
+        self._arrays: Optional[TrackArrays] = None
+        self._arrays_version: Optional[int] = None
+        self._length_order: Optional["np.ndarray"] = None
+        self._sorted_lengths: Optional["np.ndarray"] = None
+        self._length_order_version: Optional[int] = None
 
         # Call parent init
         super().__init__(tracks)
@@ -75,6 +103,52 @@ class TrackCollection(IndexedCollection[Track]):
             f"{len(self._layer_index)} layers"
         )
 
+    def _add_item_to_collection(self, item: Track) -> Track:
+        """Add a track, keeping the array view's existing rows (see arrays())."""
+        current = self._arrays_version == self._version
+        super()._add_item_to_collection(item)
+        if current:
+            self._arrays_version = self._version
+        return item
+
+    def extend(self, items: Iterable[Track]) -> List[Track]:
+        """Add several tracks at once, keeping the array view's existing rows."""
+        current = self._arrays_version == self._version
+        added = super().extend(items)
+        if current:
+            self._arrays_version = self._version
+        return added
+
+    def reorder(self, order: Sequence[int]) -> None:
+        """
+        Put the tracks in a new order.
+
+        A cached array view (see arrays()) is permuted along with the tracks
+        instead of being rebuilt.
+
+        Args:
+            order: Permutation of the track positions (list or NumPy array);
+                the track at order[k] moves to position k
+
+        Raises:
+            ValueError: If order is not a permutation of range(len(self))
+        """
+        positions = order.tolist() if hasattr(order, "tolist") else list(order)
+        count = len(self._items)
+        if len(positions) != count or set(positions) != set(range(count)):
+            raise ValueError("order must be a permutation of the track positions")
+
+        arrays = self._arrays if self._arrays_version == self._version else None
+        self._items = [self._items[i] for i in positions]
+        self._mark_modified()
+        self._mark_indexes_dirty()
+
+        if arrays is not None and len(arrays.uuids) == count:
+            self._arrays = self._permute_arrays(
+                arrays, np.asarray(positions, dtype=np.int64)
+            )
+            self._arrays_version = self._version
+
     # Track-specific access methods
 
     def filter_by_net(self, net: int) -> List[TrackWrapper]:
@@ -185,6 +259,150 @@ class TrackCollection(IndexedCollection[Track]):
         matching = self.filter(width=width)
         return [TrackWrapper(track, self) for track in matching]
 
+    # Array view
+
+    def arrays(self) -> TrackArrays:
+        """
+        Get the tracks as parallel NumPy arrays.
+
+        The view is cached against the collection's version, so it is
+        rebuilt after any change made through the collection or a
+        TrackWrapper. Tracks added since the last call are appended to the
+        view rather than rebuilding it. After editing Track objects directly,
+        call mark_modified() so the next call sees the edits. Treat the
+        arrays as read-only.
+
+        Returns:
+            TrackArrays snapshot of the collection
+
+        Raises:
+            ImportError: If numpy is not installed
+
+        Example:
+            arrays = collection.arrays()
+            net_1_length = arrays.length[arrays.net == 1].sum()
+        """
+        if np is None:
+            raise ImportError("numpy is not installed")
+
+        arrays = self._arrays
+        if arrays is None or self._arrays_version != self._version:
+            arrays = self._build_arrays(self._track_rows(self._items))
+        elif len(arrays.uuids) < len(self._items):
+            tail = self._track_rows(self._items[len(arrays.uuids):])
+            arrays = self._append_arrays(arrays, self._build_arrays(tail))
+        else:
+            return arrays
+
+        self._arrays = arrays
+        self._arrays_version = self._version
+        return arrays
+
+    @staticmethod
+    def _track_rows(tracks: List[Track]) -> List[Tuple]:
+        """Read the fields the array view is built from, one tuple per track."""
+        return [
+            (t.start.x, t.start.y, t.end.x, t.end.y, t.width, t.net, t.layer, t.uuid)
+            for t in tracks
+        ]
+
+    @staticmethod
+    def _build_arrays(rows: List[Tuple]) -> TrackArrays:
+        """Build the structure-of-arrays view from _track_rows output."""
+        n = len(rows)
+        coords = np.array([row[:5] for row in rows], dtype=np.float64).reshape(n, 5)
+
+        layer_codes: Dict[str, int] = {}
+        layers = np.array(
+            [layer_codes.setdefault(row[6], len(layer_codes)) for row in rows],
+            dtype=np.int64,
+        )
+        nets = np.array(
+            [-1 if row[5] is None else row[5] for row in rows], dtype=np.int64
+        )
+
+        start_x, start_y, end_x, end_y, width = (coords[:, k].copy() for k in range(5))
+        return TrackArrays(
+            start_x=start_x,
+            start_y=start_y,
+            end_x=end_x,
+            end_y=end_y,
+            width=width,
+            length=np.hypot(end_x - start_x, end_y - start_y),
+            net=nets,
+            layer=layers,
+            layer_names=list(layer_codes),
+            uuids=[row[7] for row in rows],
+        )
+
+    @staticmethod
+    def _append_arrays(head: TrackArrays, tail: TrackArrays) -> TrackArrays:
+        """Concatenate two array views, merging their layer codes."""
+        layer_names = list(head.layer_names)
+        remap = np.empty(len(tail.layer_names), dtype=np.int64)
+        for code, name in enumerate(tail.layer_names):
+            if name not in layer_names:
+                layer_names.append(name)
+            remap[code] = layer_names.index(name)
+
+        return TrackArrays(
+            start_x=np.concatenate((head.start_x, tail.start_x)),
+            start_y=np.concatenate((head.start_y, tail.start_y)),
+            end_x=np.concatenate((head.end_x, tail.end_x)),
+            end_y=np.concatenate((head.end_y, tail.end_y)),
+            width=np.concatenate((head.width, tail.width)),
+            length=np.concatenate((head.length, tail.length)),
+            net=np.concatenate((head.net, tail.net)),
+            layer=np.concatenate((head.layer, remap[tail.layer])),
+            layer_names=layer_names,
+            uuids=head.uuids + tail.uuids,
+        )
+
+    @staticmethod
+    def _permute_arrays(arrays: TrackArrays, order: "np.ndarray") -> TrackArrays:
+        """Reorder every row of an array view."""
+        return TrackArrays(
+            start_x=arrays.start_x[order],
+            start_y=arrays.start_y[order],
+            end_x=arrays.end_x[order],
+            end_y=arrays.end_y[order],
+            width=arrays.width[order],
+            length=arrays.length[order],
+            net=arrays.net[order],
+            layer=arrays.layer[order],
+            layer_names=arrays.layer_names,
+            uuids=[arrays.uuids[i] for i in order.tolist()],
+        )
+
+    def find_shorter_than(self, length: float) -> List[str]:
+        """
+        Find the tracks shorter than a given length.
+
+        With numpy installed this binary-searches a length-sorted index that
+        is cached on the collection version, like arrays(), so only the
+        matching tracks are visited.
+
+        Args:
+            length: Length threshold in millimeters (exclusive)
+
+        Returns:
+            UUIDs of the shorter tracks, in collection order
+
+        Example:
+            stubs = collection.find_shorter_than(0.1)
+        """
+        if np is None:
+            return [track.uuid for track in self._items if track.get_length() < length]
+
+        arrays = self.arrays()
+        if self._length_order_version != self._version:
+            self._length_order = np.argsort(arrays.length, kind="stable")
+            self._sorted_lengths = arrays.length[self._length_order]
+            self._length_order_version = self._version
+
+        count = int(np.searchsorted(self._sorted_lengths, length, side="left"))
+        return [arrays.uuids[i] for i in np.sort(self._length_order[:count]).tolist()]
+
     # Length calculations
 
     def get_total_length_by_net(self, net: int) -> float:
@@ -201,6 +419,10 @@ class TrackCollection(IndexedCollection[Track]):
             total_length = collection.get_total_length_by_net(1)
             print(f"Net 1 total trace length: {total_length:.2f}mm")
         """
+        if np is not None:
+            arrays = self.arrays()
+            return float(arrays.length[arrays.net == net].sum())
+
         tracks = self.filter_by_net(net)
         return sum(track.length for track in tracks)
 
@@ -214,6 +436,13 @@ class TrackCollection(IndexedCollection[Track]):
         Returns:
             Total length in millimeters
         """
+        if np is not None:
+            arrays = self.arrays()
+            if layer not in arrays.layer_names:
+                return 0.0
+            code = arrays.layer_names.index(layer)
+            return float(arrays.length[arrays.layer == code].sum())
+
         tracks = self.filter_by_layer(layer)
         return sum(track.length for track in tracks)
 
@@ -240,26 +469,47 @@ class TrackCollection(IndexedCollection[Track]):
                 "max_length": 0.0,
             }
 
-        lengths = [track.get_length() for track in self._items]
-        total_length = sum(lengths)
-
-        # Calculate by net
-        length_by_net = {}
-        for net_num in self._net_index.keys():
-            length_by_net[net_num] = self.get_total_length_by_net(net_num)
+        self._ensure_indexes_current()
 
-        # Calculate by layer
-        length_by_layer = {}
-        for layer in self._layer_index.keys():
-            length_by_layer[layer] = self.get_total_length_by_layer(layer)
+        if np is not None:
+            # One array view for every total
+            arrays = self.arrays()
+            lengths = arrays.length
+            total_length = float(lengths.sum())
+            min_length = float(lengths.min())
+            max_length = float(lengths.max())
+            length_by_net = {
+                net_num: float(lengths[arrays.net == net_num].sum())
+                for net_num in self._net_index.keys()
+            }
+            layer_codes = {name: code for code, name in enumerate(arrays.layer_names)}
+            length_by_layer = {
+                layer: float(lengths[arrays.layer == layer_codes[layer]].sum())
+                for layer in self._layer_index.keys()
+            }
+        else:
+            length_list = [track.get_length() for track in self._items]
+            total_length = sum(length_list)
+            min_length = min(length_list)
+            max_length = max(length_list)
+
+            # Calculate by net
+            length_by_net = {}
+            for net_num in self._net_index.keys():
+                length_by_net[net_num] = self.get_total_length_by_net(net_num)
+
+            # Calculate by layer
+            length_by_layer = {}
+            for layer in self._layer_index.keys():
+                length_by_layer[layer] = self.get_total_length_by_layer(layer)
 
         return {
             "total_length": total_length,
             "length_by_net": length_by_net,
             "length_by_layer": length_by_layer,
             "average_length": total_length / len(self._items),
-            "min_length": min(lengths),
-            "max_length": max(lengths),
+            "min_length": min_length,
+            "max_length": max_length,
         }
 
     # Statistics and debugging
@@ -335,6 +335,47 @@ def line_segments_intersect(
     return None
 
 
+def segment_distance_squared(p1: Point, p2: Point, p3: Point, p4: Point) -> float:
+    """Calculate the squared minimum distance between two line segments.
+
+    Use this to compare against a squared threshold without a sqrt.
+    Degenerate segments (start == end) are treated as points.
+
+    Args:
+        p1: First segment start
+        p2: First segment end
+        p3: Second segment start
+        p4: Second segment end
+
+    Returns:
+        Squared distance in mm² (0 if the segments intersect)
+    """
+    if line_segments_intersect(p1, p2, p3, p4) is not None:
+        return 0.0
+
+    return min(
+        distance_squared(p1, closest_point_on_line_segment(p1, p3, p4)),
+        distance_squared(p2, closest_point_on_line_segment(p2, p3, p4)),
+        distance_squared(p3, closest_point_on_line_segment(p3, p1, p2)),
+        distance_squared(p4, closest_point_on_line_segment(p4, p1, p2)),
+    )
+
+
+def segment_distance(p1: Point, p2: Point, p3: Point, p4: Point) -> float:
+    """Calculate the minimum distance between two line segments.
+
+    Args:
+        p1: First segment start
+        p2: First segment end
+        p3: Second segment start
+        p4: Second segment end
+
+    Returns:
+        Distance in mm (0 if the segments intersect)
+    """
+    return math.sqrt(segment_distance_squared(p1, p2, p3, p4))
+
+
 def circle_circle_collision(
     center1: Point, radius1: float, center2: Point, radius2: float
 ) -> bool:
@@ -347,6 +347,14 @@ class PCBBoard:
         try:
             logger.info(f"Loading PCB from {filepath}")
             self.pcb_data = self.parser.parse_file(filepath)
+            for manager in (
+                self.drc,
+                self.net,
+                self.placement,
+                self.routing,
+                self.validation,
+            ):
+                manager._rebind_pcb_data()
             self._filepath = filepath
             self._modified = False
             self.reset_modified()
@@ -610,6 +618,7 @@ class PCBBoard:
 
         removed = len(self.pcb_data["footprints"]) < initial_count
         if removed:
+            self.net.invalidate_cache()
             logger.info(f"Removed footprint {reference}")
         else:
             logger.warning(f"Footprint {reference} not found")
@@ -712,6 +721,7 @@ class PCBBoard:
         # Invalidate net name index cache
         if hasattr(self, '_net_name_index'):
             delattr(self, '_net_name_index')
+        self.net.invalidate_cache()
 
         logger.debug(f"Added net {new_net_num}: {net_name}")
         return new_net_num
@@ -766,6 +776,7 @@ class PCBBoard:
     def clear_footprints(self):
         """Remove all footprints from the board."""
         self.pcb_data["footprints"] = []
+        self.net.invalidate_cache()
         logger.info("Cleared all footprints")
 
     def get_board_info(self) -> Dict[str, Any]:
@@ -978,6 +989,7 @@ class PCBBoard:
         pad1_obj.net_name = net_name
         pad2_obj.net = net_num
         pad2_obj.net_name = net_name
+        self.net.invalidate_cache()
 
         logger.debug(
             f"Connected {ref1}.{pad1} to {ref2}.{pad2} on net {net_num} ({net_name})"
@@ -1007,6 +1019,7 @@ class PCBBoard:
                     )
                     pad.net = None
                     pad.net_name = None
+                    self.net.invalidate_cache()
                     return True
                 else:
                     logger.debug(f"Pad {reference}.{pad_number} was not connected")
@@ -1221,6 +1234,7 @@ class PCBBoard:
         """
         if track in self.pcb_data["tracks"]:
             self.pcb_data["tracks"].remove(track)
+            self.net.invalidate_cache()
             logger.debug("Removed track")
             return True
         return False
@@ -1228,6 +1242,7 @@ class PCBBoard:
     def clear_tracks(self):
         """Remove all tracks from the board."""
         self.pcb_data["tracks"] = []
+        self.net.invalidate_cache()
         logger.debug("Cleared all tracks")
 
     def add_via(
@@ -5,7 +5,6 @@ Uses a modular registry-based architecture for extensible parsing.
 """
 
 import logging
-import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -27,7 +26,9 @@ from ..parsers.elements import (
     ViaParser,
     ZoneParser,
 )
+from ..parsers.reader import parse_sexp
 from ..parsers.registry import ParserRegistry
+from ..utils.ids import new_uuid
 from .pcb_formatter import PCBFormatter
 from .types import (
     Arc,
@@ -127,7 +128,7 @@ class PCBParser:
         Returns:
             Dictionary containing parsed PCB data
         """
-        sexp = sexpdata.loads(content)
+        sexp = parse_sexp(content)
 
         if (
             not self._is_sexp_list(sexp)
@@ -334,7 +335,7 @@ class PCBParser:
 
             # Get UUID
             uuid_elem = self._find_element(sexp, "uuid")
-            fp_uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+            fp_uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
             # Get position
             at_elem = self._find_element(sexp, "at")
@@ -361,7 +362,7 @@ class PCBParser:
             # Parse attributes
             attr_elem = self._find_element(sexp, "attr")
             if attr_elem:
-                footprint.attr = " ".join(str(a) for a in attr_elem[1:])
+                footprint.attr = " ".join(map(str, attr_elem[1:]))
 
             # Parse properties
             for prop_elem in self._find_all_elements(sexp, "property"):
@@ -440,7 +441,7 @@ class PCBParser:
 
         # Get UUID
         uuid_elem = self._find_element(sexp, "uuid")
-        prop_uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        prop_uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         prop = Property(
             name=name, value=value, position=position, layer=layer, uuid=prop_uuid
@@ -475,6 +476,7 @@ class PCBParser:
             position = Point(float(at_elem[1]), float(at_elem[2]))
         else:
             position = Point(0, 0)
+        rotation = float(at_elem[3]) if at_elem and len(at_elem) >= 4 else 0.0
 
         # Get size
         size_elem = self._find_element(sexp, "size")
@@ -486,7 +488,7 @@ class PCBParser:
         # Get layers
         layers_elem = self._find_element(sexp, "layers")
         if layers_elem:
-            layers = [str(l) for l in layers_elem[1:]]
+            layers = list(map(str, layers_elem[1:]))
         else:
             layers = []
 
@@ -497,6 +499,7 @@ class PCBParser:
             position=position,
             size=size,
             layers=layers,
+            rotation=rotation,
         )
 
         # Get drill if present
@@ -526,7 +529,7 @@ class PCBParser:
 
         # Get UUID
         uuid_elem = self._find_element(sexp, "uuid")
-        pad.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        pad.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return pad
 
@@ -558,7 +561,7 @@ class PCBParser:
 
         # Get UUID
         uuid_elem = self._find_element(sexp, "uuid")
-        line.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        line.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return line
 
@@ -592,7 +595,7 @@ class PCBParser:
 
         # Get UUID
         uuid_elem = self._find_element(sexp, "uuid")
-        arc.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        arc.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return arc
 
@@ -629,7 +632,7 @@ class PCBParser:
 
         # Get UUID
         uuid_elem = self._find_element(sexp, "uuid")
-        rect.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        rect.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return rect
 
@@ -666,7 +669,7 @@ class PCBParser:
 
         # Get UUID
         uuid_elem = self._find_element(sexp, "uuid")
-        text.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        text.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return text
 
@@ -685,7 +688,7 @@ class PCBParser:
         drill = float(drill_elem[1]) if drill_elem else 0.4
 
         layers_elem = self._find_element(sexp, "layers")
-        layers = [str(l) for l in layers_elem[1:]] if layers_elem else ["F.Cu", "B.Cu"]
+        layers = list(map(str, layers_elem[1:])) if layers_elem else ["F.Cu", "B.Cu"]
 
         via = Via(position=position, size=size, drill=drill, layers=layers)
 
@@ -694,7 +697,7 @@ class PCBParser:
             via.net = net_elem[1]
 
         uuid_elem = self._find_element(sexp, "uuid")
-        via.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        via.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return via
 
@@ -722,7 +725,7 @@ class PCBParser:
             track.net = net_elem[1]
 
         uuid_elem = self._find_element(sexp, "uuid")
-        track.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        track.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return track
 
@@ -896,7 +899,7 @@ class PCBParser:
                 zone.net_name = item[1]
             elif item_type == "layers":
                 # Can be multiple layers
-                zone.layer = " ".join(str(l) for l in item[1:])
+                zone.layer = " ".join(map(str, item[1:]))
             elif item_type == "uuid":
                 zone.uuid = item[1]
             elif item_type == "hatch":
@@ -1082,8 +1085,11 @@ class PCBParser:
         ]
 
         # Add position
-        if pad.position.x != 0 or pad.position.y != 0:
-            sexp.append([sexpdata.Symbol("at"), pad.position.x, pad.position.y])
+        if pad.position.x != 0 or pad.position.y != 0 or pad.rotation != 0:
+            at_expr = [sexpdata.Symbol("at"), pad.position.x, pad.position.y]
+            if pad.rotation != 0:
+                at_expr.append(pad.rotation)
+            sexp.append(at_expr)
 
         # Add size
         sexp.append([sexpdata.Symbol("size")] + list(pad.size))
@@ -0,0 +1,124 @@
+"""Spatial index for bounding-box queries over board elements.
+
+Uses an R-tree from the optional ``rtree`` package (libspatialindex) when it is
+installed and falls back to a uniform grid (spatial hash) otherwise. Both
+backends answer the same question: which inserted boxes intersect a query box.
+"""
+
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .geometry import BoundingBox
+
+try:
+    from rtree import index as rtree_index
+except ImportError:  # rtree is optional (``pip install kicad-pcb-api[spatial]``)
+    rtree_index = None
+
+
+class SpatialIndex:
+    """Axis-aligned bounding box index keyed by integer ids.
+
+    Example:
+        index = SpatialIndex()
+        index.insert(0, BoundingBox(0, 0, 1, 1))
+        index.insert(1, BoundingBox(0.5, 0.5, 2, 2))
+        list(index.candidate_pairs())  # [(0, 1)]
+    """
+
+    def __init__(self, cell_size: float = 1.0, use_rtree: Optional[bool] = None):
+        """Initialize an empty index.
+
+        Args:
+            cell_size: Grid cell size in mm for the fallback backend
+            use_rtree: Force (True) or disable (False) the R-tree backend;
+                defaults to using it when ``rtree`` is installed
+        """
+        if use_rtree is None:
+            use_rtree = rtree_index is not None
+        elif use_rtree and rtree_index is None:
+            raise ImportError("rtree is not installed")
+
+        self._boxes: Dict[int, BoundingBox] = {}
+        self._rtree = rtree_index.Index() if use_rtree else None
+        self._cell_size = cell_size
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    @property
+    def backend(self) -> str:
+        """Name of the active backend ("rtree" or "grid")."""
+        return "rtree" if self._rtree is not None else "grid"
+
+    def _cells(self, bbox: BoundingBox) -> Iterator[Tuple[int, int]]:
+        """Yield the grid cells a box touches."""
+        size = self._cell_size
+        x0 = math.floor(bbox.min_x / size)
+        x1 = math.floor(bbox.max_x / size)
+        y0 = math.floor(bbox.min_y / size)
+        y1 = math.floor(bbox.max_y / size)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+    def insert(self, item_id: int, bbox: BoundingBox) -> None:
+        """Add a box to the index.
+
+        Args:
+            item_id: Caller-assigned id returned by queries
+            bbox: Bounding box of the item
+        """
+        self._boxes[item_id] = bbox
+        if self._rtree is not None:
+            self._rtree.insert(
+                item_id, (bbox.min_x, bbox.min_y, bbox.max_x, bbox.max_y)
+            )
+        else:
+            grid = self._grid
+            for cell in self._cells(bbox):
+                bucket = grid.get(cell)
+                if bucket is None:
+                    grid[cell] = [item_id]
+                else:
+                    bucket.append(item_id)
+
+    def query(self, bbox: BoundingBox) -> List[int]:
+        """Find the ids of all boxes intersecting ``bbox``.
+
+        Args:
+            bbox: Query box
+
+        Returns:
+            Ids of intersecting items (touching edges count as intersecting)
+        """
+        if self._rtree is not None:
+            return list(
+                self._rtree.intersection(
+                    (bbox.min_x, bbox.min_y, bbox.max_x, bbox.max_y)
+                )
+            )
+
+        seen: Set[int] = set()
+        hits: List[int] = []
+        boxes = self._boxes
+        grid = self._grid
+        for cell in self._cells(bbox):
+            for item_id in grid.get(cell, ()):
+                if item_id not in seen:
+                    seen.add(item_id)
+                    if boxes[item_id].overlaps(bbox):
+                        hits.append(item_id)
+        return hits
+
+    def candidate_pairs(self) -> Iterator[Tuple[int, int]]:
+        """Yield each pair of intersecting boxes once.
+
+        Yields:
+            (id_a, id_b) tuples with id_a < id_b
+        """
+        for item_id, bbox in self._boxes.items():
+            for other_id in self.query(bbox):
+                if other_id > item_id:
+                    yield item_id, other_id
@@ -1,10 +1,20 @@
 """
 Data types for KiCad PCB files.
+
+The element dataclasses are slotted: a board holds many thousands of them,
+so they carry no per-instance ``__dict__`` and only their declared fields
+can be set.
 """
 
+import math
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
 
 
 class Layer(Enum):
@@ -32,7 +42,7 @@ class Layer(Enum):
     B_Fab = "B.Fab"  # Back fabrication
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """2D point in PCB coordinates."""
 
@@ -43,7 +53,7 @@ class Point:
         return f"Point({self.x}, {self.y})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Pad:
     """PCB pad definition."""
 
@@ -65,9 +75,12 @@ class Pad:
         default_factory=dict
     )  # e.g., {"pad_prop_heatsink": True}
     uuid: str = ""
+    # Orientation in degrees as KiCad stores it: on the board, not relative
+    # to the footprint, so it already includes the footprint's rotation
+    rotation: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     """Graphical line on PCB."""
 
@@ -79,7 +92,7 @@ class Line:
     uuid: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Arc:
     """Graphical arc on PCB."""
 
@@ -92,7 +105,7 @@ class Arc:
     uuid: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Text:
     """Text on PCB."""
 
@@ -105,7 +118,7 @@ class Text:
     uuid: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     """Footprint property (Reference, Value, etc.)."""
 
@@ -119,7 +132,20 @@ class Property:
     uuid: str = ""
 
 
-@dataclass
+class PadArrays(NamedTuple):
+    """Structure-of-arrays view of a footprint's pads.
+
+    Every float64 array has one entry per pad, in pad order, in footprint-
+    local coordinates (before the footprint's position and rotation).
+    """
+
+    x: "np.ndarray"
+    y: "np.ndarray"
+    width: "np.ndarray"
+    height: "np.ndarray"
+
+
+@dataclass(slots=True)
 class Footprint:
     """PCB footprint (component physical representation)."""
 
@@ -160,10 +186,65 @@ class Footprint:
     sheetfile: str = ""
     attr: str = ""  # Attributes like "smd"
 
+    # Pad number -> index into pads, built on first lookup (see get_pad)
+    _pad_index: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def get_library_id(self) -> str:
         """Get the full library ID (library:name)."""
         return f"{self.library}:{self.name}"
 
+    @property
+    def pads_by_number(self) -> Dict[str, Pad]:
+        """Pads keyed by their number as a string (first pad wins on duplicates)."""
+        return {number: self.pads[i] for number, i in self._build_pad_index().items()}
+
+    def get_pad(self, number: Union[str, int]) -> Optional[Pad]:
+        """Get a pad by number, comparing numbers as strings.
+
+        Uses a lazily built number index. Each hit is checked against the
+        current pads list and the index is rebuilt when pads were added,
+        removed, replaced or renumbered since it was built.
+        """
+        number = str(number)
+        if self._pad_index is not None:
+            i = self._pad_index.get(number)
+            if (
+                i is not None
+                and i < len(self.pads)
+                and str(self.pads[i].number) == number
+            ):
+                return self.pads[i]
+        i = self._build_pad_index().get(number)
+        return self.pads[i] if i is not None else None
+
+    def pad_arrays(self) -> PadArrays:
+        """Get pad positions and sizes as parallel NumPy arrays.
+
+        Built from the current pads on every call, so it never goes stale
+        when pads are edited; take one snapshot per pass over the pads.
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("numpy is not installed")
+
+        values = np.array(
+            [(p.position.x, p.position.y, p.size[0], p.size[1]) for p in self.pads],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        return PadArrays(*(np.ascontiguousarray(column) for column in values.T))
+
+    def _build_pad_index(self) -> Dict[str, int]:
+        """Rebuild the pad number index from the current pads list."""
+        index: Dict[str, int] = {}
+        for i, pad in enumerate(self.pads):
+            index.setdefault(str(pad.number), i)
+        self._pad_index = index
+        return index
+
     def get_property(self, name: str) -> Optional[Property]:
         """Get a property by name."""
         for prop in self.properties:
@@ -183,7 +264,7 @@ class Footprint:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class Net:
     """PCB net definition."""
 
@@ -191,7 +272,7 @@ class Net:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Via:
     """PCB via definition."""
 
@@ -201,9 +282,10 @@ class Via:
     layers: List[str]
     net: Optional[int] = None
     uuid: str = ""
+    net_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """PCB track (trace) definition."""
 
@@ -222,13 +304,10 @@ class Track:
         Returns:
             Length in millimeters
         """
-        import math
-        dx = self.end.x - self.start.x
-        dy = self.end.y - self.start.y
-        return math.sqrt(dx * dx + dy * dy)
+        return math.hypot(self.end.x - self.start.x, self.end.y - self.start.y)
 
 
-@dataclass
+@dataclass(slots=True)
 class Zone:
     """PCB zone (copper pour area)."""
 
@@ -251,7 +330,7 @@ class Zone:
     uuid: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Rectangle:
     """PCB rectangle graphic definition."""
 
@@ -41,9 +41,17 @@ STANDARD_LAYERS = {
     "Eco2.User",
 }
 
+# Copper layers KiCAD supports: front, back and up to 30 inner layers
+COPPER_LAYERS = frozenset(["F.Cu", "B.Cu"] + [f"In{i}.Cu" for i in range(1, 31)])
+
 # Reference designator pattern: Letter(s) followed by number(s)
 REFERENCE_PATTERN = re.compile(r"^[A-Z]+\d+$")
 
+# Matches a whole line that is not a valid reference, for batch checks
+_INVALID_REFERENCE_LINE = re.compile(
+    rf"^(?!{REFERENCE_PATTERN.pattern[1:-1]}$).+$", re.M
+)
+
 
 def validate_reference(reference: str) -> None:
     """Validate a reference designator.
@@ -66,6 +74,39 @@ def validate_reference(reference: str) -> None:
         )
 
 
+def find_invalid_references(references: List[str]) -> List[int]:
+    """Find the references that do not match REFERENCE_PATTERN.
+
+    Empty references are not reported (they are missing rather than
+    malformed). The references are joined into one newline-separated string
+    and scanned with a single multiline regex, which is much faster than
+    matching them one by one when most are valid.
+
+    Args:
+        references: Reference designators to check
+
+    Returns:
+        Indices into ``references`` of the invalid ones, in order
+    """
+    joined = "\n".join(references)
+    if joined.count("\n") != max(len(references) - 1, 0):
+        # A reference containing a newline would shift the line numbers
+        return [
+            i
+            for i, ref in enumerate(references)
+            if ref and not REFERENCE_PATTERN.match(ref)
+        ]
+
+    indices = []
+    line = 0
+    last = 0
+    for match in _INVALID_REFERENCE_LINE.finditer(joined):
+        line += joined.count("\n", last, match.start())
+        last = match.start()
+        indices.append(line)
+    return indices
+
+
 def validate_layer(layer: str, allow_user_layers: bool = True) -> None:
     """Validate a layer name.
 
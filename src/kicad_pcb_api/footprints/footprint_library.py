@@ -15,9 +15,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-import sexpdata
-
 from ..core.types import Arc, Layer, Line, Pad, Property, Text
+from ..parsers.reader import parse_sexp
 
 logger = logging.getLogger(__name__)
 
@@ -412,7 +411,7 @@ class FootprintLibraryCache:
             with open(info.file_path, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            parsed = sexpdata.loads(content)
+            parsed = parse_sexp(content)
 
             # Convert to dictionary format for easier use
             info._full_data = self._sexp_to_dict(parsed)
@@ -1,5 +1,19 @@
 """Type protocols and interfaces for extensibility."""
 
-from .protocols import PCBElement, Placeable, Routable
+from .protocols import (
+    PCBElement,
+    Placeable,
+    Routable,
+    is_pcb_element,
+    is_placeable,
+    is_routable,
+)
 
-__all__ = ["PCBElement", "Placeable", "Routable"]
+__all__ = [
+    "PCBElement",
+    "Placeable",
+    "Routable",
+    "is_pcb_element",
+    "is_placeable",
+    "is_routable",
+]
@@ -2,9 +2,13 @@
 
 Protocols define interfaces that elements can implement for duck typing.
 This enables extensibility without rigid inheritance hierarchies.
+
+``isinstance`` against a runtime-checkable protocol inspects every protocol
+member on each call. Hot dispatch code should use the ``is_*`` helpers at the
+bottom of this module instead, which memoize the result per concrete type.
 """
 
-from typing import Optional, Protocol, runtime_checkable
+from typing import Any, Dict, Optional, Protocol, Tuple, runtime_checkable
 
 from ..core.types import Point
 
@@ -201,3 +205,51 @@ class Layered(Protocol):
             value: New layer name
         """
         ...
+
+
+# Structural check results keyed by (concrete type, protocol). Elements of one
+# type share a fixed schema, so the answer for one instance holds for all.
+_protocol_cache: Dict[Tuple[type, type], bool] = {}
+
+
+def _conforms(obj: Any, protocol: type) -> bool:
+    """Check ``obj`` against ``protocol``, memoizing the result per type.
+
+    Args:
+        obj: Object to check
+        protocol: Runtime-checkable protocol class
+
+    Returns:
+        True if objects of this type satisfy the protocol
+    """
+    key = (type(obj), protocol)
+    result = _protocol_cache.get(key)
+    if result is None:
+        result = isinstance(obj, protocol)
+        _protocol_cache[key] = result
+    return result
+
+
+def is_pcb_element(obj: Any) -> bool:
+    """Cached equivalent of ``isinstance(obj, PCBElement)``."""
+    return _conforms(obj, PCBElement)
+
+
+def is_placeable(obj: Any) -> bool:
+    """Cached equivalent of ``isinstance(obj, Placeable)``."""
+    return _conforms(obj, Placeable)
+
+
+def is_routable(obj: Any) -> bool:
+    """Cached equivalent of ``isinstance(obj, Routable)``."""
+    return _conforms(obj, Routable)
+
+
+def is_connectable(obj: Any) -> bool:
+    """Cached equivalent of ``isinstance(obj, Connectable)``."""
+    return _conforms(obj, Connectable)
+
+
+def is_layered(obj: Any) -> bool:
+    """Cached equivalent of ``isinstance(obj, Layered)``."""
+    return _conforms(obj, Layered)
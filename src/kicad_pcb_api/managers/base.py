@@ -21,6 +21,14 @@ class BaseManager(ABC):
             board: The PCBBoard instance this manager operates on
         """
         self._board = board
+        # Hot loops read the raw element lists through this alias instead of
+        # resolving board.pcb_data on every call. The board swaps in a new dict
+        # only in PCBBoard.load(), which calls _rebind_pcb_data() afterwards.
+        self._pcb_data = board.pcb_data
+
+    def _rebind_pcb_data(self) -> None:
+        """Refresh the cached pcb_data reference after the board replaced it."""
+        self._pcb_data = self._board.pcb_data
 
     @property
     def board(self) -> "PCBBoard":
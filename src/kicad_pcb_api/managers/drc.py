@@ -1,17 +1,50 @@
 """Design Rule Check (DRC) manager."""
 
 import logging
+import math
 from dataclasses import dataclass
-from typing import List
+from typing import FrozenSet, Iterator, List, Optional, Tuple
 
+from ..core.geometry import BoundingBox, rotate_point, segment_distance_squared
+from ..core.spatial_index import SpatialIndex
+from ..core.types import Pad, Point
 from .base import BaseManager
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy is optional (``pip install kicad-pcb-api[spatial]``)
+    cKDTree = None
+
 logger = logging.getLogger(__name__)
 
+# Element lists at least this long are prefiltered with NumPy threshold masks
+VECTORIZE_THRESHOLD = 64
+
+# Copper shape used by the clearance check: a core outline grown by a radius.
+# The core is a point (vias, round pads), a segment (tracks, oval pads) or a
+# convex polygon (rectangular pads, shrunk by the corner radius for roundrect).
+# Layers of None means the item is on every copper layer.
+_CopperShape = Tuple[
+    str, Optional[int], Optional[FrozenSet[str]], Tuple[Point, ...], float
+]
+
+# Corner radius ratio KiCad uses for roundrect pads without roundrect_rratio
+_DEFAULT_RRATIO = 0.25
 
-@dataclass
+
+@dataclass(slots=True)
 class DRCViolation:
-    """Represents a DRC violation."""
+    """Represents a DRC violation.
+
+    Slotted to keep per-instance memory low on boards with many violations.
+    DRCManager builds these positionally in hot loops, so keep the field
+    order stable.
+    """
 
     type: str  # "clearance", "track_width", "via_size", etc.
     severity: str  # "error", "warning"
@@ -22,6 +55,90 @@ class DRCViolation:
     location_y: float = 0.0
 
 
+def _pad_outline(pad: Pad, centre: Point) -> Tuple[Tuple[Point, ...], float]:
+    """Core outline and radius of a pad's copper, oriented on the board.
+
+    Trapezoid, chamfered and custom pads are checked as their full rectangle,
+    which can only over-report.
+
+    Args:
+        pad: Pad to model
+        centre: Pad centre on the board
+
+    Returns:
+        (outline points, radius) in the _CopperShape convention
+    """
+    width, height = pad.size
+    cx, cy = centre.x, centre.y
+    if pad.shape == "circle":
+        return (centre,), width / 2
+
+    if pad.shape == "oval":
+        half_len = abs(width - height) / 2
+        dx, dy = (half_len, 0.0) if width >= height else (0.0, half_len)
+        outline = (Point(cx - dx, cy - dy), Point(cx + dx, cy + dy))
+        radius = min(width, height) / 2
+    else:
+        radius = 0.0
+        if pad.shape == "roundrect":
+            rratio = pad.roundrect_rratio
+            if rratio is None:
+                rratio = _DEFAULT_RRATIO
+            radius = min(width, height) * rratio
+        half_w = width / 2 - radius
+        half_h = height / 2 - radius
+        if half_w <= 0 or half_h <= 0:
+            # Fully rounded ends: the core collapses to a segment (or a point)
+            half_w = max(half_w, 0.0)
+            half_h = max(half_h, 0.0)
+            outline = (Point(cx - half_w, cy - half_h), Point(cx + half_w, cy + half_h))
+        else:
+            outline = (
+                Point(cx - half_w, cy - half_h),
+                Point(cx + half_w, cy - half_h),
+                Point(cx + half_w, cy + half_h),
+                Point(cx - half_w, cy + half_h),
+            )
+
+    if pad.rotation:
+        outline = tuple(rotate_point(p, centre, pad.rotation) for p in outline)
+    return outline, radius
+
+
+def _edges(outline: Tuple[Point, ...]) -> List[Tuple[Point, Point]]:
+    """Segments making up an outline (a point is a zero-length segment)."""
+    if len(outline) <= 2:
+        return [(outline[0], outline[-1])]
+    return list(zip(outline, outline[1:] + outline[:1]))
+
+
+def _inside_polygon(point: Point, polygon: Tuple[Point, ...]) -> bool:
+    """Whether a point lies inside a convex polygon (either winding)."""
+    sign = 0.0
+    for a, b in zip(polygon, polygon[1:] + polygon[:1]):
+        cross = (b.x - a.x) * (point.y - a.y) - (b.y - a.y) * (point.x - a.x)
+        if cross * sign < 0:
+            return False
+        sign = sign or cross
+    return True
+
+
+def _outline_distance_squared(a: Tuple[Point, ...], b: Tuple[Point, ...]) -> float:
+    """Squared distance between two core outlines (0 if they overlap)."""
+    if len(a) <= 2 and len(b) <= 2:
+        # Tracks, vias, round and oval pads: the common case
+        return segment_distance_squared(a[0], a[-1], b[0], b[-1])
+    if len(a) > 2 and _inside_polygon(b[0], a):
+        return 0.0
+    if len(b) > 2 and _inside_polygon(a[0], b):
+        return 0.0
+    return min(
+        segment_distance_squared(p1, p2, p3, p4)
+        for p1, p2 in _edges(a)
+        for p3, p4 in _edges(b)
+    )
+
+
 class DRCManager(BaseManager):
     """Manager for Design Rule Checking.
 
@@ -36,15 +153,38 @@ class DRCManager(BaseManager):
         """
         super().__init__(board)
         self._violations: List[DRCViolation] = []
+        # Severity partitions, filled as violations are recorded
+        self._errors: List[DRCViolation] = []
+        self._warnings: List[DRCViolation] = []
+        # Broad-phase index over copper shapes, rebuilt by check_clearance()
+        self._spatial_index: Optional[SpatialIndex] = None
+        self._spatial_items: List[_CopperShape] = []
+        # Item ids of the vias, which are contiguous in _spatial_items
+        self._via_ids = range(0)
 
     @property
     def violations(self) -> List[DRCViolation]:
         """Get list of DRC violations.
 
+        Returns a copy, like get_errors() and get_warnings(), so callers
+        cannot desynchronise it from the severity partitions.
+
         Returns:
             List of violations from last check
         """
-        return self._violations
+        return list(self._violations)
+
+    def _record(self, violation: DRCViolation) -> None:
+        """Record a violation and file it under its severity.
+
+        Args:
+            violation: Violation to record
+        """
+        self._violations.append(violation)
+        if violation.severity == "error":
+            self._errors.append(violation)
+        elif violation.severity == "warning":
+            self._warnings.append(violation)
 
     def check_track_widths(self, min_width: float = 0.1, max_width: float = 10.0) -> int:
         """Check track widths against design rules.
@@ -58,29 +198,45 @@ class DRCManager(BaseManager):
         """
         count = 0
 
-        # Access raw track data instead of collection
-        for track in self.board.pcb_data.get("tracks", []):
+        # Access raw track data instead of collection; bind loop-invariant
+        # lookups once so the per-track cost is just the comparisons
+        tracks = self._pcb_data.get("tracks", [])
+        record = self._record
+        Violation = DRCViolation
+
+        if np is not None and len(tracks) >= VECTORIZE_THRESHOLD:
+            # Compare all widths at once and only walk the violators
+            widths = np.fromiter(
+                (t.width for t in tracks), dtype=np.float64, count=len(tracks)
+            )
+            flagged = np.flatnonzero((widths < min_width) | (widths > max_width))
+            tracks = [tracks[i] for i in flagged]
+
+        for track in tracks:
             if track.width < min_width:
-                self._violations.append(
-                    DRCViolation(
-                        type="track_width",
-                        severity="error",
-                        description=f"Track width {track.width}mm below minimum {min_width}mm",
-                        element1_uuid=track.uuid,
-                        location_x=track.start.x,
-                        location_y=track.start.y,
+                # Positional args follow the DRCViolation field order
+                record(
+                    Violation(
+                        "track_width",
+                        "error",
+                        f"Track width {track.width}mm below minimum {min_width}mm",
+                        track.uuid,
+                        "",
+                        track.start.x,
+                        track.start.y,
                     )
                 )
                 count += 1
             elif track.width > max_width:
-                self._violations.append(
-                    DRCViolation(
-                        type="track_width",
-                        severity="warning",
-                        description=f"Track width {track.width}mm exceeds maximum {max_width}mm",
-                        element1_uuid=track.uuid,
-                        location_x=track.start.x,
-                        location_y=track.start.y,
+                record(
+                    Violation(
+                        "track_width",
+                        "warning",
+                        f"Track width {track.width}mm exceeds maximum {max_width}mm",
+                        track.uuid,
+                        "",
+                        track.start.x,
+                        track.start.y,
                     )
                 )
                 count += 1
@@ -103,42 +259,210 @@ class DRCManager(BaseManager):
         count = 0
 
         # Access raw via data instead of collection
-        for via in self.board.pcb_data.get("vias", []):
-            if via.size < min_size:
-                self._violations.append(
-                    DRCViolation(
-                        type="via_size",
-                        severity="error",
-                        description=f"Via size {via.size}mm below minimum {min_size}mm",
-                        element1_uuid=via.uuid,
-                        location_x=via.position.x,
-                        location_y=via.position.y,
-                    )
+        vias = self._pcb_data.get("vias", [])
+        record = self._record
+        Violation = DRCViolation
+
+        if np is not None and len(vias) >= VECTORIZE_THRESHOLD:
+            # Structure-of-arrays view of the via dimensions
+            sizes = np.fromiter(
+                (v.size for v in vias), dtype=np.float64, count=len(vias)
+            )
+            drills = np.fromiter(
+                (v.drill for v in vias), dtype=np.float64, count=len(vias)
+            )
+            flagged = np.flatnonzero(
+                (sizes < min_size)
+                | (drills < min_drill)
+                | np.greater_equal(drills, sizes)
+            )
+            vias = [vias[i] for i in flagged]
+
+        def flag(via, vtype: str, description: str) -> None:
+            # Single construction path shared by every via rule
+            record(
+                Violation(
+                    vtype,
+                    "error",
+                    description,
+                    via.uuid,
+                    "",
+                    via.position.x,
+                    via.position.y,
                 )
-                count += 1
+            )
 
-            if via.drill < min_drill:
-                self._violations.append(
-                    DRCViolation(
-                        type="via_drill",
-                        severity="error",
-                        description=f"Via drill {via.drill}mm below minimum {min_drill}mm",
-                        element1_uuid=via.uuid,
-                        location_x=via.position.x,
-                        location_y=via.position.y,
-                    )
+        for via in vias:
+            size = via.size
+            drill = via.drill
+            if size < min_size:
+                flag(via, "via_size", f"Via size {size}mm below minimum {min_size}mm")
+                count += 1
+            if drill < min_drill:
+                flag(
+                    via, "via_drill", f"Via drill {drill}mm below minimum {min_drill}mm"
                 )
                 count += 1
+            if drill >= size:
+                flag(
+                    via,
+                    "via_drill",
+                    f"Via drill {drill}mm must be smaller than pad size {size}mm",
+                )
+                count += 1
+
+        return count
 
-            if via.drill >= via.size:
-                self._violations.append(
+    def _build_spatial_index(self, clearance: float) -> SpatialIndex:
+        """Index every track, via and pad by its clearance envelope.
+
+        Each shape's bounding box is grown by its radius plus half the
+        clearance, so two envelopes overlap exactly when the shapes' boxes
+        are within ``clearance`` of each other.
+
+        Pads follow their shape and orientation: round pads are points,
+        oval pads segments, and rectangular pads polygons.
+
+        Args:
+            clearance: Clearance in mm the index will be queried for
+
+        Returns:
+            The populated index (also kept on the manager)
+        """
+        items: List[_CopperShape] = []
+
+        for track in self._pcb_data.get("tracks", []):
+            layers = frozenset((track.layer,))
+            outline = (track.start, track.end)
+            items.append((track.uuid, track.net, layers, outline, track.width / 2))
+
+        via_start = len(items)
+        for via in self._pcb_data.get("vias", []):
+            # Through vias span every copper layer, including inner ones
+            layers = (
+                None if {"F.Cu", "B.Cu"} <= set(via.layers) else frozenset(via.layers)
+            )
+            items.append((via.uuid, via.net, layers, (via.position,), via.size / 2))
+        self._via_ids = range(via_start, len(items))
+
+        for footprint in self._pcb_data.get("footprints", []):
+            origin = footprint.position
+            for pad in footprint.pads:
+                copper = [layer for layer in pad.layers if layer.endswith(".Cu")]
+                if not copper:
+                    continue
+                layers = None if "*.Cu" in copper else frozenset(copper)
+
+                centre = Point(origin.x + pad.position.x, origin.y + pad.position.y)
+                if footprint.rotation:
+                    centre = rotate_point(centre, origin, footprint.rotation)
+                outline, radius = _pad_outline(pad, centre)
+                pad_id = pad.uuid or footprint.uuid
+                items.append((pad_id, pad.net, layers, outline, radius))
+
+        boxes = []
+        for _, _, _, outline, radius in items:
+            margin = radius + clearance / 2
+            xs = [p.x for p in outline]
+            ys = [p.y for p in outline]
+            boxes.append(
+                BoundingBox(
+                    min(xs) - margin,
+                    min(ys) - margin,
+                    max(xs) + margin,
+                    max(ys) + margin,
+                )
+            )
+
+        # Grid fallback: cells about the size of a typical envelope
+        typical = (
+            sum(max(b.width, b.height) for b in boxes) / len(boxes) if boxes else 1.0
+        )
+        index = SpatialIndex(cell_size=max(typical, 0.1))
+        for item_id, bbox in enumerate(boxes):
+            index.insert(item_id, bbox)
+
+        self._spatial_index = index
+        self._spatial_items = items
+        return index
+
+    def _candidate_pairs(
+        self, index: SpatialIndex, clearance: float
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield item pairs whose clearance envelopes may touch.
+
+        With scipy installed, via-to-via pairs come from a KD-tree over the
+        via centres (a fixed-radius point query) instead of the box index.
+
+        Args:
+            index: Index built by _build_spatial_index()
+            clearance: Clearance in mm the index was built for
+
+        Yields:
+            (id_a, id_b) tuples with id_a < id_b
+        """
+        vias = self._via_ids
+        if cKDTree is None or len(vias) < 2:
+            yield from index.candidate_pairs()
+            return
+
+        for i, j in index.candidate_pairs():
+            if i not in vias or j not in vias:
+                yield i, j
+
+        items = self._spatial_items
+        centres = [(items[k][3][0].x, items[k][3][0].y) for k in vias]
+        reach = 2 * max(items[k][4] for k in vias) + clearance
+        for i, j in sorted(cKDTree(centres).query_pairs(reach)):
+            yield vias[i], vias[j]
+
+    def check_clearance(self, min_clearance: float = 0.2) -> int:
+        """Check copper-to-copper clearance between different nets.
+
+        Candidate pairs come from the spatial index; only those get an exact
+        distance test between their outlines, done on squared distances.
+        Items on the same net, or with no copper layer in common, are not
+        compared.
+
+        Args:
+            min_clearance: Minimum allowed gap between copper edges in mm
+
+        Returns:
+            Number of violations found
+        """
+        index = self._build_spatial_index(min_clearance)
+        items = self._spatial_items
+        record = self._record
+        count = 0
+
+        for i, j in self._candidate_pairs(index, min_clearance):
+            uuid_a, net_a, layers_a, outline_a, radius_a = items[i]
+            uuid_b, net_b, layers_b, outline_b, radius_b = items[j]
+
+            if net_a and net_a == net_b:
+                continue
+            if (
+                layers_a is not None
+                and layers_b is not None
+                and layers_a.isdisjoint(layers_b)
+            ):
+                continue
+
+            # Compare squared core distance against the squared limit;
+            # the square root is only taken to report an actual violation
+            limit = min_clearance + radius_a + radius_b
+            dist_sq = _outline_distance_squared(outline_a, outline_b)
+            if dist_sq < limit * limit:
+                gap = max(math.sqrt(dist_sq) - radius_a - radius_b, 0.0)
+                record(
                     DRCViolation(
-                        type="via_drill",
-                        severity="error",
-                        description=f"Via drill {via.drill}mm must be smaller than pad size {via.size}mm",
-                        element1_uuid=via.uuid,
-                        location_x=via.position.x,
-                        location_y=via.position.y,
+                        "clearance",
+                        "error",
+                        f"Clearance {gap:.3f}mm below minimum {min_clearance}mm",
+                        uuid_a,
+                        uuid_b,
+                        outline_a[0].x,
+                        outline_a[0].y,
                     )
                 )
                 count += 1
@@ -151,6 +475,7 @@ class DRCManager(BaseManager):
         max_track_width: float = 10.0,
         min_via_size: float = 0.2,
         min_via_drill: float = 0.1,
+        min_clearance: float = 0.2,
     ) -> int:
         """Run all DRC checks.
 
@@ -159,17 +484,19 @@ class DRCManager(BaseManager):
             max_track_width: Maximum track width in mm
             min_via_size: Minimum via size in mm
             min_via_drill: Minimum via drill in mm
+            min_clearance: Minimum copper-to-copper clearance in mm
 
         Returns:
             Total number of violations found
         """
-        self._violations.clear()
+        self.clear_violations()
 
         count = 0
         count += self.check_track_widths(min_track_width, max_track_width)
         count += self.check_via_sizes(min_via_size, min_drill=min_via_drill)
+        count += self.check_clearance(min_clearance)
 
-        logger.info(f"DRC check complete: {count} violations found")
+        logger.info("DRC check complete: %d violations found", count)
         return count
 
     def get_errors(self) -> List[DRCViolation]:
@@ -178,7 +505,7 @@ class DRCManager(BaseManager):
         Returns:
             List of error violations
         """
-        return [v for v in self._violations if v.severity == "error"]
+        return list(self._errors)
 
     def get_warnings(self) -> List[DRCViolation]:
         """Get only warning-level violations.
@@ -186,8 +513,10 @@ class DRCManager(BaseManager):
         Returns:
             List of warning violations
         """
-        return [v for v in self._violations if v.severity == "warning"]
+        return list(self._warnings)
 
     def clear_violations(self) -> None:
         """Clear all recorded violations."""
         self._violations.clear()
+        self._errors.clear()
+        self._warnings.clear()
@@ -1,12 +1,50 @@
 """Net management operations."""
 
 import logging
-from typing import Dict, List, Optional, Set
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Dict, Iterator, List, Optional, Set
 
 from .base import BaseManager
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Boards with more tracks than this use the NumPy path for track lengths
+VECTORIZE_TRACK_THRESHOLD = 256
+
+
+@dataclass(slots=True, eq=False)
+class NetStats(Mapping):
+    """Per-net statistics returned by NetManager.get_net_statistics().
+
+    Also a read-only Mapping of field name to value (``stats["track_count"]``,
+    ``.get()``, ``.items()``, equality with a dict) for code written against
+    the earlier dict-of-dicts return value.
+    """
+
+    name: Optional[str] = None
+    track_count: int = 0
+    via_count: int = 0
+    pad_count: int = 0
+    total_track_length: float = 0.0
+
+    def __getitem__(self, key: str):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (field.name for field in fields(self))
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+
 
 class NetManager(BaseManager):
     """Manager for net operations.
@@ -14,124 +52,282 @@ class NetManager(BaseManager):
     Handles net classes, net connectivity, and net-based queries.
     """
 
+    def __init__(self, board):
+        """Initialize net manager.
+
+        Args:
+            board: Parent PCBBoard instance
+        """
+        super().__init__(board)
+        self._all_nets_cache: Optional[Set[int]] = None
+        self._net_name_cache: Optional[Dict[int, str]] = None
+        self._net_to_elements: Optional[Dict[int, List[object]]] = None
+        self._cache_key: Optional[tuple] = None
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached net data.
+
+        PCBBoard's mutation methods call this. Call it yourself after
+        changing ``net``/``net_name`` on raw elements, or after editing
+        pcb_data lists in place without changing their length.
+        """
+        self._all_nets_cache = None
+        self._net_name_cache = None
+        self._net_to_elements = None
+        self._cache_key = None
+
+    def _cache_state(self) -> tuple:
+        """Cheap fingerprint of the board the caches are checked against.
+
+        Covers the pcb_data dict, the length of each element list and the
+        version counters of the footprint, track and via collections.
+        """
+        data = self._pcb_data
+        board = self.board
+        return (
+            id(data),
+            len(data.get("nets") or ()),
+            len(data.get("footprints") or ()),
+            len(data.get("tracks") or ()),
+            len(data.get("vias") or ()),
+            board.footprints.version,
+            board.tracks.version,
+            board.vias.version,
+        )
+
+    def _validate_cache(self) -> None:
+        """Invalidate caches if the board's element lists have changed."""
+        state = self._cache_state()
+        if state != self._cache_key:
+            self.invalidate_cache()
+            self._cache_key = state
+
     def get_all_nets(self) -> Set[int]:
         """Get all unique net numbers in the board.
 
+        The set is built on first use and cached until the board changes.
+
         Returns:
             Set of net numbers
         """
-        nets: Set[int] = set()
+        self._validate_cache()
+        if self._all_nets_cache is not None:
+            return set(self._all_nets_cache)
+
+        data = self._pcb_data
+
+        # Nets defined in the board's net list, then any referenced by
+        # pads, tracks or vias (raw data lists, not collections)
+        nets: Set[int] = {net.number for net in data.get("nets", [])}
+        nets.update(
+            pad.net
+            for footprint_data in data.get("footprints", [])
+            for pad in footprint_data.pads
+            if pad.net is not None
+        )
+        nets.update(t.net for t in data.get("tracks", []) if t.net is not None)
+        nets.update(v.net for v in data.get("vias", []) if v.net is not None)
+
+        self._all_nets_cache = nets
+        return set(nets)
+
+    def _build_net_name_index(self) -> Dict[int, str]:
+        """Build and cache the net name and net membership indexes.
+
+        Names are taken from footprint pads first, then tracks, then vias,
+        keeping the first non-empty name seen for each net. The same pass
+        records which pads, tracks and vias sit on each net.
 
-        # First, collect all nets defined in the board's net list
-        for net in self.board.pcb_data.get("nets", []):
-            nets.add(net.number)
+        Returns:
+            Dictionary mapping net numbers to net names
+        """
+        index: Dict[int, str] = {}
+        members: Dict[int, List[object]] = {}
 
-        # Also collect nets from footprint pads
-        # Access raw data list instead of iterating over collection
-        for footprint_data in self.board.pcb_data.get("footprints", []):
+        for footprint_data in self._pcb_data.get("footprints", []):
             for pad in footprint_data.pads:
-                if pad.net is not None:
-                    nets.add(pad.net)
+                members.setdefault(pad.net, []).append(pad)
+                if pad.net_name and pad.net not in index:
+                    index[pad.net] = pad.net_name
 
-        # Collect nets from tracks
-        for track_data in self.board.pcb_data.get("tracks", []):
-            if track_data.net is not None:
-                nets.add(track_data.net)
+        for track_data in self._pcb_data.get("tracks", []):
+            members.setdefault(track_data.net, []).append(track_data)
+            if track_data.net_name and track_data.net not in index:
+                index[track_data.net] = track_data.net_name
 
-        # Collect nets from vias
-        for via_data in self.board.pcb_data.get("vias", []):
-            if via_data.net is not None:
-                nets.add(via_data.net)
+        for via_data in self._pcb_data.get("vias", []):
+            members.setdefault(via_data.net, []).append(via_data)
+            if via_data.net_name and via_data.net not in index:
+                index[via_data.net] = via_data.net_name
 
-        return nets
+        self._net_name_cache = index
+        self._net_to_elements = members
+        return index
 
     def get_net_name(self, net: int) -> Optional[str]:
         """Get the name for a net number.
 
+        The lookup is served from an index built on first use.
+
         Args:
             net: Net number
 
         Returns:
             Net name if found, None otherwise
         """
-        # Try to find net name from footprint pads
-        for footprint_data in self.board.pcb_data.get("footprints", []):
-            for pad in footprint_data.pads:
-                if pad.net == net and pad.net_name:
-                    return pad.net_name
-
-        # Try tracks
-        for track_data in self.board.pcb_data.get("tracks", []):
-            if track_data.net == net and hasattr(track_data, 'net_name') and track_data.net_name:
-                return track_data.net_name
-
-        # Try vias
-        for via_data in self.board.pcb_data.get("vias", []):
-            if via_data.net == net and hasattr(via_data, 'net_name') and via_data.net_name:
-                return via_data.net_name
-
-        return None
+        self._validate_cache()
+        index = self._net_name_cache
+        if index is None:
+            index = self._build_net_name_index()
+        return index.get(net)
 
-    def get_net_statistics(self) -> Dict[int, Dict[str, any]]:
+    def get_net_statistics(self) -> Dict[int, NetStats]:
         """Get comprehensive statistics for all nets.
 
         Returns:
-            Dictionary mapping net numbers to statistics including:
+            Dictionary mapping net numbers to NetStats with:
             - name: Net name
             - track_count: Number of tracks on this net
             - via_count: Number of vias on this net
             - pad_count: Number of pads on this net
             - total_track_length: Total length of tracks in mm
         """
-        stats: Dict[int, Dict[str, any]] = {}
+        stats: Dict[int, NetStats] = {net: NetStats() for net in self.get_all_nets()}
+        if not stats:
+            return stats
 
-        for net in self.get_all_nets():
-            name = self.get_net_name(net)
-            tracks = [t for t in self.board.pcb_data.get("tracks", []) if t.net == net]
-            vias = [v for v in self.board.pcb_data.get("vias", []) if v.net == net]
-
-            pad_count = 0
-            for footprint_data in self.board.pcb_data.get("footprints", []):
-                for pad in footprint_data.pads:
-                    if pad.net == net:
-                        pad_count += 1
-
-            # Calculate track length
-            total_length = 0
+        # Bucket every element into its net in a single pass per element
+        # type. Names follow get_net_name() precedence: pads, tracks, vias.
+        for footprint_data in self._pcb_data.get("footprints", []):
+            for pad in footprint_data.pads:
+                entry = stats.get(pad.net)
+                if entry is None:
+                    continue
+                entry.pad_count += 1
+                if entry.name is None and pad.net_name:
+                    entry.name = pad.net_name
+
+        tracks = self._pcb_data.get("tracks", [])
+        if np is not None and len(tracks) > VECTORIZE_TRACK_THRESHOLD:
+            self._accumulate_track_stats_vectorized(tracks, stats)
+        else:
             for track in tracks:
-                import math
-                dx = track.end.x - track.start.x
-                dy = track.end.y - track.start.y
-                total_length += math.sqrt(dx * dx + dy * dy)
-
-            stats[net] = {
-                "name": name,
-                "track_count": len(tracks),
-                "via_count": len(vias),
-                "pad_count": pad_count,
-                "total_track_length": total_length,
-            }
+                entry = stats.get(track.net)
+                if entry is None:
+                    continue
+                entry.track_count += 1
+                entry.total_track_length += math.hypot(
+                    track.end.x - track.start.x, track.end.y - track.start.y
+                )
+                if entry.name is None and track.net_name:
+                    entry.name = track.net_name
+
+        for via in self._pcb_data.get("vias", []):
+            entry = stats.get(via.net)
+            if entry is None:
+                continue
+            entry.via_count += 1
+            if entry.name is None and via.net_name:
+                entry.name = via.net_name
 
         return stats
 
+    @staticmethod
+    def _accumulate_track_stats_vectorized(
+        tracks: list, stats: Dict[int, NetStats]
+    ) -> None:
+        """Add track counts and lengths to ``stats`` using NumPy.
+
+        Segment lengths are computed with one ``np.hypot`` call and summed
+        per net with ``np.bincount``; only the per-net totals go back through
+        Python.
+
+        Args:
+            tracks: Raw track list from pcb_data
+            stats: Per-net statistics dict to update in place
+        """
+        count = len(tracks)
+        coords = np.fromiter(
+            (c for t in tracks for c in (t.start.x, t.start.y, t.end.x, t.end.y)),
+            dtype=np.float64,
+            count=4 * count,
+        ).reshape(count, 4)
+        has_net = np.fromiter(
+            (t.net is not None for t in tracks), dtype=bool, count=count
+        )
+        nets = np.fromiter(
+            (t.net if t.net is not None else 0 for t in tracks),
+            dtype=np.int64,
+            count=count,
+        )[has_net]
+        if nets.size == 0:
+            return
+
+        lengths = np.hypot(coords[:, 2] - coords[:, 0], coords[:, 3] - coords[:, 1])
+        lengths = lengths[has_net]
+        offset = int(nets.min())
+        counts = np.bincount(nets - offset)
+        totals = np.bincount(nets - offset, weights=lengths)
+
+        for bucket in np.flatnonzero(counts):
+            entry = stats.get(int(bucket) + offset)
+            if entry is not None:
+                entry.track_count += int(counts[bucket])
+                entry.total_track_length += float(totals[bucket])
+
+        # Names still come from the objects, but only for nets that need one
+        for track in tracks:
+            entry = stats.get(track.net)
+            if entry is not None and entry.name is None and track.net_name:
+                entry.name = track.net_name
+
     def find_unconnected_pads(self) -> List[tuple]:
         """Find all pads that are not connected (net = 0 or None).
 
         Returns:
             List of (footprint_reference, pad_number) tuples
         """
-        unconnected = []
-
-        for footprint_data in self.board.pcb_data.get("footprints", []):
-            for pad in footprint_data.pads:
-                if pad.net is None or pad.net == 0:
-                    unconnected.append((footprint_data.reference, pad.number))
-
-        return unconnected
+        return [
+            (footprint_data.reference, pad.number)
+            for footprint_data in self._pcb_data.get("footprints", [])
+            for pad in footprint_data.pads
+            if pad.net is None or pad.net == 0
+        ]
 
     def rename_net(self, old_net: int, new_name: str) -> int:
         """Rename a net (update net_name on all connected elements).
 
+        Args:
+            old_net: Net number to rename
+            new_name: New name for the net
+
+        Returns:
+            Number of elements updated
+        """
+        self._validate_cache()
+        members = self._net_to_elements
+        if members is not None:
+            # Index is built: touch only the elements on this net
+            elements = members.get(old_net, [])
+            for element in elements:
+                element.net_name = new_name
+            count = len(elements)
+        else:
+            count = self._rename_net_scan(old_net, new_name)
+
+        if count > 0:
+            # Membership is unchanged, so patch the name index in place
+            if self._net_name_cache is not None:
+                self._net_name_cache[old_net] = new_name
+            logger.info(
+                "Renamed net %s to '%s' on %d elements", old_net, new_name, count
+            )
+
+        return count
+
+    def _rename_net_scan(self, old_net: int, new_name: str) -> int:
+        """Rename a net by scanning every pad, track and via.
+
         Args:
             old_net: Net number to rename
             new_name: New name for the net
@@ -142,27 +338,22 @@ class NetManager(BaseManager):
         count = 0
 
         # Update footprint pads
-        for footprint_data in self.board.pcb_data.get("footprints", []):
+        for footprint_data in self._pcb_data.get("footprints", []):
             for pad in footprint_data.pads:
                 if pad.net == old_net:
                     pad.net_name = new_name
                     count += 1
 
         # Update tracks
-        for track_data in self.board.pcb_data.get("tracks", []):
+        for track_data in self._pcb_data.get("tracks", []):
             if track_data.net == old_net:
-                if hasattr(track_data, 'net_name'):
-                    track_data.net_name = new_name
+                track_data.net_name = new_name
                 count += 1
 
         # Update vias
-        for via_data in self.board.pcb_data.get("vias", []):
+        for via_data in self._pcb_data.get("vias", []):
             if via_data.net == old_net:
-                if hasattr(via_data, 'net_name'):
-                    via_data.net_name = new_name
+                via_data.net_name = new_name
                 count += 1
 
-        if count > 0:
-            logger.info(f"Renamed net {old_net} to '{new_name}' on {count} elements")
-
         return count
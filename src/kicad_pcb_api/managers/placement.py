@@ -2,18 +2,113 @@
 
 import logging
 import math
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from ..core.geometry import BoundingBox as GeometryBox
+from ..core.spatial_index import SpatialIndex
 from ..core.types import Point
 from ..placement.base import ComponentWrapper, PlacementAlgorithm
 from ..placement.bbox import BoundingBox
-from ..placement.courtyard_collision import CourtyardCollisionDetector
+from ..placement.courtyard_collision import CourtyardCollisionDetector, Polygon
 from ..placement.hierarchical_placement import HierarchicalPlacer
 from ..placement.spiral_placement import SpiralPlacer
+from ..utils.jit import NUMBA_AVAILABLE
+from ..wrappers.footprint import FootprintWrapper
 from .base import BaseManager
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Reference lists at least this long get their coordinates computed with NumPy,
+# and boards at least this large take the Numba collision kernels
+VECTORIZE_THRESHOLD = 64
+
+
+def _stack_polygons(polygons: Sequence[Polygon]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Pack polygons into one vertex array for the Numba kernels.
+
+    Args:
+        polygons: Polygons to pack
+
+    Returns:
+        (vertices, offsets): a (total, 2) float64 array and an int64 array of
+        length len(polygons) + 1; polygon k is
+        ``vertices[offsets[k]:offsets[k + 1]]``
+    """
+    offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(polygon.vertices) for polygon in polygons])
+    vertices = np.array(
+        [v for polygon in polygons for v in polygon.vertices], dtype=np.float64
+    ).reshape(-1, 2)
+    return vertices, offsets
+
+
+@dataclass(slots=True)
+class _FootprintGeometry:
+    """Structure-of-arrays snapshot of footprint placement state.
+
+    Built once per manager call so the checks read flat arrays instead of
+    going through footprint properties for every comparison. ``xs``, ``ys``
+    and ``rotations`` are float64 arrays when NumPy is installed and lists
+    otherwise. Courtyard polygons are transformed on first use.
+
+    The snapshot is not kept between calls: footprints are plain dataclasses
+    that parsers, wrappers and placers all write to directly, so there is no
+    single setter to hang invalidation on.
+    """
+
+    footprints: Sequence
+    references: List[str]
+    xs: Sequence[float]
+    ys: Sequence[float]
+    rotations: Sequence[float]
+    _courtyards: Optional[List[Polygon]] = None
+
+    @classmethod
+    def from_footprints(cls, footprints: Sequence) -> "_FootprintGeometry":
+        """Read reference, position and rotation from each footprint once.
+
+        Args:
+            footprints: Footprints to snapshot
+
+        Returns:
+            Snapshot indexed like ``footprints``
+        """
+        n = len(footprints)
+        positions = [fp.position for fp in footprints]
+        rotations = [fp.rotation for fp in footprints]
+        if np is not None:
+            xs = np.fromiter((p.x for p in positions), dtype=np.float64, count=n)
+            ys = np.fromiter((p.y for p in positions), dtype=np.float64, count=n)
+            rotations = np.array(rotations, dtype=np.float64)
+        else:
+            xs = [p.x for p in positions]
+            ys = [p.y for p in positions]
+        return cls(footprints, [fp.reference for fp in footprints], xs, ys, rotations)
+
+    def __len__(self) -> int:
+        return len(self.references)
+
+    def courtyards(self, detector: CourtyardCollisionDetector) -> List[Polygon]:
+        """Courtyard polygons at each footprint's position and rotation.
+
+        Args:
+            detector: Detector used to extract the courtyards
+
+        Returns:
+            One polygon per footprint
+        """
+        if self._courtyards is None:
+            self._courtyards = [
+                detector.get_footprint_polygon(fp) for fp in self.footprints
+            ]
+        return self._courtyards
+
 
 class PlacementManager(BaseManager):
     """Manager for component placement operations.
@@ -21,6 +116,19 @@ class PlacementManager(BaseManager):
     Handles automatic placement, alignment, and distribution of components.
     """
 
+    def _resolve(self, references: Sequence[str]) -> List[Optional[FootprintWrapper]]:
+        """Look up the footprints for a list of references in one pass.
+
+        Args:
+            references: Component references
+
+        Returns:
+            Footprints in the same order as ``references``, with None for
+            references that are not on the board
+        """
+        get_by_reference = self.board.footprints.get_by_reference
+        return [get_by_reference(ref) for ref in references]
+
     def place_in_grid(
         self,
         references: List[str],
@@ -43,21 +151,25 @@ class PlacementManager(BaseManager):
         Returns:
             Number of components placed
         """
-        count = 0
+        n = len(references)
+        if np is not None and n >= VECTORIZE_THRESHOLD:
+            idx = np.arange(n)
+            xs = (start_x + (idx % columns) * spacing_x).tolist()
+            ys = (start_y + (idx // columns) * spacing_y).tolist()
+        else:
+            xs = [start_x + (i % columns) * spacing_x for i in range(n)]
+            ys = [start_y + (i // columns) * spacing_y for i in range(n)]
 
-        for i, ref in enumerate(references):
-            footprint = self.board.footprints.get_by_reference(ref)
+        count = 0
+        warn = logger.warning
+        for i, (ref, footprint) in enumerate(
+            zip(references, self._resolve(references))
+        ):
             if footprint is None:
-                logger.warning(f"Footprint {ref} not found, skipping")
+                warn(f"Footprint {ref} not found, skipping")
                 continue
 
-            row = i // columns
-            col = i % columns
-
-            x = start_x + (col * spacing_x)
-            y = start_y + (row * spacing_y)
-
-            footprint.position = Point(x, y)
+            footprint.position = Point(xs[i], ys[i])
             count += 1
 
         logger.info(f"Placed {count} components in grid pattern")
@@ -83,19 +195,28 @@ class PlacementManager(BaseManager):
 
         angle_step = (2 * math.pi) / count
 
-        for i, ref in enumerate(references):
-            footprint = self.board.footprints.get_by_reference(ref)
+        if np is not None and count >= VECTORIZE_THRESHOLD:
+            angles = np.arange(count) * angle_step
+            xs = (center_x + radius * np.cos(angles)).tolist()
+            ys = (center_y + radius * np.sin(angles)).tolist()
+            rotations = np.degrees(angles + math.pi / 2).tolist()
+        else:
+            angles = [i * angle_step for i in range(count)]
+            xs = [center_x + radius * math.cos(a) for a in angles]
+            ys = [center_y + radius * math.sin(a) for a in angles]
+            rotations = [math.degrees(a + math.pi / 2) for a in angles]
+
+        warn = logger.warning
+        for i, (ref, footprint) in enumerate(
+            zip(references, self._resolve(references))
+        ):
             if footprint is None:
-                logger.warning(f"Footprint {ref} not found, skipping")
+                warn(f"Footprint {ref} not found, skipping")
                 continue
 
-            angle = i * angle_step
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-
-            footprint.position = Point(x, y)
+            footprint.position = Point(xs[i], ys[i])
             # Optionally rotate to face center
-            footprint.rotation = math.degrees(angle + math.pi / 2)
+            footprint.rotation = rotations[i]
 
         logger.info(f"Placed {count} components in circular pattern")
         return count
@@ -113,16 +234,17 @@ class PlacementManager(BaseManager):
         if not references:
             return 0
 
+        footprints = self._resolve(references)
+
         # Get target Y coordinate
         if y is None:
-            first = self.board.footprints.get_by_reference(references[0])
+            first = footprints[0]
             if first is None:
                 return 0
             y = first.position.y
 
         count = 0
-        for ref in references:
-            footprint = self.board.footprints.get_by_reference(ref)
+        for footprint in footprints:
             if footprint is None:
                 continue
 
@@ -145,16 +267,17 @@ class PlacementManager(BaseManager):
         if not references:
             return 0
 
+        footprints = self._resolve(references)
+
         # Get target X coordinate
         if x is None:
-            first = self.board.footprints.get_by_reference(references[0])
+            first = footprints[0]
             if first is None:
                 return 0
             x = first.position.x
 
         count = 0
-        for ref in references:
-            footprint = self.board.footprints.get_by_reference(ref)
+        for footprint in footprints:
             if footprint is None:
                 continue
 
@@ -181,16 +304,18 @@ class PlacementManager(BaseManager):
         if count < 2:
             return 0
 
-        spacing = (end_x - start_x) / (count - 1)
+        if np is not None and count >= VECTORIZE_THRESHOLD:
+            xs = np.linspace(start_x, end_x, count).tolist()
+        else:
+            spacing = (end_x - start_x) / (count - 1)
+            xs = [start_x + i * spacing for i in range(count)]
 
         placed = 0
-        for i, ref in enumerate(references):
-            footprint = self.board.footprints.get_by_reference(ref)
+        for i, footprint in enumerate(self._resolve(references)):
             if footprint is None:
                 continue
 
-            x = start_x + (i * spacing)
-            footprint.position = Point(x, footprint.position.y)
+            footprint.position = Point(xs[i], footprint.position.y)
             placed += 1
 
         logger.info(f"Distributed {placed} components horizontally")
@@ -211,16 +336,18 @@ class PlacementManager(BaseManager):
         if count < 2:
             return 0
 
-        spacing = (end_y - start_y) / (count - 1)
+        if np is not None and count >= VECTORIZE_THRESHOLD:
+            ys = np.linspace(start_y, end_y, count).tolist()
+        else:
+            spacing = (end_y - start_y) / (count - 1)
+            ys = [start_y + i * spacing for i in range(count)]
 
         placed = 0
-        for i, ref in enumerate(references):
-            footprint = self.board.footprints.get_by_reference(ref)
+        for i, footprint in enumerate(self._resolve(references)):
             if footprint is None:
                 continue
 
-            y = start_y + (i * spacing)
-            footprint.position = Point(footprint.position.x, y)
+            footprint.position = Point(footprint.position.x, ys[i])
             placed += 1
 
         logger.info(f"Distributed {placed} components vertically")
@@ -254,19 +381,19 @@ class PlacementManager(BaseManager):
         if references is None:
             # Place all unlocked components
             components_to_place = [
-                fp for fp in self.board.footprints.values() if not fp.locked
+                wrapper.data for wrapper in self.board.footprints.get_unlocked()
             ]
         else:
             components_to_place = []
-            for ref in references:
-                fp = self.board.footprints.get_by_reference(ref)
+            warn = logger.warning
+            for ref, fp in zip(references, self._resolve(references)):
                 if fp is None:
-                    logger.warning(f"Component {ref} not found, skipping")
+                    warn(f"Component {ref} not found, skipping")
                     continue
                 if fp.locked:
-                    logger.warning(f"Component {ref} is locked, skipping")
+                    warn(f"Component {ref} is locked, skipping")
                     continue
-                components_to_place.append(fp)
+                components_to_place.append(fp.data)
 
         if not components_to_place:
             logger.warning("No unlocked components to place")
@@ -299,9 +426,11 @@ class PlacementManager(BaseManager):
             board_height=board_height,
         )
 
-        # Validate placements if requested
+        # Validate placements if requested, reusing the footprints resolved above
         if check_collisions:
-            collision_count = self.check_collisions(list(positions.keys()))
+            by_ref = {fp.reference: fp for fp in components_to_place}
+            placed = [by_ref[ref] for ref in positions if ref in by_ref]
+            collision_count = self._count_collisions(placed, spacing=0.0)
             if collision_count > 0:
                 logger.warning(
                     f"Found {collision_count} collisions after auto-placement"
@@ -311,42 +440,66 @@ class PlacementManager(BaseManager):
         return len(positions)
 
     def check_collisions(
-        self, references: Optional[List[str]] = None, spacing: float = 0.0
+        self,
+        references: Optional[List[str]] = None,
+        spacing: float = 0.0,
+        max_collisions: Optional[int] = None,
     ) -> int:
         """Check for collisions between components using courtyard geometry.
 
         Args:
             references: List of component references to check (None = all)
             spacing: Additional spacing to add between courtyards in mm
+            max_collisions: Stop once this many collisions are found
+                (None = count them all)
 
         Returns:
             Number of collisions detected
         """
         # Get components to check
         if references is None:
-            components = list(self.board.footprints.values())
+            components = list(self.board.footprints)
         else:
-            components = []
-            for ref in references:
-                fp = self.board.footprints.get_by_reference(ref)
-                if fp is not None:
-                    components.append(fp)
+            components = [
+                fp.data for fp in self._resolve(references) if fp is not None
+            ]
+
+        return self._count_collisions(components, spacing, max_collisions)
+
+    def _count_collisions(
+        self, components: Sequence, spacing: float, max_collisions: Optional[int] = None
+    ) -> int:
+        """Count and log courtyard collisions among already-resolved footprints.
+
+        Args:
+            components: Footprints to check
+            spacing: Additional spacing to add between courtyards in mm
+            max_collisions: Stop once this many collisions are found
 
-        if len(components) < 2:
+        Returns:
+            Number of collisions detected
+        """
+        if len(components) < 2 or (max_collisions is not None and max_collisions <= 0):
             return 0
 
         # Create collision detector
         detector = CourtyardCollisionDetector(spacing=spacing)
+        geometry = _FootprintGeometry.from_footprints(components)
+        refs = geometry.references
 
-        # Check all pairs
+        # Only pairs whose courtyard boxes overlap can collide
         collision_count = 0
-        for i, fp1 in enumerate(components):
-            for fp2 in components[i + 1 :]:
-                if detector.check_collision(fp1, fp2):
+        courtyards = geometry.courtyards(detector)
+        warn_enabled = logger.isEnabledFor(logging.WARNING)
+        for i, j in self._collision_candidates(geometry, detector):
+            if detector.check_polygon_collision(courtyards[i], courtyards[j]):
+                if warn_enabled:
                     logger.warning(
-                        f"Collision detected between {fp1.reference} and {fp2.reference}"
+                        "Collision detected between %s and %s", refs[i], refs[j]
                     )
-                    collision_count += 1
+                collision_count += 1
+                if max_collisions is not None and collision_count >= max_collisions:
+                    break
 
         if collision_count == 0:
             logger.info("No collisions detected")
@@ -355,6 +508,57 @@ class PlacementManager(BaseManager):
 
         return collision_count
 
+    def _collision_candidates(
+        self, geometry: _FootprintGeometry, detector: CourtyardCollisionDetector
+    ) -> List[Tuple[int, int]]:
+        """Find component index pairs that need a courtyard collision test.
+
+        Each courtyard bounding box is computed once, inflated by half the
+        detector spacing as check_collision does, and only pairs whose boxes
+        overlap are returned. For boards of at least VECTORIZE_THRESHOLD parts
+        with Numba available a compiled sweep compares the boxes; otherwise a
+        spatial index with cells about one courtyard wide keeps the broad
+        phase near-linear for evenly spread parts.
+
+        Args:
+            geometry: Snapshot of the footprints to test
+            detector: Detector whose spacing applies
+
+        Returns:
+            (i, j) index pairs into the snapshot with i < j, sorted
+        """
+        n = len(geometry)
+        half_spacing = detector.spacing / 2
+        boxes = []
+        for polygon in geometry.courtyards(detector):
+            min_x, min_y, max_x, max_y = polygon.get_bounding_box()
+            boxes.append(
+                (
+                    min_x - half_spacing,
+                    min_y - half_spacing,
+                    max_x + half_spacing,
+                    max_y + half_spacing,
+                )
+            )
+
+        if NUMBA_AVAILABLE and np is not None and n >= VECTORIZE_THRESHOLD:
+            from ..placement.kernels import aabb_pair_filter
+
+            arr = np.array(boxes, dtype=np.float64).reshape(n, 4)
+            pairs = aabb_pair_filter(
+                np.ascontiguousarray(arr[:, 0]),
+                np.ascontiguousarray(arr[:, 1]),
+                np.ascontiguousarray(arr[:, 2]),
+                np.ascontiguousarray(arr[:, 3]),
+            )
+            return [(i, j) for i, j in pairs.tolist()]
+
+        cell_size = max(max(b[2] - b[0], b[3] - b[1]) for b in boxes) or 1.0
+        index = SpatialIndex(cell_size=cell_size)
+        for i, box in enumerate(boxes):
+            index.insert(i, GeometryBox(*box))
+        return sorted(index.candidate_pairs())
+
     def snap_to_grid(
         self, references: List[str], grid_size: float = 1.0, origin: Point = Point(0, 0)
     ) -> int:
@@ -368,27 +572,41 @@ class PlacementManager(BaseManager):
         Returns:
             Number of components snapped
         """
-        count = 0
-
-        for ref in references:
-            footprint = self.board.footprints.get_by_reference(ref)
+        movable = []
+        warn = logger.warning
+        for ref, footprint in zip(references, self._resolve(references)):
             if footprint is None:
-                logger.warning(f"Footprint {ref} not found, skipping")
+                warn(f"Footprint {ref} not found, skipping")
                 continue
 
             if footprint.locked:
-                logger.warning(f"Footprint {ref} is locked, skipping")
+                warn(f"Footprint {ref} is locked, skipping")
                 continue
 
-            # Calculate snapped position
-            dx = footprint.position.x - origin.x
-            dy = footprint.position.y - origin.y
+            movable.append(footprint)
+
+        count = len(movable)
+        ox = origin.x
+        oy = origin.y
+        if np is not None and count >= VECTORIZE_THRESHOLD:
+            # np.rint rounds half to even, like the builtin round()
+            positions = np.fromiter(
+                (v for fp in movable for v in (fp.position.x, fp.position.y)),
+                dtype=np.float64,
+                count=2 * count,
+            ).reshape(count, 2)
+            offset = np.array([ox, oy])
+            snapped = np.rint((positions - offset) / grid_size) * grid_size + offset
+            for footprint, (snapped_x, snapped_y) in zip(movable, snapped.tolist()):
+                footprint.position = Point(snapped_x, snapped_y)
+        else:
+            for footprint in movable:
+                # Calculate snapped position
+                position = footprint.position
+                snapped_x = ox + round((position.x - ox) / grid_size) * grid_size
+                snapped_y = oy + round((position.y - oy) / grid_size) * grid_size
 
-            snapped_x = origin.x + round(dx / grid_size) * grid_size
-            snapped_y = origin.y + round(dy / grid_size) * grid_size
-
-            footprint.position = Point(snapped_x, snapped_y)
-            count += 1
+                footprint.position = Point(snapped_x, snapped_y)
 
         logger.info(f"Snapped {count} components to {grid_size}mm grid")
         return count
@@ -413,13 +631,11 @@ class PlacementManager(BaseManager):
         """
         # Get components to validate
         if references is None:
-            components = list(self.board.footprints.values())
+            components = list(self.board.footprints)
         else:
-            components = []
-            for ref in references:
-                fp = self.board.footprints.get_by_reference(ref)
-                if fp is not None:
-                    components.append(fp)
+            components = [
+                fp.data for fp in self._resolve(references) if fp is not None
+            ]
 
         # Auto-detect board outline if not provided
         if board_outline is None:
@@ -432,41 +648,107 @@ class PlacementManager(BaseManager):
 
         errors: Dict[str, List[str]] = {}
 
-        # Check each component
-        for fp in components:
-            component_errors = []
-
-            # Check if within board bounds
-            if (
-                fp.position.x < board_outline.min_x + min_edge_clearance
-                or fp.position.x > board_outline.max_x - min_edge_clearance
-                or fp.position.y < board_outline.min_y + min_edge_clearance
-                or fp.position.y > board_outline.max_y - min_edge_clearance
-            ):
-                component_errors.append(
-                    f"Component too close to board edge (min clearance: {min_edge_clearance}mm)"
-                )
+        # Read each footprint's attributes once; wrapper properties are not free
+        geometry = _FootprintGeometry.from_footprints(components)
+        refs = geometry.references
+        lo_x = board_outline.min_x + min_edge_clearance
+        hi_x = board_outline.max_x - min_edge_clearance
+        lo_y = board_outline.min_y + min_edge_clearance
+        hi_y = board_outline.max_y - min_edge_clearance
 
-            # Check rotation is valid
-            if fp.rotation < 0 or fp.rotation >= 360:
-                component_errors.append(
-                    f"Invalid rotation: {fp.rotation} (should be 0-360)"
-                )
+        edge_error = (
+            f"Component too close to board edge (min clearance: {min_edge_clearance}mm)"
+        )
 
-            if component_errors:
-                errors[fp.reference] = component_errors
+        def rotation_error(i: int) -> str:
+            return f"Invalid rotation: {components[i].rotation} (should be 0-360)"
+
+        check_pairs = check_collisions and len(components) > 1
+
+        if (
+            NUMBA_AVAILABLE
+            and np is not None
+            and len(components) >= VECTORIZE_THRESHOLD
+        ):
+            # One compiled pass covers the per-component and pairwise checks
+            from ..placement.kernels import (
+                EDGE_VIOLATION,
+                ROTATION_VIOLATION,
+                validate_placement_kernel,
+            )
 
-        # Check collisions
-        if check_collisions:
-            detector = CourtyardCollisionDetector(spacing=0.0)
-            for i, fp1 in enumerate(components):
-                for fp2 in components[i + 1 :]:
-                    if detector.check_collision(fp1, fp2):
-                        if fp1.reference not in errors:
-                            errors[fp1.reference] = []
-                        errors[fp1.reference].append(
-                            f"Collision with {fp2.reference}"
-                        )
+            if check_pairs:
+                detector = CourtyardCollisionDetector(spacing=0.0)
+                vertices, offsets = _stack_polygons(geometry.courtyards(detector))
+            else:
+                vertices, offsets = _stack_polygons([])
+
+            flags, collisions = validate_placement_kernel(
+                geometry.xs,
+                geometry.ys,
+                geometry.rotations,
+                float(lo_x),
+                float(hi_x),
+                float(lo_y),
+                float(hi_y),
+                vertices,
+                offsets,
+            )
+            flag_list = flags.tolist()
+            for i in np.flatnonzero(flags).tolist():
+                component_errors = []
+                if flag_list[i] & EDGE_VIOLATION:
+                    component_errors.append(edge_error)
+                if flag_list[i] & ROTATION_VIOLATION:
+                    component_errors.append(rotation_error(i))
+                errors[refs[i]] = component_errors
+            for i, j in collisions.tolist():
+                if refs[i] not in errors:
+                    errors[refs[i]] = []
+                errors[refs[i]].append(f"Collision with {refs[j]}")
+        else:
+            if np is not None:
+                # Four comparisons over the whole array; only violators reach Python
+                xs, ys, rotations = geometry.xs, geometry.ys, geometry.rotations
+                edge_bad = (xs < lo_x) | (xs > hi_x) | (ys < lo_y) | (ys > hi_y)
+                rot_bad = (rotations < 0) | (rotations >= 360)
+                edge_flags = edge_bad.tolist()
+                rot_flags = rot_bad.tolist()
+                for i in np.flatnonzero(edge_bad | rot_bad).tolist():
+                    component_errors = []
+                    if edge_flags[i]:
+                        component_errors.append(edge_error)
+                    if rot_flags[i]:
+                        component_errors.append(rotation_error(i))
+                    errors[refs[i]] = component_errors
+            else:
+                # Check each component
+                for i, ref in enumerate(refs):
+                    component_errors = []
+                    x = geometry.xs[i]
+                    y = geometry.ys[i]
+                    rotation = geometry.rotations[i]
+
+                    # Check if within board bounds
+                    if x < lo_x or x > hi_x or y < lo_y or y > hi_y:
+                        component_errors.append(edge_error)
+
+                    # Check rotation is valid
+                    if rotation < 0 or rotation >= 360:
+                        component_errors.append(rotation_error(i))
+
+                    if component_errors:
+                        errors[ref] = component_errors
+
+            # Check collisions
+            if check_pairs:
+                detector = CourtyardCollisionDetector(spacing=0.0)
+                courtyards = geometry.courtyards(detector)
+                for i, j in self._collision_candidates(geometry, detector):
+                    if detector.check_polygon_collision(courtyards[i], courtyards[j]):
+                        if refs[i] not in errors:
+                            errors[refs[i]] = []
+                        errors[refs[i]].append(f"Collision with {refs[j]}")
 
         if errors:
             logger.error(
@@ -497,15 +779,15 @@ class PlacementManager(BaseManager):
         Returns:
             Valid position if found, None otherwise
         """
-        footprint = self.board.footprints.get_by_reference(reference)
-        if footprint is None:
+        footprints = self.board.footprints
+        wrapper = footprints.get_by_reference(reference)
+        if wrapper is None:
             logger.error(f"Footprint {reference} not found")
             return None
+        footprint = wrapper.data
 
         # Get all other footprints
-        other_footprints = [
-            fp for fp in self.board.footprints.values() if fp.reference != reference
-        ]
+        other_footprints = [fp for fp in footprints if fp.reference != reference]
 
         # Create collision detector
         detector = CourtyardCollisionDetector(spacing=0.5)
@@ -523,16 +805,31 @@ class PlacementManager(BaseManager):
             ]
             board_polygon = Polygon(vertices)
 
-        # Use courtyard collision detector's spiral search
-        result = detector.find_valid_position(
-            footprint,
-            ideal_position.x,
-            ideal_position.y,
-            other_footprints,
-            board_outline=board_polygon,
-            search_radius=search_radius,
-            search_step=search_step,
-        )
+        if (
+            NUMBA_AVAILABLE
+            and np is not None
+            and len(other_footprints) >= VECTORIZE_THRESHOLD
+        ):
+            result = self._spiral_search_compiled(
+                detector,
+                footprint,
+                ideal_position,
+                other_footprints,
+                board_polygon,
+                search_radius,
+                search_step,
+            )
+        else:
+            # Use courtyard collision detector's spiral search
+            result = detector.find_valid_position(
+                footprint,
+                ideal_position.x,
+                ideal_position.y,
+                other_footprints,
+                board_outline=board_polygon,
+                search_radius=search_radius,
+                search_step=search_step,
+            )
 
         if result:
             return Point(result[0], result[1])
@@ -541,3 +838,72 @@ class PlacementManager(BaseManager):
                 f"Could not find valid position for {reference} near ({ideal_position.x}, {ideal_position.y})"
             )
             return None
+
+    def _spiral_search_compiled(
+        self,
+        detector: CourtyardCollisionDetector,
+        footprint,
+        ideal_position: Point,
+        other_footprints: Sequence,
+        board_polygon,
+        search_radius: float,
+        search_step: float,
+    ) -> Optional[Tuple[float, float]]:
+        """Run the detector's spiral search as a Numba kernel.
+
+        All courtyards are converted to arrays once up front; the kernel then
+        tests every candidate position in compiled code. The footprint itself
+        is never moved.
+
+        Args:
+            detector: Detector whose spacing applies
+            footprint: Footprint being placed
+            ideal_position: Ideal position to place near
+            other_footprints: Footprints already on the board
+            board_polygon: Optional board outline Polygon
+            search_radius: Maximum search radius in mm
+            search_step: Step size for spiral search in mm
+
+        Returns:
+            (x, y) tuple if valid position found, None otherwise
+        """
+        from ..placement.kernels import spiral_search
+
+        # Rotated but untranslated courtyard; the kernel adds each candidate offset
+        local = detector.get_courtyard_polygon(footprint).transform(
+            0, 0, footprint.rotation
+        )
+
+        # Placed courtyards go into one contiguous buffer, built once per call
+        half_spacing = detector.spacing / 2
+        inflated = []
+        boxes = []
+        for other in other_footprints:
+            polygon = detector.get_footprint_polygon(other)
+            min_x, min_y, max_x, max_y = polygon.get_bounding_box()
+            boxes.append(
+                (
+                    min_x - half_spacing,
+                    min_y - half_spacing,
+                    max_x + half_spacing,
+                    max_y + half_spacing,
+                )
+            )
+            inflated.append(detector._inflate_polygon(polygon, half_spacing))
+        vertices, offsets = _stack_polygons(inflated)
+
+        board_vertices = board_polygon.vertices if board_polygon is not None else []
+
+        found, x, y = spiral_search(
+            float(ideal_position.x),
+            float(ideal_position.y),
+            float(search_radius),
+            float(search_step),
+            np.array(local.vertices, dtype=np.float64).reshape(-1, 2),
+            float(detector.spacing),
+            vertices,
+            offsets,
+            np.array(boxes, dtype=np.float64).reshape(-1, 4),
+            np.array(board_vertices, dtype=np.float64).reshape(-1, 2),
+        )
+        return (x, y) if found else None
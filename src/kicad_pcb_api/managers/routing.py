@@ -1,17 +1,45 @@
 """Routing and trace management."""
 
+import importlib.util
 import logging
+import math
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from ..collections.tracks import TrackArrays, TrackCollection
+from ..core.geometry import BoundingBox
+from ..core.spatial_index import SpatialIndex
 from ..core.types import Point, Track, Via
+from ..core.validation import COPPER_LAYERS
 from ..routing.dsn_exporter import DSNExporter
 from ..routing.freerouting_runner import FreeroutingConfig, FreeroutingRunner
 from ..routing.ses_importer import SESImporter
+from ..utils.ids import new_uuid, new_uuids
+from ..utils.jit import NUMBA_AVAILABLE
 from .base import BaseManager
 
+if TYPE_CHECKING:
+    from ..core.pcb_board import PCBBoard
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# scipy's KD-tree serves the clearance check when Numba is not installed;
+# scipy is imported only when it is used
+SCIPY_AVAILABLE = importlib.util.find_spec("scipy") is not None
+
+# Boards with at least this many tracks get a spatial-index broad phase in the
+# clearance check; below it building the index costs more than it saves
+SPATIAL_INDEX_THRESHOLD = 32
+
+# Candidate track pairs at least this many get their endpoints checked with NumPy
+VECTORIZE_THRESHOLD = 64
+
 
 class RoutingManager(BaseManager):
     """Manager for routing operations.
@@ -19,6 +47,54 @@ class RoutingManager(BaseManager):
     Handles trace routing, length matching, and routing optimization.
     """
 
+    def __init__(self, board: "PCBBoard"):
+        """Initialize the manager with an empty per-net statistics cache.
+
+        Args:
+            board: The PCBBoard instance this manager operates on
+        """
+        super().__init__(board)
+        # Per-net track results keyed by (query, net), valid for the track
+        # collection state in _stats_state; DRC tooling may query nets from
+        # several threads
+        self._stats_cache: Dict[Tuple[str, int], object] = {}
+        self._stats_state: Optional[Tuple[int, int]] = None
+        self._stats_lock = threading.Lock()
+
+    def _track_state(self) -> Optional[Tuple[int, int]]:
+        """Get the track collection state that per-net results are cached against.
+
+        Returns:
+            (collection id, collection version), or None when board.tracks
+            reports no version (in which case results are not cached)
+        """
+        tracks = self.board.tracks
+        version = getattr(tracks, "version", None)
+        if not isinstance(version, int):
+            return None
+        return (id(tracks), version)
+
+    def _cached_stats(self, state: Optional[Tuple[int, int]], key: Tuple[str, int]):
+        """Look up a cached per-net result, or None on a miss."""
+        if state is None:
+            return None
+        with self._stats_lock:
+            if self._stats_state != state:
+                return None
+            return self._stats_cache.get(key)
+
+    def _store_stats(
+        self, state: Optional[Tuple[int, int]], key: Tuple[str, int], value
+    ) -> None:
+        """Cache a per-net result, dropping entries from older track states."""
+        if state is None:
+            return
+        with self._stats_lock:
+            if self._stats_state != state:
+                self._stats_cache = {}
+                self._stats_state = state
+            self._stats_cache[key] = value
+
     def add_track(
         self,
         start: Point,
@@ -41,8 +117,6 @@ class RoutingManager(BaseManager):
         Returns:
             UUID of created track
         """
-        import uuid
-
         track = Track(
             start=start,
             end=end,
@@ -50,7 +124,7 @@ class RoutingManager(BaseManager):
             layer=layer,
             net=net,
             net_name=net_name,
-            uuid=str(uuid.uuid4()),
+            uuid=new_uuid(),
         )
 
         self.board.tracks.add(track)
@@ -82,9 +156,8 @@ class RoutingManager(BaseManager):
         Returns:
             List of track UUIDs created
         """
-        import uuid
-
         uuids = []
+        first_uuid, second_uuid = new_uuids(2)
 
         # Route horizontally first, then vertically
         mid_point = Point(end.x, start.y)
@@ -98,7 +171,7 @@ class RoutingManager(BaseManager):
                 layer=layer,
                 net=net,
                 net_name=net_name,
-                uuid=str(uuid.uuid4()),
+                uuid=first_uuid,
             )
             self.board.tracks.add(track1)
             uuids.append(track1.uuid)
@@ -112,7 +185,7 @@ class RoutingManager(BaseManager):
                 layer=layer,
                 net=net,
                 net_name=net_name,
-                uuid=str(uuid.uuid4()),
+                uuid=second_uuid,
             )
             self.board.tracks.add(track2)
             uuids.append(track2.uuid)
@@ -129,8 +202,13 @@ class RoutingManager(BaseManager):
         Returns:
             Total length in mm
         """
-        tracks = [t for t in self.board.tracks if t.net == net]
-        return sum(t.length for t in tracks)
+        state = self._track_state()
+        key = ("length", net)
+        length = self._cached_stats(state, key)
+        if length is None:
+            length = self.board.tracks.get_total_length_by_net(net)
+            self._store_stats(state, key, length)
+        return length
 
     def get_length_statistics_by_net(self) -> Dict[int, Dict[str, float]]:
         """Get track length statistics grouped by net.
@@ -141,6 +219,9 @@ class RoutingManager(BaseManager):
             - track_count: Number of track segments
             - average_length: Average segment length
         """
+        if np is not None:
+            return self._length_statistics_vectorized()
+
         stats = {}
 
         # Group tracks by net
@@ -153,7 +234,7 @@ class RoutingManager(BaseManager):
 
         # Calculate statistics for each net
         for net, tracks in nets.items():
-            lengths = [t.length for t in tracks]
+            lengths = [t.get_length() for t in tracks]
             stats[net] = {
                 "total_length": sum(lengths),
                 "track_count": len(tracks),
@@ -164,6 +245,48 @@ class RoutingManager(BaseManager):
 
         return stats
 
+    def _length_statistics_vectorized(self) -> Dict[int, Dict[str, float]]:
+        """NumPy version of get_length_statistics_by_net.
+
+        Tracks are stably sorted by net (skipped when the nets are already in
+        order), so each net is one contiguous run; totals and extremes then
+        come from np.add/minimum/maximum.reduceat over the run starts. Nets
+        keep the order in which they first appear.
+        """
+        arrays = self.board.tracks.arrays()
+        has_net = arrays.net >= 0
+        nets = arrays.net[has_net]
+        lengths = arrays.length[has_net]
+        if nets.size == 0:
+            return {}
+
+        if np.any(nets[1:] < nets[:-1]):
+            order = np.argsort(nets, kind="stable")
+            nets = nets[order]
+            lengths = lengths[order]
+        else:
+            order = np.arange(nets.size)
+
+        starts = np.concatenate(([0], np.flatnonzero(nets[1:] != nets[:-1]) + 1))
+        totals = np.add.reduceat(lengths, starts)
+        counts = np.diff(np.append(starts, nets.size))
+        mins = np.minimum.reduceat(lengths, starts)
+        maxs = np.maximum.reduceat(lengths, starts)
+
+        # The stable sort keeps each run's first entry at the net's first appearance
+        stats = {}
+        for k in np.argsort(order[starts], kind="stable").tolist():
+            total = float(totals[k])
+            count = int(counts[k])
+            stats[int(nets[starts[k]])] = {
+                "total_length": total,
+                "track_count": count,
+                "average_length": total / count,
+                "min_length": float(mins[k]),
+                "max_length": float(maxs[k]),
+            }
+        return stats
+
     def find_stubs(self, min_stub_length: float = 0.1) -> List[str]:
         """Find track stubs (dead-end tracks).
 
@@ -175,28 +298,31 @@ class RoutingManager(BaseManager):
         """
         # This is a simplified implementation
         # A proper implementation would analyze connectivity
-        stubs = []
-
-        for track in self.board.tracks:
-            if track.length < min_stub_length:
-                stubs.append(track.uuid)
-
-        return stubs
+        return self.board.tracks.find_shorter_than(min_stub_length)
 
     def optimize_track_order(self) -> None:
         """Optimize track storage order for rendering performance.
 
         Groups tracks by layer and net for better rendering performance.
         """
-        # Sort tracks by layer, then net
-        def sort_key(track):
-            return (track.data.layer, track.data.net or 0)
-
-        sorted_tracks = sorted(self.board.tracks, key=sort_key)
+        # Sort tracks by layer, then net (tracks without a net sort as net 0)
+        tracks = self.board.tracks
+        if np is not None:
+            arrays = tracks.arrays()
+            # Layer codes follow first appearance; rank them by name instead
+            by_name = sorted(
+                range(len(arrays.layer_names)), key=arrays.layer_names.__getitem__
+            )
+            rank = np.empty(len(by_name), dtype=np.int64)
+            rank[by_name] = np.arange(len(by_name))
+            order = np.lexsort((np.maximum(arrays.net, 0), rank[arrays.layer]))
+        else:
+            items = list(tracks)
+            order = sorted(
+                range(len(items)), key=lambda i: (items[i].layer, items[i].net or 0)
+            )
 
-        # Replace collection items with sorted list
-        self.board.tracks._items = [t.data for t in sorted_tracks]
-        self.board.tracks._dirty_indexes = True
+        tracks.reorder(order)
 
         logger.info("Optimized track storage order")
 
@@ -263,12 +389,19 @@ class RoutingManager(BaseManager):
             logger.warning("Need at least 2 points to route")
             return []
 
-        uuids = []
-        for i in range(len(points) - 1):
-            start = points[i]
-            end = points[i + 1]
-            uuid = self.add_track(start, end, width, layer, net, net_name)
-            uuids.append(uuid)
+        uuids = new_uuids(len(points) - 1)
+        self.board.tracks.extend(
+            Track(
+                start=start,
+                end=end,
+                width=width,
+                layer=layer,
+                net=net,
+                net_name=net_name,
+                uuid=track_uuid,
+            )
+            for start, end, track_uuid in zip(points, points[1:], uuids)
+        )
 
         logger.info(f"Created multi-point route with {len(uuids)} segments")
         return uuids
@@ -295,8 +428,6 @@ class RoutingManager(BaseManager):
         Returns:
             UUID of created via
         """
-        import uuid as uuid_module
-
         if layers is None:
             layers = ["F.Cu", "B.Cu"]  # Default to through-hole via
 
@@ -306,7 +437,7 @@ class RoutingManager(BaseManager):
             drill=drill,
             layers=layers,
             net=net,
-            uuid=str(uuid_module.uuid4()),
+            uuid=new_uuid(),
         )
 
         self.board.vias.add(via)
@@ -350,17 +481,8 @@ class RoutingManager(BaseManager):
             raise ValueError(f"Footprint {ref2} not found")
 
         # Find pads
-        pad1_obj = None
-        for pad in fp1.pads:
-            if str(pad.number) == str(pad1):
-                pad1_obj = pad
-                break
-
-        pad2_obj = None
-        for pad in fp2.pads:
-            if str(pad.number) == str(pad2):
-                pad2_obj = pad
-                break
+        pad1_obj = fp1.get_pad(pad1)
+        pad2_obj = fp2.get_pad(pad2)
 
         if pad1_obj is None:
             raise ValueError(f"Pad {pad1} not found on {ref1}")
@@ -430,6 +552,17 @@ class RoutingManager(BaseManager):
         """
         import tempfile
 
+        # Create Freerouting config
+        config = FreeroutingConfig(
+            effort=effort,
+            optimization_passes=optimization_passes,
+            timeout_seconds=timeout_seconds,
+        )
+        runner = FreeroutingRunner(config)
+
+        # Probe the Java runtime (a JVM start-up) while the DSN file is written
+        runner.start_java_check()
+
         # Generate DSN file if not provided
         if dsn_file is None:
             temp_dir = tempfile.mkdtemp()
@@ -443,16 +576,8 @@ class RoutingManager(BaseManager):
         if ses_file is None:
             ses_file = str(Path(dsn_file).with_suffix(".ses"))
 
-        # Create Freerouting config
-        config = FreeroutingConfig(
-            effort=effort,
-            optimization_passes=optimization_passes,
-            timeout_seconds=timeout_seconds,
-        )
-
         # Run Freerouting
         logger.info("Starting Freerouting auto-router...")
-        runner = FreeroutingRunner(config)
         success, result = runner.route(dsn_file, ses_file)
 
         if not success:
@@ -462,13 +587,20 @@ class RoutingManager(BaseManager):
         # Import SES file back into board
         logger.info(f"Importing routing from {ses_file}")
         try:
-            # Clear existing routing
+            # Net names come from the board in memory, which may be unsaved
+            importer = SESImporter(str(self.board.filepath or ""), ses_file)
+            importer.parse(board_data=self._pcb_data)
+            tracks = list(importer.iter_tracks())
+            vias = list(importer.iter_vias())
+
+            # Replace existing routing in the board data (what save() writes)
+            # and in the collections, adding each kind in one batch
+            self._pcb_data["tracks"] = tracks
+            self._pcb_data["vias"] = vias
             self.board.tracks.clear()
             self.board.vias.clear()
-
-            # Import new routing
-            importer = SESImporter(str(self.board.file_path), ses_file)
-            importer.import_routing()
+            self.board.tracks.extend(tracks)
+            self.board.vias.extend(vias)
 
             logger.info("Freerouting completed successfully")
 
@@ -511,46 +643,60 @@ class RoutingManager(BaseManager):
 
         # Check track clearances
         if check_clearances:
-            tracks = list(self.board.tracks)
-            for i, track1 in enumerate(tracks):
-                for track2 in tracks[i + 1 :]:
-                    # Skip if same net
-                    if track1.net == track2.net:
-                        continue
-
-                    # Check if tracks are on same layer
-                    if track1.layer != track2.layer:
-                        continue
-
-                    # Simple clearance check (could be more sophisticated)
-                    # Check if track endpoints are too close
-                    points1 = [track1.start, track1.end]
-                    points2 = [track2.start, track2.end]
-
-                    for p1 in points1:
-                        for p2 in points2:
-                            distance = (
-                                (p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2
-                            ) ** 0.5
-                            if distance < min_clearance:
-                                errors["clearance_violations"].append(
-                                    f"Clearance violation between nets {track1.net} and {track2.net}: {distance:.3f}mm < {min_clearance}mm"
-                                )
+            if (
+                np is not None
+                and (NUMBA_AVAILABLE or SCIPY_AVAILABLE)
+                and len(self.board.tracks) >= SPATIAL_INDEX_THRESHOLD
+            ):
+                # Array paths read the collection's cached arrays directly
+                arrays = self.board.tracks.arrays()
+                if NUMBA_AVAILABLE:
+                    violations = self._endpoint_violations_compiled(
+                        arrays, min_clearance
+                    )
+                else:
+                    violations = self._endpoint_violations_kdtree(arrays, min_clearance)
+                nets = [None if net < 0 else net for net in arrays.net.tolist()]
+            else:
+                tracks = list(self.board.tracks)
+                if len(tracks) < SPATIAL_INDEX_THRESHOLD:
+                    pairs = self._same_layer_pairs(tracks)
+                else:
+                    pairs = self._clearance_candidates(tracks, min_clearance)
+                if np is not None and len(pairs) >= VECTORIZE_THRESHOLD:
+                    violations = self._endpoint_violations_vectorized(
+                        tracks, pairs, min_clearance
+                    )
+                else:
+                    violations = self._endpoint_violations(tracks, pairs, min_clearance)
+                nets = [t.net for t in tracks]
+
+            for i, j, distance in violations:
+                errors["clearance_violations"].append(
+                    f"Clearance violation between nets {nets[i]} and {nets[j]}: "
+                    f"{distance:.3f}mm < {min_clearance}mm"
+                )
 
         # Check connectivity
         if check_connectivity:
             # Get all nets that have pads
-            nets_with_pads = set()
-            for fp in self.board.footprints.values():
-                for pad in fp.pads:
-                    if pad.net is not None and pad.net > 0:
-                        nets_with_pads.add(pad.net)
-
-            # Get all nets that have tracks
-            nets_with_tracks = set()
-            for track in self.board.tracks:
-                if track.net is not None and track.net > 0:
-                    nets_with_tracks.add(track.net)
+            nets_with_pads = {
+                pad.net
+                for fp in self.board.footprints
+                for pad in fp.pads
+                if pad.net is not None and pad.net > 0
+            }
+
+            # Get all nets that have tracks (-1 marks tracks without a net)
+            if np is not None:
+                track_nets = self.board.tracks.arrays().net
+                nets_with_tracks = set(np.unique(track_nets[track_nets > 0]).tolist())
+            else:
+                nets_with_tracks = {
+                    track.net
+                    for track in self.board.tracks
+                    if track.net is not None and track.net > 0
+                }
 
             # Find unrouted nets
             unrouted = nets_with_pads - nets_with_tracks
@@ -559,9 +705,8 @@ class RoutingManager(BaseManager):
                     errors["unrouted_nets"].append(f"Net {net} has no routing")
 
         # Check layer validity
-        valid_layers = {"F.Cu", "B.Cu", "In1.Cu", "In2.Cu", "In3.Cu", "In4.Cu"}
         for track in self.board.tracks:
-            if track.layer not in valid_layers:
+            if track.layer not in COPPER_LAYERS:
                 errors["layer_violations"].append(
                     f"Track on invalid layer: {track.layer}"
                 )
@@ -578,6 +723,262 @@ class RoutingManager(BaseManager):
 
         return errors
 
+    @staticmethod
+    def _same_layer_pairs(tracks: List[Track]) -> List[Tuple[int, int]]:
+        """List every pair of different-net tracks sharing a layer.
+
+        Args:
+            tracks: Tracks to pair up
+
+        Returns:
+            (i, j) index pairs with i < j, sorted
+        """
+        # Partition by layer so only tracks sharing a layer are ever paired
+        by_layer: Dict[str, List[int]] = {}
+        for i, track in enumerate(tracks):
+            by_layer.setdefault(track.layer, []).append(i)
+
+        pairs = []
+        for indices in by_layer.values():
+            for k, i in enumerate(indices):
+                net = tracks[i].net
+                for j in indices[k + 1:]:
+                    # Skip if same net
+                    if tracks[j].net != net:
+                        pairs.append((i, j))
+        if len(by_layer) > 1:
+            pairs.sort()
+        return pairs
+
+    @staticmethod
+    def _clearance_candidates(
+        tracks: List[Track], min_clearance: float
+    ) -> List[Tuple[int, int]]:
+        """Find different-net track pairs on one layer that may violate clearance.
+
+        Each track's bounding box is inflated by half the clearance, so two
+        endpoints closer than min_clearance always lie in overlapping boxes.
+        Only those pairs are returned, using one spatial index per layer
+        instead of testing every pair.
+
+        Args:
+            tracks: Tracks to check
+            min_clearance: Minimum endpoint distance in mm
+
+        Returns:
+            (i, j) index pairs with i < j, sorted
+        """
+        if min_clearance <= 0:
+            return []
+
+        by_layer: Dict[str, List[int]] = {}
+        for i, track in enumerate(tracks):
+            by_layer.setdefault(track.layer, []).append(i)
+
+        half = min_clearance / 2
+        pairs = []
+        for members in by_layer.values():
+            if len(members) < 2:
+                continue
+
+            boxes = []
+            for i in members:
+                start, end = tracks[i].start, tracks[i].end
+                boxes.append(
+                    BoundingBox(
+                        min(start.x, end.x) - half,
+                        min(start.y, end.y) - half,
+                        max(start.x, end.x) + half,
+                        max(start.y, end.y) + half,
+                    )
+                )
+
+            # Grid cells about one (average) track wide for the fallback backend
+            cell_size = sum(max(b.width, b.height) for b in boxes) / len(boxes)
+            index = SpatialIndex(cell_size=cell_size)
+            for i, bbox in zip(members, boxes):
+                index.insert(i, bbox)
+
+            for i, j in index.candidate_pairs():
+                if tracks[i].net != tracks[j].net:
+                    pairs.append((i, j))
+
+        pairs.sort()
+        return pairs
+
+    @staticmethod
+    def _endpoint_violations(
+        tracks: List[Track], pairs: List[Tuple[int, int]], min_clearance: float
+    ) -> List[Tuple[int, int, float]]:
+        """Check candidate track pairs for endpoints closer than min_clearance.
+
+        Args:
+            tracks: Tracks indexed by ``pairs``
+            pairs: (i, j) track index pairs to check
+            min_clearance: Minimum endpoint distance in mm
+
+        Returns:
+            (i, j, distance) per offending endpoint pair, ordered by track
+            pair and then by endpoint (start before end)
+        """
+        # Squared distances are compared, so only violations take a square root
+        limit = min_clearance * min_clearance
+        violations = []
+        for i, j in pairs:
+            track1 = tracks[i]
+            track2 = tracks[j]
+
+            # Simple clearance check (could be more sophisticated)
+            # Check if track endpoints are too close
+            points1 = [track1.start, track1.end]
+            points2 = [track2.start, track2.end]
+
+            for p1 in points1:
+                for p2 in points2:
+                    dx = p1.x - p2.x
+                    dy = p1.y - p2.y
+                    d2 = dx * dx + dy * dy
+                    if d2 < limit:
+                        violations.append((i, j, math.sqrt(d2)))
+        return violations
+
+    @staticmethod
+    def _endpoint_violations_vectorized(
+        tracks: List[Track], pairs: List[Tuple[int, int]], min_clearance: float
+    ) -> List[Tuple[int, int, float]]:
+        """NumPy version of :meth:`_endpoint_violations`.
+
+        All four endpoint distances of every pair are computed by
+        broadcasting. Squared distances are compared, so only violations
+        take a square root.
+        """
+        # (n, 2, 2): track, endpoint (start/end), coordinate (x/y)
+        points = np.array(
+            [(t.start.x, t.start.y, t.end.x, t.end.y) for t in tracks], dtype=np.float64
+        ).reshape(len(tracks), 2, 2)
+        index = np.asarray(pairs, dtype=np.int64)
+
+        diff = points[index[:, 0], :, None, :] - points[index[:, 1], None, :, :]
+        dist2 = (diff * diff).sum(axis=-1)
+
+        # argwhere is row-major, so hits come out in (pair, endpoint) order
+        hits = np.argwhere(dist2 < min_clearance * min_clearance)
+        distances = np.sqrt(dist2[hits[:, 0], hits[:, 1], hits[:, 2]])
+        return [
+            (pairs[k][0], pairs[k][1], distance)
+            for k, distance in zip(hits[:, 0].tolist(), distances.tolist())
+        ]
+
+    @staticmethod
+    def _clearance_arrays(arrays: TrackArrays) -> "np.ndarray":
+        """Stack track endpoints into an (n, 4) float64 array.
+
+        Columns are (start_x, start_y, end_x, end_y).
+        """
+        return np.column_stack(
+            (arrays.start_x, arrays.start_y, arrays.end_x, arrays.end_y)
+        )
+
+    @staticmethod
+    def _endpoint_violations_kdtree(
+        arrays: TrackArrays, min_clearance: float
+    ) -> List[Tuple[int, int, float]]:
+        """scipy version of the clearance check: a fixed-radius search over endpoints.
+
+        Each layer's endpoints go into a KD-tree and query_pairs finds every
+        endpoint pair within the clearance, without a separate track-level
+        broad phase. Returns the same violations, in the same order, as
+        :meth:`_endpoint_violations_vectorized` on the pairs from
+        :meth:`_clearance_candidates`.
+        """
+        if min_clearance <= 0:
+            return []
+
+        from scipy.spatial import cKDTree
+
+        coords = RoutingManager._clearance_arrays(arrays)
+        layers, nets = arrays.layer, arrays.net
+        limit = min_clearance * min_clearance
+
+        found = []
+        for code in np.unique(layers):
+            members = np.flatnonzero(layers == code)
+            if members.size < 2:
+                continue
+
+            # Endpoint k belongs to track members[k // 2];
+            # k % 2 is 0 for start, 1 for end
+            points = coords[members].reshape(-1, 2)
+            # The radius is padded slightly; the exact squared-distance test
+            # below makes the final call, as in the other paths
+            pairs = cKDTree(points).query_pairs(
+                r=min_clearance * (1 + 1e-9), output_type="ndarray"
+            )
+            if pairs.size == 0:
+                continue
+
+            p, q = pairs[:, 0], pairs[:, 1]
+            track_p, track_q = members[p // 2], members[q // 2]
+            diff = points[p] - points[q]
+            d2 = (diff * diff).sum(axis=1)
+            keep = (
+                (track_p != track_q) & (nets[track_p] != nets[track_q]) & (d2 < limit)
+            )
+
+            # Orient each pair so the lower track index comes first
+            swap = track_p > track_q
+            found.append(
+                (
+                    np.where(swap, track_q, track_p)[keep],
+                    np.where(swap, track_p, track_q)[keep],
+                    np.where(swap, q % 2, p % 2)[keep],
+                    np.where(swap, p % 2, q % 2)[keep],
+                    d2[keep],
+                )
+            )
+
+        if not found:
+            return []
+        ti, tj, ta, tb, d2 = (np.concatenate(column) for column in zip(*found))
+        ranked = np.lexsort((tb, ta, tj, ti))
+        return list(
+            zip(ti[ranked].tolist(), tj[ranked].tolist(), np.sqrt(d2[ranked]).tolist())
+        )
+
+    @staticmethod
+    def _endpoint_violations_compiled(
+        arrays: TrackArrays, min_clearance: float
+    ) -> List[Tuple[int, int, float]]:
+        """Numba version of the clearance check, broad and narrow phase in one kernel.
+
+        Returns the same violations, in the same order, as running
+        :meth:`_endpoint_violations_vectorized` on the pairs from
+        :meth:`_clearance_candidates`.
+        """
+        if min_clearance <= 0:
+            return []
+
+        from ..routing.kernels import clearance_sweep
+
+        coords = RoutingManager._clearance_arrays(arrays)
+        layers, nets = arrays.layer, arrays.net
+
+        half = min_clearance / 2
+        min_x = np.minimum(coords[:, 0], coords[:, 2]) - half
+        min_y = np.minimum(coords[:, 1], coords[:, 3]) - half
+        max_x = np.maximum(coords[:, 0], coords[:, 2]) + half
+        max_y = np.maximum(coords[:, 1], coords[:, 3]) + half
+        order = np.lexsort((min_x, layers))
+
+        ti, tj, ta, tb, d2 = clearance_sweep(
+            coords, min_x, min_y, max_x, max_y, layers, nets, order,
+            min_clearance * min_clearance,
+        )
+        ranked = np.lexsort((tb, ta, tj, ti))
+        return list(
+            zip(ti[ranked].tolist(), tj[ranked].tolist(), np.sqrt(d2[ranked]).tolist())
+        )
+
     def get_net_routing_stats(self, net: int) -> Dict[str, any]:
         """Get routing statistics for a specific net.
 
@@ -587,19 +988,40 @@ class RoutingManager(BaseManager):
         Returns:
             Dictionary with routing statistics
         """
-        tracks = [t for t in self.board.tracks if t.net == net]
-        vias = [v for v in self.board.vias if v.net == net]
+        # Vias are counted on every call; only the track figures are cached
+        via_count = sum(1 for v in self.board.vias if v.net == net)
+
+        state = self._track_state()
+        key = ("routing", net)
+        cached = self._cached_stats(state, key)
+        if cached is not None:
+            return dict(
+                cached, via_count=via_count, layers_used=list(cached["layers_used"])
+            )
 
-        total_length = sum(t.length for t in tracks)
-        layers_used = set(t.layer for t in tracks)
+        if np is not None and isinstance(self.board.tracks, TrackCollection):
+            arrays = self.board.tracks.arrays()
+            on_net = arrays.net == net
+            track_count = int(on_net.sum())
+            total_length = float(arrays.length[on_net].sum())
+            layers_used = {
+                arrays.layer_names[code] for code in np.unique(arrays.layer[on_net])
+            }
+            total_width = float(arrays.width[on_net].sum())
+        else:
+            tracks = [t for t in self.board.tracks if t.net == net]
+            track_count = len(tracks)
+            total_length = sum(t.get_length() for t in tracks)
+            layers_used = set(t.layer for t in tracks)
+            total_width = sum(t.width for t in tracks)
 
-        return {
+        stats = {
             "net": net,
-            "track_count": len(tracks),
-            "via_count": len(vias),
+            "track_count": track_count,
+            "via_count": via_count,
             "total_length": total_length,
             "layers_used": list(layers_used),
-            "average_track_width": (
-                sum(t.width for t in tracks) / len(tracks) if tracks else 0
-            ),
+            "average_track_width": total_width / track_count if track_count else 0,
         }
+        self._store_stats(state, key, stats)
+        return dict(stats, layers_used=list(layers_used))
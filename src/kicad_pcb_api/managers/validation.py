@@ -1,17 +1,25 @@
 """Board-level validation manager."""
 
 import logging
+import math
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple
 
+from ..core.geometry import BoundingBox
+from ..core.spatial_index import SpatialIndex
+from ..core.validation import COPPER_LAYERS, find_invalid_references
 from .base import BaseManager
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
-    """Represents a validation issue."""
+    """Represents a validation issue.
+
+    Slotted: validators create one per finding, so on large boards these
+    are built in bulk.
+    """
 
     severity: str  # "error", "warning", "info"
     category: str  # "reference", "net", "placement", etc.
@@ -20,6 +28,82 @@ class ValidationIssue:
     suggestion: str = ""
 
 
+class _PositionChecker:
+    """Finds footprints placed on top of, or too close to, earlier ones.
+
+    Identical positions (to 1 µm) are found with a dict. With a minimum
+    spacing, positions also go into a SpatialIndex whose grid cells are one
+    spacing wide, so each footprint is compared only with footprints in the
+    neighbouring cells rather than with all of them.
+    """
+
+    def __init__(self, min_spacing: float = 0.0):
+        """Initialize with no footprints checked yet.
+
+        Args:
+            min_spacing: Minimum distance between footprint positions in mm;
+                0 checks only for identical positions
+        """
+        self._min_spacing = min_spacing
+        self._exact: Dict[Tuple[int, int], str] = {}
+        self._index = SpatialIndex(cell_size=min_spacing) if min_spacing > 0 else None
+        self._placed: List[Tuple[float, float, str]] = []
+
+    def check(self, footprint, issues: List[ValidationIssue]) -> None:
+        """Check one footprint against those checked before it, then record it."""
+        x, y = footprint.position.x, footprint.position.y
+
+        # Simple overlap check: components at exact same position. Keys are
+        # whole micrometres; floor(v + 0.5) rounds about twice as fast as round()
+        floor = math.floor
+        pos_key = (floor(x * 1000 + 0.5), floor(y * 1000 + 0.5))
+        if pos_key in self._exact:
+            issues.append(
+                ValidationIssue(
+                    severity="warning",
+                    category="placement",
+                    description=(
+                        f"Components {self._exact[pos_key]} and "
+                        f"{footprint.reference} at same position"
+                    ),
+                    element_uuid=footprint.uuid,
+                    suggestion="Move components apart",
+                )
+            )
+            return
+        self._exact[pos_key] = footprint.reference
+
+        if self._index is None:
+            return
+
+        spacing = self._min_spacing
+        nearby = self._index.query(
+            BoundingBox(x - spacing, y - spacing, x + spacing, y + spacing)
+        )
+        close = [
+            (math.hypot(self._placed[k][0] - x, self._placed[k][1] - y), k)
+            for k in nearby
+        ]
+        close = [hit for hit in close if hit[0] < spacing]
+        if close:
+            distance, k = min(close)
+            issues.append(
+                ValidationIssue(
+                    severity="warning",
+                    category="placement",
+                    description=(
+                        f"Components {self._placed[k][2]} and {footprint.reference} "
+                        f"only {distance:.3f}mm apart (minimum {spacing}mm)"
+                    ),
+                    element_uuid=footprint.uuid,
+                    suggestion="Move components apart",
+                )
+            )
+
+        self._index.insert(len(self._placed), BoundingBox(x, y, x, y))
+        self._placed.append((x, y, footprint.reference))
+
+
 class ValidationManager(BaseManager):
     """Manager for board-level validation.
 
@@ -55,43 +139,18 @@ class ValidationManager(BaseManager):
         Returns:
             Number of issues found
         """
-        count = 0
-        seen_refs = {}
+        issues: List[ValidationIssue] = []
+        seen_refs: Dict[str, str] = {}
 
         # Access raw footprint data instead of collection
-        for footprint in self.board.pcb_data.get("footprints", []):
-            ref = footprint.reference
+        footprints = self._pcb_data.get("footprints", [])
+        if not self._references_unique(footprints):
+            for footprint in footprints:
+                self._check_reference(footprint, seen_refs, issues)
+        self._check_reference_formats(footprints, issues)
 
-            # Check for missing reference
-            if not ref:
-                self._issues.append(
-                    ValidationIssue(
-                        severity="error",
-                        category="reference",
-                        description="Footprint has no reference designator",
-                        element_uuid=footprint.uuid,
-                        suggestion="Assign a unique reference like R1, C1, etc.",
-                    )
-                )
-                count += 1
-                continue
-
-            # Check for duplicates
-            if ref in seen_refs:
-                self._issues.append(
-                    ValidationIssue(
-                        severity="error",
-                        category="reference",
-                        description=f"Duplicate reference: {ref}",
-                        element_uuid=footprint.uuid,
-                        suggestion=f"Rename to a unique reference",
-                    )
-                )
-                count += 1
-            else:
-                seen_refs[ref] = footprint.uuid
-
-        return count
+        self._issues.extend(issues)
+        return len(issues)
 
     def validate_nets(self) -> int:
         """Validate net assignments.
@@ -103,60 +162,37 @@ class ValidationManager(BaseManager):
         Returns:
             Number of issues found
         """
-        count = 0
-
-        # Check for inconsistent net names
-        net_names = {}
-        for footprint in self.board.pcb_data.get("footprints", []):
-            for pad in footprint.pads:
-                if pad.net is not None and pad.net_name:
-                    if pad.net in net_names:
-                        if net_names[pad.net] != pad.net_name:
-                            self._issues.append(
-                                ValidationIssue(
-                                    severity="warning",
-                                    category="net",
-                                    description=f"Net {pad.net} has inconsistent names: {net_names[pad.net]} vs {pad.net_name}",
-                                    suggestion="Use consistent net names",
-                                )
-                            )
-                            count += 1
-                    else:
-                        net_names[pad.net] = pad.net_name
+        issues: List[ValidationIssue] = []
+        net_names: Dict[int, str] = {}
 
-        return count
+        for footprint in self._pcb_data.get("footprints", []):
+            self._check_pad_nets(footprint, net_names, issues)
+
+        self._issues.extend(issues)
+        return len(issues)
 
-    def validate_placement(self) -> int:
+    def validate_placement(self, min_spacing: float = 0.0) -> int:
         """Validate component placement.
 
         Checks for:
         - Overlapping components (simplified check)
         - Components outside board bounds (if bounds defined)
 
+        Args:
+            min_spacing: Also report footprints whose positions are closer
+                than this many mm; 0 reports only identical positions
+
         Returns:
             Number of issues found
         """
-        count = 0
-
-        # Simple overlap check: components at exact same position
-        positions = {}
-        for footprint in self.board.pcb_data.get("footprints", []):
-            pos_key = (round(footprint.position.x, 3), round(footprint.position.y, 3))
-            if pos_key in positions:
-                self._issues.append(
-                    ValidationIssue(
-                        severity="warning",
-                        category="placement",
-                        description=f"Components {positions[pos_key]} and {footprint.reference} at same position",
-                        element_uuid=footprint.uuid,
-                        suggestion="Move components apart",
-                    )
-                )
-                count += 1
-            else:
-                positions[pos_key] = footprint.reference
+        issues: List[ValidationIssue] = []
+        positions = _PositionChecker(min_spacing)
 
-        return count
+        for footprint in self._pcb_data.get("footprints", []):
+            positions.check(footprint, issues)
+
+        self._issues.extend(issues)
+        return len(issues)
 
     def validate_layers(self) -> int:
         """Validate layer assignments.
@@ -169,12 +205,12 @@ class ValidationManager(BaseManager):
         Returns:
             Number of issues found
         """
-        count = 0
+        issues: List[ValidationIssue] = []
 
         # Check tracks are on copper layers
-        for track in self.board.pcb_data.get("tracks", []):
-            if not track.layer.endswith(".Cu"):
-                self._issues.append(
+        for track in self._pcb_data.get("tracks", []):
+            if track.layer not in COPPER_LAYERS:
+                issues.append(
                     ValidationIssue(
                         severity="error",
                         category="layer",
@@ -183,12 +219,11 @@ class ValidationManager(BaseManager):
                         suggestion="Move track to copper layer",
                     )
                 )
-                count += 1
 
         # Check vias have valid layer spans
-        for via in self.board.pcb_data.get("vias", []):
+        for via in self._pcb_data.get("vias", []):
             if len(via.layers) < 2:
-                self._issues.append(
+                issues.append(
                     ValidationIssue(
                         severity="error",
                         category="layer",
@@ -197,27 +232,137 @@ class ValidationManager(BaseManager):
                         suggestion="Fix via layer span",
                     )
                 )
-                count += 1
 
-        return count
+        self._issues.extend(issues)
+        return len(issues)
 
-    def validate_all(self) -> int:
+    def validate_all(self, min_spacing: float = 0.0) -> int:
         """Run all validation checks.
 
+        The reference, net and placement checks share one pass over the
+        footprints; issues are still reported grouped by check, in the
+        order of the individual validate_* methods.
+
+        Args:
+            min_spacing: Passed to the placement check (see validate_placement)
+
         Returns:
             Total number of issues found
         """
         self._issues.clear()
 
-        count = 0
-        count += self.validate_references()
-        count += self.validate_nets()
-        count += self.validate_placement()
+        reference_issues: List[ValidationIssue] = []
+        net_issues: List[ValidationIssue] = []
+        placement_issues: List[ValidationIssue] = []
+        seen_refs: Dict[str, str] = {}
+        net_names: Dict[int, str] = {}
+        positions = _PositionChecker(min_spacing)
+
+        footprints = self._pcb_data.get("footprints", [])
+        check_references = not self._references_unique(footprints)
+        for footprint in footprints:
+            if check_references:
+                self._check_reference(footprint, seen_refs, reference_issues)
+            self._check_pad_nets(footprint, net_names, net_issues)
+            positions.check(footprint, placement_issues)
+        self._check_reference_formats(footprints, reference_issues)
+
+        self._issues.extend(reference_issues)
+        self._issues.extend(net_issues)
+        self._issues.extend(placement_issues)
+
+        count = len(self._issues)
         count += self.validate_layers()
 
         logger.info(f"Board validation complete: {count} issues found")
         return count
 
+    # Per-footprint checks shared by the validate_* methods and validate_all
+
+    @staticmethod
+    def _references_unique(footprints) -> bool:
+        """True if every footprint has a reference and no reference repeats.
+
+        Built as one set comprehension, so a clean board, the common case,
+        skips the per-footprint _check_reference calls entirely.
+        """
+        refs = {footprint.reference for footprint in footprints}
+        return len(refs) == len(footprints) and "" not in refs and None not in refs
+
+    @staticmethod
+    def _check_reference(
+        footprint, seen_refs: Dict[str, str], issues: List[ValidationIssue]
+    ) -> None:
+        """Check one footprint's reference against the references seen so far."""
+        ref = footprint.reference
+
+        # Check for missing reference
+        if not ref:
+            issues.append(
+                ValidationIssue(
+                    severity="error",
+                    category="reference",
+                    description="Footprint has no reference designator",
+                    element_uuid=footprint.uuid,
+                    suggestion="Assign a unique reference like R1, C1, etc.",
+                )
+            )
+            return
+
+        # Check for duplicates
+        if ref in seen_refs:
+            issues.append(
+                ValidationIssue(
+                    severity="error",
+                    category="reference",
+                    description=f"Duplicate reference: {ref}",
+                    element_uuid=footprint.uuid,
+                    suggestion=f"Rename to a unique reference",
+                )
+            )
+        else:
+            seen_refs[ref] = footprint.uuid
+
+    @staticmethod
+    def _check_reference_formats(footprints, issues: List[ValidationIssue]) -> None:
+        """Report references that are present but not letter(s) + number(s)."""
+        for i in find_invalid_references(
+            [footprint.reference or "" for footprint in footprints]
+        ):
+            footprint = footprints[i]
+            issues.append(
+                ValidationIssue(
+                    severity="warning",
+                    category="reference",
+                    description=f"Invalid reference format: {footprint.reference}",
+                    element_uuid=footprint.uuid,
+                    suggestion="Use letter(s) followed by number(s), like R1 or U10",
+                )
+            )
+
+    @staticmethod
+    def _check_pad_nets(
+        footprint, net_names: Dict[int, str], issues: List[ValidationIssue]
+    ) -> None:
+        """Check one footprint's pad net names against the names seen so far."""
+        for pad in footprint.pads:
+            if pad.net is not None and pad.net_name:
+                known = net_names.get(pad.net)
+                if known is None:
+                    net_names[pad.net] = pad.net_name
+                elif known != pad.net_name:
+                    issues.append(
+                        ValidationIssue(
+                            severity="warning",
+                            category="net",
+                            description=(
+                                f"Net {pad.net} has inconsistent names: "
+                                f"{known} vs {pad.net_name}"
+                            ),
+                            suggestion="Use consistent net names",
+                        )
+                    )
+
     def get_errors(self) -> List[ValidationIssue]:
         """Get only error-level issues.
 
@@ -12,6 +12,9 @@ import sexpdata
 
 logger = logging.getLogger(__name__)
 
+# Module-level alias so the hot lookup loops below avoid the attribute lookup
+_Symbol = sexpdata.Symbol
+
 
 class BaseElementParser(ABC):
     """Base implementation for S-expression element parsers."""
@@ -48,7 +51,7 @@ class BaseElementParser(ABC):
 
         try:
             result = self.parse_element(element)
-            if result is not None:
+            if result is not None and self._logger.isEnabledFor(logging.DEBUG):
                 self._logger.debug(f"Successfully parsed {self.element_type} element")
             return result
         except Exception as e:
@@ -84,31 +87,75 @@ class BaseElementParser(ABC):
 
     def _get_symbol_name(self, obj: Any) -> Optional[str]:
         """Get the name of a symbol if it is one."""
-        if isinstance(obj, sexpdata.Symbol):
+        if isinstance(obj, _Symbol):
             return str(obj)
         return None
 
     def _to_string(self, obj: Any) -> str:
         """Convert a value to string, handling Symbol objects."""
-        if isinstance(obj, sexpdata.Symbol):
+        if isinstance(obj, _Symbol):
             return str(obj)
         return obj
 
     def _find_element(self, sexp: List, name: str) -> Optional[Any]:
         """Find an element by name in an S-expression."""
+        # Checks are inlined rather than going through _get_symbol_name: this
+        # runs for every child of every element during a board load
         for item in sexp:
-            if self._is_sexp_list(item) and self._get_symbol_name(item[0]) == name:
-                return item
+            if isinstance(item, list) and item:
+                head = item[0]
+                if isinstance(head, _Symbol) and str(head) == name:
+                    return item
         return None
 
     def _find_all_elements(self, sexp: List, name: str) -> List[Any]:
         """Find all elements by name in an S-expression."""
         results = []
         for item in sexp:
-            if self._is_sexp_list(item) and self._get_symbol_name(item[0]) == name:
-                results.append(item)
+            if isinstance(item, list) and item:
+                head = item[0]
+                if isinstance(head, _Symbol) and str(head) == name:
+                    results.append(item)
         return results
 
+    def _index_children(self, sexp: List) -> Dict[str, List[Any]]:
+        """
+        Group the child elements of an S-expression by name in one pass.
+
+        Parsers that look up many children of the same element use this
+        instead of one _find_element/_find_all_elements scan per name. Each
+        group keeps document order, so its first entry is what _find_element
+        would return.
+        """
+        children: Dict[str, List[Any]] = {}
+        for item in sexp:
+            if isinstance(item, list) and item and isinstance(item[0], _Symbol):
+                children.setdefault(str(item[0]), []).append(item)
+        return children
+
+    def _first_children(self, sexp: List) -> Dict[str, Any]:
+        """
+        Map each child element name to its first occurrence in one pass.
+
+        A lighter _index_children for small elements (pads, graphics,
+        properties) whose children are only ever looked up by first match:
+        no per-name lists are built, and lookups are plain dict gets.
+        """
+        children: Dict[str, Any] = {}
+        for item in sexp:
+            if isinstance(item, list) and item:
+                head = item[0]
+                if isinstance(head, _Symbol):
+                    name = str(head)
+                    if name not in children:
+                        children[name] = item
+        return children
+
+    def _first_child(self, children: Dict[str, List[Any]], name: str) -> Optional[Any]:
+        """Get the first element of a name from an _index_children result."""
+        found = children.get(name)
+        return found[0] if found else None
+
     def _get_value(self, sexp: List, name: str, default: Any = None) -> Any:
         """Get the value of a named element."""
         element = self._find_element(sexp, name)
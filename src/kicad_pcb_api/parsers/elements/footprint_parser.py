@@ -5,8 +5,7 @@ Handles parsing of footprint elements and their sub-elements (pads, graphics, et
 """
 
 import logging
-import uuid
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 from ...core.types import (
     Arc,
@@ -18,6 +17,7 @@ from ...core.types import (
     Rectangle,
     Text,
 )
+from ...utils.ids import new_uuid
 from ..base import BaseElementParser
 
 logger = logging.getLogger(__name__)
@@ -41,16 +41,18 @@ class FootprintParser(BaseElementParser):
                 library = ""
                 name = lib_id
 
+            children = self._index_children(element)
+
             # Get layer
-            layer_elem = self._find_element(element, "layer")
+            layer_elem = self._first_child(children, "layer")
             layer = self._to_string(layer_elem[1]) if layer_elem else "F.Cu"
 
             # Get UUID
-            uuid_elem = self._find_element(element, "uuid")
-            fp_uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+            uuid_elem = self._first_child(children, "uuid")
+            fp_uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
             # Get position
-            at_elem = self._find_element(element, "at")
+            at_elem = self._first_child(children, "at")
             if not at_elem or len(at_elem) < 3:
                 return None
 
@@ -68,16 +70,20 @@ class FootprintParser(BaseElementParser):
             )
 
             # Parse description and tags
-            footprint.descr = self._get_value(element, "descr", "")
-            footprint.tags = self._get_value(element, "tags", "")
+            descr_elem = self._first_child(children, "descr")
+            if descr_elem and len(descr_elem) > 1:
+                footprint.descr = descr_elem[1]
+            tags_elem = self._first_child(children, "tags")
+            if tags_elem and len(tags_elem) > 1:
+                footprint.tags = tags_elem[1]
 
             # Parse attributes
-            attr_elem = self._find_element(element, "attr")
+            attr_elem = self._first_child(children, "attr")
             if attr_elem:
-                footprint.attr = " ".join(str(a) for a in attr_elem[1:])
+                footprint.attr = " ".join(map(str, attr_elem[1:]))
 
             # Parse properties
-            for prop_elem in self._find_all_elements(element, "property"):
+            for prop_elem in children.get("property", ()):
                 prop = self._parse_property(prop_elem)
                 if prop:
                     footprint.properties.append(prop)
@@ -88,45 +94,45 @@ class FootprintParser(BaseElementParser):
                         footprint.value = prop.value
 
             # Parse path info
-            path_elem = self._find_element(element, "path")
+            path_elem = self._first_child(children, "path")
             if path_elem:
                 footprint.path = path_elem[1]
-            sheetname_elem = self._find_element(element, "sheetname")
+            sheetname_elem = self._first_child(children, "sheetname")
             if sheetname_elem:
                 footprint.sheetname = sheetname_elem[1]
-            sheetfile_elem = self._find_element(element, "sheetfile")
+            sheetfile_elem = self._first_child(children, "sheetfile")
             if sheetfile_elem:
                 footprint.sheetfile = sheetfile_elem[1]
 
             # Parse graphical elements
-            for line_elem in self._find_all_elements(element, "fp_line"):
+            for line_elem in children.get("fp_line", ()):
                 line = self._parse_line(line_elem)
                 if line:
                     footprint.lines.append(line)
 
-            for arc_elem in self._find_all_elements(element, "fp_arc"):
+            for arc_elem in children.get("fp_arc", ()):
                 arc = self._parse_arc(arc_elem)
                 if arc:
                     footprint.arcs.append(arc)
 
-            for text_elem in self._find_all_elements(element, "fp_text"):
+            for text_elem in children.get("fp_text", ()):
                 text = self._parse_text(text_elem)
                 if text:
                     footprint.texts.append(text)
 
-            for rect_elem in self._find_all_elements(element, "fp_rect"):
+            for rect_elem in children.get("fp_rect", ()):
                 rect = self._parse_rectangle(rect_elem)
                 if rect:
                     footprint.rectangles.append(rect)
 
             # Parse pads
-            for pad_elem in self._find_all_elements(element, "pad"):
+            for pad_elem in children.get("pad", ()):
                 pad = self._parse_pad(pad_elem)
                 if pad:
                     footprint.pads.append(pad)
 
             # Parse 3D model
-            model_elem = self._find_element(element, "model")
+            model_elem = self._first_child(children, "model")
             if model_elem:
                 footprint.model_path = model_elem[1]
                 # Parse offset, scale, rotate if present
@@ -142,69 +148,94 @@ class FootprintParser(BaseElementParser):
         if len(element) < 3:
             return None
 
+        children = self._first_children(element)
+
         name = element[1]
         value = element[2]
 
         # Get position
-        at_elem = self._find_element(element, "at")
+        at_elem = children.get("at")
         if at_elem and len(at_elem) >= 3:
             position = Point(float(at_elem[1]), float(at_elem[2]))
         else:
             position = Point(0, 0)
 
         # Get layer
-        layer_elem = self._find_element(element, "layer")
+        layer_elem = children.get("layer")
         layer = self._to_string(layer_elem[1]) if layer_elem else "F.SilkS"
 
         # Get UUID
-        uuid_elem = self._find_element(element, "uuid")
-        prop_uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        uuid_elem = children.get("uuid")
+        prop_uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         prop = Property(
             name=name, value=value, position=position, layer=layer, uuid=prop_uuid
         )
 
         # Parse effects
-        effects_elem = self._find_element(element, "effects")
+        effects_elem = children.get("effects")
         if effects_elem:
-            font_elem = self._find_element(effects_elem, "font")
-            if font_elem:
-                size_elem = self._find_element(font_elem, "size")
-                if size_elem and len(size_elem) >= 3:
-                    prop.size = (float(size_elem[1]), float(size_elem[2]))
-                thickness_elem = self._find_element(font_elem, "thickness")
-                if thickness_elem:
-                    prop.thickness = float(thickness_elem[1])
+            size, thickness = self._parse_font(effects_elem)
+            if size is not None:
+                prop.size = size
+            if thickness is not None:
+                prop.thickness = thickness
 
         return prop
 
+    def _parse_font(
+        self, effects_elem: List[Any]
+    ) -> Tuple[Optional[Tuple[float, float]], Optional[float]]:
+        """Get the font size and thickness of an effects element.
+
+        The font's children are read in one pass rather than one scan per
+        attribute. Either value is None when it is not given.
+        """
+        font_elem = self._find_element(effects_elem, "font")
+        if not font_elem:
+            return None, None
+
+        font = self._first_children(font_elem)
+        size_elem = font.get("size")
+        size = (
+            (float(size_elem[1]), float(size_elem[2]))
+            if size_elem and len(size_elem) >= 3
+            else None
+        )
+        thickness_elem = font.get("thickness")
+        thickness = float(thickness_elem[1]) if thickness_elem else None
+        return size, thickness
+
     def _parse_pad(self, element: List[Any]) -> Optional[Pad]:
         """Parse a pad element."""
         if len(element) < 4:
             return None
 
+        children = self._first_children(element)
+
         number = str(element[1])
         pad_type = self._to_string(element[2])
         shape = self._to_string(element[3])
 
         # Get position
-        at_elem = self._find_element(element, "at")
+        at_elem = children.get("at")
         if at_elem and len(at_elem) >= 3:
             position = Point(float(at_elem[1]), float(at_elem[2]))
         else:
             position = Point(0, 0)
+        rotation = float(at_elem[3]) if at_elem and len(at_elem) >= 4 else 0.0
 
         # Get size
-        size_elem = self._find_element(element, "size")
+        size_elem = children.get("size")
         if size_elem and len(size_elem) >= 3:
             size = (float(size_elem[1]), float(size_elem[2]))
         else:
             size = (1.0, 1.0)
 
         # Get layers
-        layers_elem = self._find_element(element, "layers")
+        layers_elem = children.get("layers")
         if layers_elem:
-            layers = [str(l) for l in layers_elem[1:]]
+            layers = list(map(str, layers_elem[1:]))
         else:
             layers = []
 
@@ -215,10 +246,11 @@ class FootprintParser(BaseElementParser):
             position=position,
             size=size,
             layers=layers,
+            rotation=rotation,
         )
 
         # Get drill if present
-        drill_elem = self._find_element(element, "drill")
+        drill_elem = children.get("drill")
         if drill_elem:
             if len(drill_elem) >= 4 and str(drill_elem[1]) == "oval":
                 # Oval drill
@@ -232,26 +264,28 @@ class FootprintParser(BaseElementParser):
                 pad.drill = float(drill_elem[1])
 
         # Get net
-        net_elem = self._find_element(element, "net")
+        net_elem = children.get("net")
         if net_elem and len(net_elem) >= 3:
             pad.net = net_elem[1]
             pad.net_name = net_elem[2]
 
         # Get roundrect ratio
-        rratio_elem = self._find_element(element, "roundrect_rratio")
+        rratio_elem = children.get("roundrect_rratio")
         if rratio_elem:
             pad.roundrect_rratio = float(rratio_elem[1])
 
         # Get UUID
-        uuid_elem = self._find_element(element, "uuid")
-        pad.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        uuid_elem = children.get("uuid")
+        pad.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return pad
 
     def _parse_line(self, element: List[Any]) -> Optional[Line]:
         """Parse a line element."""
-        start_elem = self._find_element(element, "start")
-        end_elem = self._find_element(element, "end")
+        children = self._first_children(element)
+
+        start_elem = children.get("start")
+        end_elem = children.get("end")
 
         if not start_elem or not end_elem:
             return None
@@ -259,13 +293,13 @@ class FootprintParser(BaseElementParser):
         start = Point(float(start_elem[1]), float(start_elem[2]))
         end = Point(float(end_elem[1]), float(end_elem[2]))
 
-        layer_elem = self._find_element(element, "layer")
+        layer_elem = children.get("layer")
         layer = layer_elem[1] if layer_elem else "F.SilkS"
 
         line = Line(start=start, end=end, layer=layer)
 
         # Parse stroke
-        stroke_elem = self._find_element(element, "stroke")
+        stroke_elem = children.get("stroke")
         if stroke_elem:
             width_elem = self._find_element(stroke_elem, "width")
             if width_elem:
@@ -275,16 +309,18 @@ class FootprintParser(BaseElementParser):
                 line.type = type_elem[1]
 
         # Get UUID
-        uuid_elem = self._find_element(element, "uuid")
-        line.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        uuid_elem = children.get("uuid")
+        line.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return line
 
     def _parse_arc(self, element: List[Any]) -> Optional[Arc]:
         """Parse an arc element."""
-        start_elem = self._find_element(element, "start")
-        mid_elem = self._find_element(element, "mid")
-        end_elem = self._find_element(element, "end")
+        children = self._first_children(element)
+
+        start_elem = children.get("start")
+        mid_elem = children.get("mid")
+        end_elem = children.get("end")
 
         if not start_elem or not mid_elem or not end_elem:
             return None
@@ -293,13 +329,13 @@ class FootprintParser(BaseElementParser):
         mid = Point(float(mid_elem[1]), float(mid_elem[2]))
         end = Point(float(end_elem[1]), float(end_elem[2]))
 
-        layer_elem = self._find_element(element, "layer")
+        layer_elem = children.get("layer")
         layer = layer_elem[1] if layer_elem else "F.SilkS"
 
         arc = Arc(start=start, mid=mid, end=end, layer=layer)
 
         # Parse stroke
-        stroke_elem = self._find_element(element, "stroke")
+        stroke_elem = children.get("stroke")
         if stroke_elem:
             width_elem = self._find_element(stroke_elem, "width")
             if width_elem:
@@ -309,15 +345,17 @@ class FootprintParser(BaseElementParser):
                 arc.type = type_elem[1]
 
         # Get UUID
-        uuid_elem = self._find_element(element, "uuid")
-        arc.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        uuid_elem = children.get("uuid")
+        arc.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return arc
 
     def _parse_rectangle(self, element: List[Any]) -> Optional[Rectangle]:
         """Parse a rectangle element."""
-        start_elem = self._find_element(element, "start")
-        end_elem = self._find_element(element, "end")
+        children = self._first_children(element)
+
+        start_elem = children.get("start")
+        end_elem = children.get("end")
 
         if not start_elem or not end_elem:
             return None
@@ -325,20 +363,20 @@ class FootprintParser(BaseElementParser):
         start = Point(float(start_elem[1]), float(start_elem[2]))
         end = Point(float(end_elem[1]), float(end_elem[2]))
 
-        layer_elem = self._find_element(element, "layer")
+        layer_elem = children.get("layer")
         layer = layer_elem[1] if layer_elem else "F.SilkS"
 
         rect = Rectangle(start=start, end=end, layer=layer)
 
         # Parse stroke
-        stroke_elem = self._find_element(element, "stroke")
+        stroke_elem = children.get("stroke")
         if stroke_elem:
             width_elem = self._find_element(stroke_elem, "width")
             if width_elem:
                 rect.width = float(width_elem[1])
 
         # Parse fill
-        fill_elem = self._find_element(element, "fill")
+        fill_elem = children.get("fill")
         if fill_elem and len(fill_elem) > 1:
             # Handle both "no" and "none" as False
             # Convert to string in case it's a Symbol object
@@ -346,8 +384,8 @@ class FootprintParser(BaseElementParser):
             rect.fill = fill_value not in ["no", "none"]
 
         # Get UUID
-        uuid_elem = self._find_element(element, "uuid")
-        rect.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        uuid_elem = children.get("uuid")
+        rect.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return rect
 
@@ -356,34 +394,33 @@ class FootprintParser(BaseElementParser):
         if len(element) < 3:
             return None
 
+        children = self._first_children(element)
+
         text_type = element[1]  # "reference", "value", "user"
         text_value = element[2]
 
-        at_elem = self._find_element(element, "at")
+        at_elem = children.get("at")
         if at_elem and len(at_elem) >= 3:
             position = Point(float(at_elem[1]), float(at_elem[2]))
         else:
             position = Point(0, 0)
 
-        layer_elem = self._find_element(element, "layer")
+        layer_elem = children.get("layer")
         layer = layer_elem[1] if layer_elem else "F.SilkS"
 
         text = Text(text=text_value, position=position, layer=layer)
 
         # Parse effects
-        effects_elem = self._find_element(element, "effects")
+        effects_elem = children.get("effects")
         if effects_elem:
-            font_elem = self._find_element(effects_elem, "font")
-            if font_elem:
-                size_elem = self._find_element(font_elem, "size")
-                if size_elem and len(size_elem) >= 3:
-                    text.size = (float(size_elem[1]), float(size_elem[2]))
-                thickness_elem = self._find_element(font_elem, "thickness")
-                if thickness_elem:
-                    text.thickness = float(thickness_elem[1])
+            size, thickness = self._parse_font(effects_elem)
+            if size is not None:
+                text.size = size
+            if thickness is not None:
+                text.thickness = thickness
 
         # Get UUID
-        uuid_elem = self._find_element(element, "uuid")
-        text.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        uuid_elem = children.get("uuid")
+        text.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return text
@@ -5,10 +5,10 @@ Handles parsing of board graphics elements (lines, rectangles, etc).
 """
 
 import logging
-import uuid
 from typing import Any, List, Optional, Union
 
 from ...core.types import Line, Point, Rectangle
+from ...utils.ids import new_uuid
 from ..base import BaseElementParser
 
 logger = logging.getLogger(__name__)
@@ -23,8 +23,10 @@ class GraphicsLineParser(BaseElementParser):
 
     def parse_element(self, element: List[Any]) -> Optional[Line]:
         """Parse a graphics line element."""
-        start_elem = self._find_element(element, "start")
-        end_elem = self._find_element(element, "end")
+        children = self._first_children(element)
+
+        start_elem = children.get("start")
+        end_elem = children.get("end")
 
         if not start_elem or not end_elem:
             return None
@@ -32,13 +34,13 @@ class GraphicsLineParser(BaseElementParser):
         start = Point(float(start_elem[1]), float(start_elem[2]))
         end = Point(float(end_elem[1]), float(end_elem[2]))
 
-        layer_elem = self._find_element(element, "layer")
+        layer_elem = children.get("layer")
         layer = layer_elem[1] if layer_elem else "F.SilkS"
 
         line = Line(start=start, end=end, layer=layer)
 
         # Parse stroke
-        stroke_elem = self._find_element(element, "stroke")
+        stroke_elem = children.get("stroke")
         if stroke_elem:
             width_elem = self._find_element(stroke_elem, "width")
             if width_elem:
@@ -48,8 +50,8 @@ class GraphicsLineParser(BaseElementParser):
                 line.type = type_elem[1]
 
         # Get UUID
-        uuid_elem = self._find_element(element, "uuid")
-        line.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        uuid_elem = children.get("uuid")
+        line.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return line
 
@@ -63,8 +65,10 @@ class GraphicsRectParser(BaseElementParser):
 
     def parse_element(self, element: List[Any]) -> Optional[Rectangle]:
         """Parse a graphics rectangle element."""
-        start_elem = self._find_element(element, "start")
-        end_elem = self._find_element(element, "end")
+        children = self._first_children(element)
+
+        start_elem = children.get("start")
+        end_elem = children.get("end")
 
         if not start_elem or not end_elem:
             return None
@@ -72,20 +76,20 @@ class GraphicsRectParser(BaseElementParser):
         start = Point(float(start_elem[1]), float(start_elem[2]))
         end = Point(float(end_elem[1]), float(end_elem[2]))
 
-        layer_elem = self._find_element(element, "layer")
+        layer_elem = children.get("layer")
         layer = layer_elem[1] if layer_elem else "F.SilkS"
 
         rect = Rectangle(start=start, end=end, layer=layer)
 
         # Parse stroke
-        stroke_elem = self._find_element(element, "stroke")
+        stroke_elem = children.get("stroke")
         if stroke_elem:
             width_elem = self._find_element(stroke_elem, "width")
             if width_elem:
                 rect.width = float(width_elem[1])
 
         # Parse fill
-        fill_elem = self._find_element(element, "fill")
+        fill_elem = children.get("fill")
         if fill_elem and len(fill_elem) > 1:
             # Handle both "no" and "none" as False
             # Convert to string in case it's a Symbol object
@@ -93,7 +97,7 @@ class GraphicsRectParser(BaseElementParser):
             rect.fill = fill_value not in ["no", "none"]
 
         # Get UUID
-        uuid_elem = self._find_element(element, "uuid")
-        rect.uuid = uuid_elem[1] if uuid_elem else str(uuid.uuid4())
+        uuid_elem = children.get("uuid")
+        rect.uuid = uuid_elem[1] if uuid_elem else new_uuid()
 
         return rect
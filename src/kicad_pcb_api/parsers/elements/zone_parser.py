@@ -19,58 +19,91 @@ class ZoneParser(BaseElementParser):
     def __init__(self):
         """Initialize zone parser."""
         super().__init__("zone")
+        # Child element name -> handler, looked up once per child
+        self._handlers = {
+            "net": self._parse_net,
+            "net_name": self._parse_net_name,
+            "layers": self._parse_layers,
+            "uuid": self._parse_uuid,
+            "hatch": self._parse_hatch,
+            "connect_pads": self._parse_connect_pads,
+            "min_thickness": self._parse_min_thickness,
+            "filled_areas_thickness": self._parse_filled_areas_thickness,
+            "fill": self._parse_fill,
+            "polygon": self._parse_polygon,
+        }
 
     def parse_element(self, element: List[Any]) -> Optional[Zone]:
         """Parse a zone element."""
         zone = Zone(layer="F.Cu")  # Default layer
+        handlers = self._handlers
 
         # Parse attributes
         for item in element[1:]:
             if not self._is_sexp_list(item):
                 continue
 
-            item_type = self._get_symbol_name(item[0])
-
-            if item_type == "net":
-                if len(item) >= 2:
-                    zone.net = item[1]
-                if len(item) >= 3:
-                    zone.net_name = item[2]
-            elif item_type == "net_name":
-                zone.net_name = item[1]
-            elif item_type == "layers":
-                # Can be multiple layers
-                zone.layer = " ".join(str(l) for l in item[1:])
-            elif item_type == "uuid":
-                zone.uuid = item[1]
-            elif item_type == "hatch":
-                if len(item) >= 3:
-                    zone.hatch_thickness = float(item[2])
-                if len(item) >= 4:
-                    zone.hatch_gap = float(item[3])
-            elif item_type == "connect_pads":
-                connect_elem = self._find_element(item, "clearance")
-                if connect_elem:
-                    zone.thermal_relief_gap = float(connect_elem[1])
-            elif item_type == "min_thickness":
-                zone.min_thickness = float(item[1])
-            elif item_type == "filled_areas_thickness":
-                zone.filled = item[1] != "no"
-            elif item_type == "fill":
-                thermal_gap = self._find_element(item, "thermal_gap")
-                if thermal_gap:
-                    zone.thermal_relief_gap = float(thermal_gap[1])
-                thermal_bridge = self._find_element(item, "thermal_bridge_width")
-                if thermal_bridge:
-                    zone.thermal_relief_bridge = float(thermal_bridge[1])
-            elif item_type == "polygon":
-                pts_elem = self._find_element(item, "pts")
-                if pts_elem:
-                    for pt in pts_elem[1:]:
-                        if (
-                            self._is_sexp_list(pt)
-                            and self._get_symbol_name(pt[0]) == "xy"
-                        ):
-                            zone.polygon.append(Point(float(pt[1]), float(pt[2])))
+            handler = handlers.get(self._get_symbol_name(item[0]))
+            if handler is not None:
+                handler(zone, item)
 
         return zone
+
+    def _parse_net(self, zone: Zone, item: List[Any]) -> None:
+        """Set the net number and, if given, the net name."""
+        if len(item) >= 2:
+            zone.net = item[1]
+        if len(item) >= 3:
+            zone.net_name = item[2]
+
+    def _parse_net_name(self, zone: Zone, item: List[Any]) -> None:
+        """Set the net name."""
+        zone.net_name = item[1]
+
+    def _parse_layers(self, zone: Zone, item: List[Any]) -> None:
+        """Set the zone layer(s)."""
+        # Can be multiple layers
+        zone.layer = " ".join(map(str, item[1:]))
+
+    def _parse_uuid(self, zone: Zone, item: List[Any]) -> None:
+        """Set the zone UUID."""
+        zone.uuid = item[1]
+
+    def _parse_hatch(self, zone: Zone, item: List[Any]) -> None:
+        """Set the hatch thickness and gap."""
+        if len(item) >= 3:
+            zone.hatch_thickness = float(item[2])
+        if len(item) >= 4:
+            zone.hatch_gap = float(item[3])
+
+    def _parse_connect_pads(self, zone: Zone, item: List[Any]) -> None:
+        """Set the thermal relief gap from the pad clearance."""
+        connect_elem = self._find_element(item, "clearance")
+        if connect_elem:
+            zone.thermal_relief_gap = float(connect_elem[1])
+
+    def _parse_min_thickness(self, zone: Zone, item: List[Any]) -> None:
+        """Set the minimum fill thickness."""
+        zone.min_thickness = float(item[1])
+
+    def _parse_filled_areas_thickness(self, zone: Zone, item: List[Any]) -> None:
+        """Set whether the zone is filled."""
+        zone.filled = item[1] != "no"
+
+    def _parse_fill(self, zone: Zone, item: List[Any]) -> None:
+        """Set the thermal relief gap and bridge width."""
+        thermal_gap = self._find_element(item, "thermal_gap")
+        if thermal_gap:
+            zone.thermal_relief_gap = float(thermal_gap[1])
+        thermal_bridge = self._find_element(item, "thermal_bridge_width")
+        if thermal_bridge:
+            zone.thermal_relief_bridge = float(thermal_bridge[1])
+
+    def _parse_polygon(self, zone: Zone, item: List[Any]) -> None:
+        """Append the outline points."""
+        pts_elem = self._find_element(item, "pts")
+        if pts_elem:
+            zone.polygon.extend(
+                Point(float(pt[1]), float(pt[2]))
+                for pt in self._find_all_elements(pts_elem, "xy")
+            )
@@ -0,0 +1,139 @@
+"""
+Fast S-expression reader for KiCad files.
+
+Produces exactly what ``sexpdata.loads`` produces (nested lists, ``Symbol``
+atoms, ints, floats and strings) but tokenizes with a single regular
+expression instead of sexpdata's character-by-character scanner, and
+creates each distinct atom and string once per file: the thousands of
+``at``, ``layer`` and ``uuid`` symbols in a board share one object each.
+Numbers in the usual decimal forms are recognised up front rather than by
+catching the ValueError from ``int()``, since most coordinates in a board
+are distinct and never come from the cache.
+
+Only the subset of the syntax that KiCad writes is handled here. Anything
+else (quote characters, ``[...]`` brackets, comments, escapes outside
+strings) and any malformed input is handed to ``sexpdata.loads``, so
+results and errors always match it.
+"""
+
+import re
+from typing import Any, Dict, List
+
+import sexpdata
+
+# sexpdata splits atoms on these exact characters, not on Unicode whitespace
+_WHITESPACE = " \t\n\r\x0b\x0c"
+
+# Open paren, close paren, complete string, atom, or a stray quote
+_TOKEN_RE = re.compile(
+    rf'\(|\)|"(?:[^"\\]|\\.)*"|[^{_WHITESPACE}()"]+|"', re.DOTALL
+)
+
+# Atom characters this reader leaves to sexpdata
+_UNSUPPORTED_ATOM_RE = re.compile(r"[\[\];\\]|^'")
+
+# Tokens int() and float() are certain to accept, checked in that order
+_INT_RE = re.compile(r"[-+]?[0-9]+")
+_FLOAT_RE = re.compile(r"[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?")
+
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+_UNESCAPED = {
+    "\\": "\\",
+    '"': '"',
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class _Unsupported(Exception):
+    """Raised internally to fall back to sexpdata."""
+
+
+def _unescape(match: "re.Match") -> str:
+    char = match.group(1)
+    return _UNESCAPED.get(char, match.group(0))
+
+
+def _atom(token: str) -> Any:
+    """Convert an atom the way sexpdata.Parser.atom does, or raise _Unsupported."""
+    if _INT_RE.fullmatch(token):
+        return int(token)
+    if _FLOAT_RE.fullmatch(token):
+        return float(token)
+    if _UNSUPPORTED_ATOM_RE.search(token):
+        raise _Unsupported
+    if token == "t":
+        return True
+    try:
+        return int(token)
+    except ValueError:
+        try:
+            return float(token)
+        except ValueError:
+            return sexpdata.Symbol(token)
+
+
+# Cache entries for the parentheses, so every token is looked up exactly once
+_OPEN = object()
+_CLOSE = object()
+
+
+def _read(content: str) -> Any:
+    stack: List[List[Any]] = []
+    current: List[Any] = []
+    # Strings are cached with their quotes, so never collide with symbols
+    atoms: Dict[str, Any] = {"(": _OPEN, ")": _CLOSE}
+
+    for token in _TOKEN_RE.findall(content):
+        value = atoms.get(token)
+        if value is _OPEN:
+            stack.append(current)
+            current = []
+        elif value is _CLOSE:
+            if not stack:
+                raise _Unsupported
+            parent = stack.pop()
+            parent.append(current)
+            current = parent
+        elif value is not None:
+            current.append(value)
+        elif token[0] == '"':
+            if len(token) == 1:
+                raise _Unsupported
+            value = token[1:-1]
+            if "\\" in value:
+                value = _ESCAPE_RE.sub(_unescape, value)
+            atoms[token] = value
+            current.append(value)
+        elif token == "nil":
+            # A fresh empty list each time, never shared
+            current.append([])
+        else:
+            value = atoms[token] = _atom(token)
+            current.append(value)
+
+    if stack or len(current) != 1:
+        raise _Unsupported
+    return current[0]
+
+
+def parse_sexp(content: str) -> Any:
+    """
+    Parse one S-expression, such as the contents of a .kicad_pcb file.
+
+    Args:
+        content: S-expression text
+
+    Returns:
+        The parsed expression, identical to ``sexpdata.loads(content)``
+
+    Raises:
+        Whatever ``sexpdata.loads`` raises for malformed input
+    """
+    try:
+        return _read(content)
+    except _Unsupported:
+        return sexpdata.loads(content)
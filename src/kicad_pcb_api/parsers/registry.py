@@ -82,34 +82,46 @@ class ParserRegistry:
         Returns:
             Parsed element data or None if parsing failed
         """
+        # Called once per top-level element of a board, so the debug messages
+        # are only formatted when debug logging is on
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+
         if not element or not isinstance(element, list):
-            self._logger.debug("Invalid element: not a list or empty")
+            if debug:
+                self._logger.debug("Invalid element: not a list or empty")
             return None
 
-        element_type = element[0] if element else None
+        element_type = element[0]
         # Convert sexpdata.Symbol to string for lookup
         element_type_str = str(element_type) if element_type else None
         if not element_type_str:
-            self._logger.debug(f"Invalid element type: {element_type}")
+            if debug:
+                self._logger.debug(f"Invalid element type: {element_type}")
             return None
 
         # Try specific parser first
         parser = self._parsers.get(element_type_str)
         if parser:
-            self._logger.debug(
-                f"Using registered parser for element type: {element_type_str}"
-            )
+            if debug:
+                self._logger.debug(
+                    f"Using registered parser for element type: {element_type_str}"
+                )
             return parser.parse(element)
 
         # Try fallback parser
         if self._fallback_parser:
-            self._logger.debug(
-                f"Using fallback parser for unknown element type: {element_type_str}"
-            )
+            if debug:
+                self._logger.debug(
+                    "Using fallback parser for unknown element type: "
+                    f"{element_type_str}"
+                )
             return self._fallback_parser.parse(element)
 
         # No parser available
-        self._logger.debug(f"No parser available for element type: {element_type_str}")
+        if debug:
+            self._logger.debug(
+                f"No parser available for element type: {element_type_str}"
+            )
         return None
 
     def parse_elements(self, elements: List[List[Any]]) -> List[Any]:
@@ -122,11 +134,9 @@ class ParserRegistry:
         Returns:
             List of parsed element data (excluding failed parses)
         """
-        results = []
-        for element in elements:
-            parsed = self.parse_element(element)
-            if parsed is not None:
-                results.append(parsed)
+        results = [
+            parsed for parsed in map(self.parse_element, elements) if parsed is not None
+        ]
 
         self._logger.debug(f"Parsed {len(results)} of {len(elements)} elements")
         return results
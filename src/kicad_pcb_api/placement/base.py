@@ -11,7 +11,15 @@ from .courtyard_collision import CourtyardCollisionDetector
 
 
 class ComponentWrapper:
-    """Wrapper around footprint with placement-specific methods."""
+    """Wrapper around footprint with placement-specific methods.
+
+    Slotted because placers create one per component; the courtyard
+    detector is stateless at zero spacing and shared by all instances.
+    """
+
+    __slots__ = ("footprint", "_bbox_cache", "_original_bbox_cache")
+
+    _courtyard_detector = CourtyardCollisionDetector()
 
     def __init__(self, *args, **kwargs):
         """
@@ -97,7 +105,7 @@ class ComponentWrapper:
             )
 
         self._bbox_cache = None
-        self._courtyard_detector = CourtyardCollisionDetector()
+        self._original_bbox_cache = None
 
     @property
     def reference(self) -> str:
@@ -124,10 +132,7 @@ class ComponentWrapper:
     @property
     def original_bbox(self) -> BoundingBox:
         """Get the original (non-inflated) bounding box of the component."""
-        if (
-            not hasattr(self, "_original_bbox_cache")
-            or self._original_bbox_cache is None
-        ):
+        if self._original_bbox_cache is None:
             self._calculate_bbox()
             self._original_bbox_cache = self._bbox_cache
         return self._original_bbox_cache
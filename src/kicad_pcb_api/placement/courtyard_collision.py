@@ -12,6 +12,11 @@ from typing import List, Optional, Tuple, Union
 
 from ..core.types import Footprint, Line, Point, Rectangle
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -328,22 +333,40 @@ class CourtyardCollisionDetector:
         """Calculate bounding box from footprint elements."""
         points = []
 
-        # Add pad corners
-        for pad in footprint.pads:
-            half_width = pad.size[0] / 2
-            half_height = pad.size[1] / 2
-
-            # Pad corners in local coordinates
-            corners = [
-                (pad.position.x - half_width, pad.position.y - half_height),
-                (pad.position.x + half_width, pad.position.y - half_height),
-                (pad.position.x + half_width, pad.position.y + half_height),
-                (pad.position.x - half_width, pad.position.y + half_height),
-            ]
+        # Add pad corners. Only the extremes matter for the box, so with
+        # numpy the pads contribute just their two outermost corners.
+        if np is not None and footprint.pads:
+            pads = footprint.pad_arrays()
+            half_width = pads.width / 2
+            half_height = pads.height / 2
+            points.append(
+                (
+                    float((pads.x - half_width).min()),
+                    float((pads.y - half_height).min()),
+                )
+            )
+            points.append(
+                (
+                    float((pads.x + half_width).max()),
+                    float((pads.y + half_height).max()),
+                )
+            )
+        else:
+            for pad in footprint.pads:
+                half_width = pad.size[0] / 2
+                half_height = pad.size[1] / 2
+
+                # Pad corners in local coordinates
+                corners = [
+                    (pad.position.x - half_width, pad.position.y - half_height),
+                    (pad.position.x + half_width, pad.position.y - half_height),
+                    (pad.position.x + half_width, pad.position.y + half_height),
+                    (pad.position.x - half_width, pad.position.y + half_height),
+                ]
 
-            # Rotate corners if pad has rotation
-            # (Note: individual pad rotation is not common but possible)
-            points.extend(corners)
+                # Rotate corners if pad has rotation
+                # (Note: individual pad rotation is not common but possible)
+                points.extend(corners)
 
         # Add line endpoints
         for line in footprint.lines:
@@ -387,19 +410,29 @@ class CourtyardCollisionDetector:
         poly1 = self.get_footprint_polygon(footprint1)
         poly2 = self.get_footprint_polygon(footprint2)
 
-        # Quick check using bounding boxes first
-        bbox1 = poly1.get_bounding_box()
-        bbox2 = poly2.get_bounding_box()
-
         logger.debug(
             f"Checking collision between {footprint1.reference} and {footprint2.reference}"
         )
-        logger.debug(
-            f"  {footprint1.reference} bbox: ({bbox1[0]:.2f}, {bbox1[1]:.2f}) to ({bbox1[2]:.2f}, {bbox1[3]:.2f})"
-        )
-        logger.debug(
-            f"  {footprint2.reference} bbox: ({bbox2[0]:.2f}, {bbox2[1]:.2f}) to ({bbox2[2]:.2f}, {bbox2[3]:.2f})"
-        )
+        return self.check_polygon_collision(poly1, poly2)
+
+    def check_polygon_collision(self, poly1: Polygon, poly2: Polygon) -> bool:
+        """
+        Check if two already-transformed courtyard polygons collide.
+
+        Lets callers that test many pairs transform each courtyard once
+        instead of once per pair. A bounding-box test rejects distant pairs
+        before the polygon test runs.
+
+        Args:
+            poly1: First courtyard, at its board position
+            poly2: Second courtyard, at its board position
+
+        Returns:
+            True if the polygons collide (including spacing), False otherwise
+        """
+        # Quick check using bounding boxes first
+        bbox1 = poly1.get_bounding_box()
+        bbox2 = poly2.get_bounding_box()
 
         # Inflate bboxes by spacing
         half_spacing = self.spacing / 2
@@ -485,11 +518,25 @@ class CourtyardCollisionDetector:
         # Store original position
         original_pos = footprint.position
 
+        # The placed courtyards do not move during the search, so transform
+        # them once instead of once per candidate position
+        placed_polygons = [
+            self.get_footprint_polygon(placed) for placed in placed_footprints
+        ]
+
+        def is_valid() -> bool:
+            polygon = self.get_footprint_polygon(footprint)
+            for placed_polygon in placed_polygons:
+                if self.check_polygon_collision(polygon, placed_polygon):
+                    return False
+            return board_outline is None or all(
+                board_outline.contains_point(x, y) for x, y in polygon.vertices
+            )
+
         # Check ideal position first
         footprint.position = Point(ideal_x, ideal_y)
-        if not self.check_collision_with_placed(footprint, placed_footprints):
-            if board_outline is None or self._is_inside_board(footprint, board_outline):
-                return ideal_x, ideal_y
+        if is_valid():
+            return ideal_x, ideal_y
 
         # Spiral search
         angle = 0.0
@@ -503,13 +550,10 @@ class CourtyardCollisionDetector:
 
             footprint.position = Point(x, y)
 
-            if not self.check_collision_with_placed(footprint, placed_footprints):
-                if board_outline is None or self._is_inside_board(
-                    footprint, board_outline
-                ):
-                    # Restore original position before returning
-                    footprint.position = original_pos
-                    return x, y
+            if is_valid():
+                # Restore original position before returning
+                footprint.position = original_pos
+                return x, y
 
             # Update spiral
             angle += angle_step
@@ -0,0 +1,339 @@
+"""
+Numba kernels for placement geometry.
+
+Inputs are contiguous float64 arrays (structure of arrays) so the loops
+compile to tight native code. See :mod:`kicad_pcb_api.utils.jit` for how the
+kernels degrade when Numba is not installed. Importing this module imports
+Numba, so callers import it lazily.
+
+Polygons are (n, 2) vertex arrays. The geometry mirrors
+``CourtyardCollisionDetector`` operation for operation so that both paths
+agree on borderline cases.
+"""
+
+import math
+
+from ..utils.jit import jit_kernel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
+
+# Bit flags returned per component by validate_placement_kernel
+EDGE_VIOLATION = 1
+ROTATION_VIOLATION = 2
+
+
+@jit_kernel
+def aabb_pair_filter(min_x, min_y, max_x, max_y):
+    """Find every pair of overlapping axis-aligned boxes.
+
+    Touching edges count as overlapping, matching
+    ``CourtyardCollisionDetector._bboxes_overlap``. Boxes are swept in order
+    of ``min_x`` and each one is only compared with the boxes that start
+    before it ends, so evenly spread parts cost O(n log n) rather than
+    O(n^2). The pair buffer doubles when full, so the sweep runs once.
+
+    Args:
+        min_x, min_y, max_x, max_y: Box extents, one entry per box
+
+    Returns:
+        int64 array of shape (k, 2) holding (i, j) index pairs with i < j,
+        in row-major pair order
+    """
+    n = min_x.shape[0]
+    order = np.argsort(min_x)
+
+    pairs = np.empty((max(16, 4 * n), 2), dtype=np.int64)
+    count = 0
+    for a in range(n):
+        i = order[a]
+        for b in range(a + 1, n):
+            j = order[b]
+            if min_x[j] > max_x[i]:
+                break
+            if max_y[i] < min_y[j] or max_y[j] < min_y[i]:
+                continue
+            if count == pairs.shape[0]:
+                grown = np.empty((2 * count, 2), dtype=np.int64)
+                grown[:count] = pairs
+                pairs = grown
+            pairs[count, 0] = min(i, j)
+            pairs[count, 1] = max(i, j)
+            count += 1
+
+    pairs = pairs[:count]
+    return pairs[np.argsort(pairs[:, 0] * n + pairs[:, 1])]
+
+
+@jit_kernel
+def _normalize(x, y):
+    """Unit vector along (x, y), or (0, 0) for a zero vector."""
+    length = math.sqrt(x**2 + y**2)
+    if length == 0:
+        return 0.0, 0.0
+    return x / length, y / length
+
+
+@jit_kernel
+def inflate_polygon(verts, distance):
+    """Offset polygon vertices outward along their averaged edge normals.
+
+    Mirrors ``CourtyardCollisionDetector._inflate_polygon``; vertices must be
+    in counter-clockwise order.
+    """
+    n = verts.shape[0]
+    out = verts.copy()
+    if distance <= 0 or n < 3:
+        return out
+
+    for i in range(n):
+        prev_i = (i - 1) % n
+        next_i = (i + 1) % n
+        prev_nx, prev_ny = _normalize(
+            -(verts[i, 1] - verts[prev_i, 1]), verts[i, 0] - verts[prev_i, 0]
+        )
+        next_nx, next_ny = _normalize(
+            -(verts[next_i, 1] - verts[i, 1]), verts[next_i, 0] - verts[i, 0]
+        )
+        avg_x, avg_y = _normalize((prev_nx + next_nx) / 2, (prev_ny + next_ny) / 2)
+        out[i, 0] = verts[i, 0] + avg_x * distance
+        out[i, 1] = verts[i, 1] + avg_y * distance
+    return out
+
+
+@jit_kernel
+def _has_separating_axis(edges, a, b):
+    """True if an edge normal of ``edges`` separates polygons ``a`` and ``b``."""
+    n = edges.shape[0]
+    for i in range(n):
+        j = (i + 1) % n
+        normal_x = -(edges[j, 1] - edges[i, 1])
+        normal_y = edges[j, 0] - edges[i, 0]
+        length = math.sqrt(normal_x**2 + normal_y**2)
+        if length <= 0:
+            continue
+        axis_x = normal_x / length
+        axis_y = normal_y / length
+
+        a_min = math.inf
+        a_max = -math.inf
+        for k in range(a.shape[0]):
+            proj = a[k, 0] * axis_x + a[k, 1] * axis_y
+            a_min = min(a_min, proj)
+            a_max = max(a_max, proj)
+        b_min = math.inf
+        b_max = -math.inf
+        for k in range(b.shape[0]):
+            proj = b[k, 0] * axis_x + b[k, 1] * axis_y
+            b_min = min(b_min, proj)
+            b_max = max(b_max, proj)
+
+        if a_max < b_min or b_max < a_min:
+            return True
+    return False
+
+
+@jit_kernel
+def polygons_intersect(a, b):
+    """Separating Axis Theorem test for two convex polygons."""
+    return not (_has_separating_axis(a, a, b) or _has_separating_axis(b, a, b))
+
+
+@jit_kernel
+def contains_point(verts, x, y):
+    """Ray-casting point-in-polygon test, as in ``Polygon.contains_point``."""
+    n = verts.shape[0]
+    inside = False
+    xinters = 0.0
+
+    p1x = verts[0, 0]
+    p1y = verts[0, 1]
+    for i in range(1, n + 1):
+        p2x = verts[i % n, 0]
+        p2y = verts[i % n, 1]
+        if y > min(p1y, p2y):
+            if y <= max(p1y, p2y):
+                if x <= max(p1x, p2x):
+                    if p1y != p2y:
+                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    if p1x == p2x or x <= xinters:
+                        inside = not inside
+        p1x = p2x
+        p1y = p2y
+    return inside
+
+
+@jit_kernel
+def _position_is_free(
+    x, y, local_verts, spacing, other_verts, other_offsets, other_boxes, board_verts
+):
+    """Check one candidate position against every placed footprint and the board."""
+    n = local_verts.shape[0]
+    verts = local_verts.copy()
+    for i in range(n):
+        verts[i, 0] = local_verts[i, 0] + x
+        verts[i, 1] = local_verts[i, 1] + y
+
+    half_spacing = spacing / 2
+    min_x = verts[:, 0].min() - half_spacing
+    min_y = verts[:, 1].min() - half_spacing
+    max_x = verts[:, 0].max() + half_spacing
+    max_y = verts[:, 1].max() + half_spacing
+    inflated = inflate_polygon(verts, half_spacing)
+
+    for k in range(other_boxes.shape[0]):
+        if (
+            max_x < other_boxes[k, 0]
+            or other_boxes[k, 2] < min_x
+            or max_y < other_boxes[k, 1]
+            or other_boxes[k, 3] < min_y
+        ):
+            continue
+        other = other_verts[other_offsets[k]:other_offsets[k + 1]]
+        if polygons_intersect(inflated, other):
+            return False
+
+    if board_verts.shape[0] > 0:
+        for i in range(n):
+            if not contains_point(board_verts, verts[i, 0], verts[i, 1]):
+                return False
+    return True
+
+
+@jit_kernel
+def spiral_search(
+    ideal_x,
+    ideal_y,
+    search_radius,
+    search_step,
+    local_verts,
+    spacing,
+    other_verts,
+    other_offsets,
+    other_boxes,
+    board_verts,
+):
+    """Walk a spiral around the ideal position until a free spot is found.
+
+    Follows ``CourtyardCollisionDetector.find_valid_position``: the ideal
+    position first, then 16 angles per ring with the ring radius growing by
+    ``search_step``.
+
+    Args:
+        ideal_x, ideal_y: Ideal position
+        search_radius: Maximum ring radius (exclusive)
+        search_step: Ring radius increment
+        local_verts: Courtyard of the footprint being placed, rotated but
+            not translated, shape (n, 2)
+        spacing: Required spacing between courtyards
+        other_verts: Inflated courtyards of the placed footprints, stacked
+            into one (total, 2) array
+        other_offsets: int64 array of length m + 1; polygon k is
+            ``other_verts[other_offsets[k]:other_offsets[k + 1]]``
+        other_boxes: Inflated bounding boxes of the placed courtyards,
+            shape (m, 4) as (min_x, min_y, max_x, max_y)
+        board_verts: Board outline polygon, or an empty (0, 2) array for none
+
+    Returns:
+        (found, x, y)
+    """
+    if _position_is_free(
+        ideal_x,
+        ideal_y,
+        local_verts,
+        spacing,
+        other_verts,
+        other_offsets,
+        other_boxes,
+        board_verts,
+    ):
+        return True, ideal_x, ideal_y
+
+    angle = 0.0
+    radius = 0.0
+    angle_step = math.pi / 8
+
+    while radius < search_radius:
+        x = ideal_x + radius * math.cos(angle)
+        y = ideal_y + radius * math.sin(angle)
+        if _position_is_free(
+            x,
+            y,
+            local_verts,
+            spacing,
+            other_verts,
+            other_offsets,
+            other_boxes,
+            board_verts,
+        ):
+            return True, x, y
+
+        angle += angle_step
+        if angle >= 2 * math.pi:
+            angle -= 2 * math.pi
+            radius += search_step
+
+    return False, 0.0, 0.0
+
+
+@jit_kernel
+def validate_placement_kernel(
+    xs, ys, rotations, lo_x, hi_x, lo_y, hi_y, verts, offsets
+):
+    """Run all of PlacementManager.validate_placements' checks in one pass.
+
+    Args:
+        xs, ys, rotations: Footprint positions and rotations
+        lo_x, hi_x, lo_y, hi_y: Allowed position range (board edge minus
+            clearance)
+        verts, offsets: Courtyard polygons stacked as for ``spiral_search``,
+            with no spacing applied; pass a single zero offset to skip the
+            collision check
+
+    Returns:
+        (flags, collisions): int32 bit flags per footprint (EDGE_VIOLATION,
+        ROTATION_VIOLATION) and an int64 (k, 2) array of colliding index
+        pairs in row-major pair order
+    """
+    n = xs.shape[0]
+    flags = np.zeros(n, dtype=np.int32)
+    for i in range(n):
+        if xs[i] < lo_x or xs[i] > hi_x or ys[i] < lo_y or ys[i] > hi_y:
+            flags[i] |= EDGE_VIOLATION
+        if rotations[i] < 0 or rotations[i] >= 360:
+            flags[i] |= ROTATION_VIOLATION
+
+    m = offsets.shape[0] - 1
+    min_x = np.empty(m)
+    min_y = np.empty(m)
+    max_x = np.empty(m)
+    max_y = np.empty(m)
+    for k in range(m):
+        polygon = verts[offsets[k]:offsets[k + 1]]
+        min_x[k] = polygon[:, 0].min()
+        min_y[k] = polygon[:, 1].min()
+        max_x[k] = polygon[:, 0].max()
+        max_y[k] = polygon[:, 1].max()
+
+    candidates = aabb_pair_filter(min_x, min_y, max_x, max_y)
+    hits = np.zeros(candidates.shape[0], dtype=np.bool_)
+    count = 0
+    for c in range(candidates.shape[0]):
+        i = candidates[c, 0]
+        j = candidates[c, 1]
+        if polygons_intersect(
+            verts[offsets[i]:offsets[i + 1]], verts[offsets[j]:offsets[j + 1]]
+        ):
+            hits[c] = True
+            count += 1
+
+    collisions = np.empty((count, 2), dtype=np.int64)
+    k = 0
+    for c in range(candidates.shape[0]):
+        if hits[c]:
+            collisions[k, 0] = candidates[c, 0]
+            collisions[k, 1] = candidates[c, 1]
+            k += 1
+    return flags, collisions
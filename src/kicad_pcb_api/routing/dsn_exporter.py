@@ -15,9 +15,10 @@ import logging
 import math
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-from ..core.pcb_board import PCBBoard
+if TYPE_CHECKING:
+    from ..core.pcb_board import PCBBoard
 from ..core.types import Arc, Footprint, Layer, Line, Net, Pad, Point
 
 logger = logging.getLogger(__name__)
@@ -80,7 +81,7 @@ class DSNExporter:
     DEFAULT_VIA_SIZE = 0.8  # 31.5 mil
     DEFAULT_VIA_DRILL = 0.4  # 15.7 mil
 
-    def __init__(self, pcb_board: PCBBoard):
+    def __init__(self, pcb_board: "PCBBoard"):
         """
         Initialize the DSN exporter.
 
@@ -737,6 +738,8 @@ def export_pcb_to_dsn(pcb_path: Path, dsn_path: Path) -> None:
     if isinstance(dsn_path, str):
         dsn_path = Path(dsn_path)
 
+    from ..core.pcb_board import PCBBoard
+
     # Load the PCB
     board = PCBBoard(pcb_path)
 
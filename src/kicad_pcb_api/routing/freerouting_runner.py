@@ -86,6 +86,8 @@ class FreeroutingRunner:
         self._progress: float = 0.0
         self._status: str = "Not started"
         self._stop_event = threading.Event()
+        self._java_check: Optional[threading.Thread] = None
+        self._java_available: Optional[bool] = None
 
         # Find Freerouting JAR if not specified
         if not self.config.freerouting_jar:
@@ -120,6 +122,33 @@ class FreeroutingRunner:
         logger.error("Java runtime not found")
         return False
 
+    def start_java_check(self) -> None:
+        """
+        Start checking for the Java runtime in a background thread.
+
+        The check launches a JVM, so callers can overlap it with other work
+        (such as exporting the DSN file); route() waits for the result
+        instead of running the check again.
+        """
+        if self._java_check is None and self._java_available is None:
+            self._java_check = threading.Thread(
+                target=self._run_java_check, daemon=True
+            )
+            self._java_check.start()
+
+    def _run_java_check(self):
+        """Run the Java check and remember the result"""
+        self._java_available = self._check_java()
+
+    def _java_ready(self) -> bool:
+        """Result of the Java check, waiting for or running it as needed"""
+        if self._java_check is not None:
+            self._java_check.join()
+            self._java_check = None
+        if self._java_available is None:
+            self._java_available = self._check_java()
+        return self._java_available
+
     def _parse_progress(self, line: str) -> Optional[float]:
         """
         Parse progress from Freerouting output
@@ -225,7 +254,7 @@ class FreeroutingRunner:
         if not os.path.exists(self.config.freerouting_jar):
             return False, f"Freerouting JAR not found at: {self.config.freerouting_jar}"
 
-        if not self._check_java():
+        if not self._java_ready():
             return False, "Java runtime not found. Please install Java or specify path."
 
         # Default output file
@@ -0,0 +1,109 @@
+"""
+Numba kernels for routing checks.
+
+Inputs are contiguous float64/int64 arrays (structure of arrays), one entry
+per track. See :mod:`kicad_pcb_api.utils.jit` for how the kernels degrade
+when Numba is not installed. Importing this module imports Numba, so callers
+import it lazily.
+"""
+
+from ..utils.jit import jit_kernel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (``pip install kicad-pcb-api[fast]``)
+    np = None
+
+try:
+    from numba import prange
+except ImportError:  # plain range when the kernels run uncompiled
+    prange = range
+
+
+@jit_kernel
+def _sweep_track(
+    s, order, coords, min_x, min_y, max_x, max_y, layers, nets, limit,
+    out_i, out_j, out_a, out_b, out_d2, pos,
+):
+    """Test one track against the tracks after it in sweep order.
+
+    Counts the endpoint pairs closer than the clearance; when ``pos`` is not
+    negative they are also written to the output arrays starting there.
+    """
+    n = order.shape[0]
+    p = order[s]
+    count = 0
+    for t in range(s + 1, n):
+        q = order[t]
+        # Sorted by (layer, min_x): past this point nothing can overlap
+        if layers[q] != layers[p] or min_x[q] > max_x[p]:
+            break
+        if nets[q] == nets[p] or max_y[p] < min_y[q] or max_y[q] < min_y[p]:
+            continue
+
+        i = min(p, q)
+        j = max(p, q)
+        for a in range(2):
+            for b in range(2):
+                dx = coords[i, 2 * a] - coords[j, 2 * b]
+                dy = coords[i, 2 * a + 1] - coords[j, 2 * b + 1]
+                d2 = dx * dx + dy * dy
+                if d2 < limit:
+                    if pos >= 0:
+                        k = pos + count
+                        out_i[k] = i
+                        out_j[k] = j
+                        out_a[k] = a
+                        out_b[k] = b
+                        out_d2[k] = d2
+                    count += 1
+    return count
+
+
+@jit_kernel(parallel=True)
+def clearance_sweep(coords, min_x, min_y, max_x, max_y, layers, nets, order, limit):
+    """Find endpoints of different-net tracks on one layer closer than a clearance.
+
+    A sort-and-sweep broad phase over the tracks' inflated bounding boxes
+    (touching boxes count as overlapping) followed by the exact endpoint
+    test, parallel over tracks. Rows are counted first so the results can be
+    written in place without per-thread buffers.
+
+    Args:
+        coords: (n, 4) array of (start_x, start_y, end_x, end_y)
+        min_x, min_y, max_x, max_y: Track bounding boxes, inflated by half
+            the clearance
+        layers, nets: Integer layer and net codes per track
+        order: Track indices sorted by (layer, min_x)
+        limit: Squared clearance
+
+    Returns:
+        (i, j, a, b, d2) arrays, one entry per offending endpoint pair: track
+        indices with i < j, endpoint indices (0 = start, 1 = end) and the
+        squared distance, in no particular order
+    """
+    n = order.shape[0]
+    empty_i = np.empty(0, dtype=np.int64)
+    empty_d = np.empty(0, dtype=np.float64)
+
+    counts = np.zeros(n + 1, dtype=np.int64)
+    for s in prange(n):
+        counts[s + 1] = _sweep_track(
+            s, order, coords, min_x, min_y, max_x, max_y, layers, nets, limit,
+            empty_i, empty_i, empty_i, empty_i, empty_d, -1,
+        )
+    offsets = np.cumsum(counts)
+
+    total = offsets[n]
+    out_i = np.empty(total, dtype=np.int64)
+    out_j = np.empty(total, dtype=np.int64)
+    out_a = np.empty(total, dtype=np.int64)
+    out_b = np.empty(total, dtype=np.int64)
+    out_d2 = np.empty(total, dtype=np.float64)
+    for s in prange(n):
+        if counts[s + 1] > 0:
+            _sweep_track(
+                s, order, coords, min_x, min_y, max_x, max_y, layers, nets, limit,
+                out_i, out_j, out_a, out_b, out_d2, offsets[s],
+            )
+    return out_i, out_j, out_a, out_b, out_d2
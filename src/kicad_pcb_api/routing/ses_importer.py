@@ -10,10 +10,11 @@ import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from ..pcb_parser import PCBParser
+from ..core.pcb_parser import PCBParser
 from ..core.types import Point, Track, Via
+from ..utils.ids import new_uuid
 
 logger = logging.getLogger(__name__)
 
@@ -325,11 +326,13 @@ class SESParser:
             y = float(match.group(3)) / self.session.resolution
 
             # Try to find the net name from context
-            # Look backwards for the nearest network declaration
+            # Look backwards for the nearest network (or network_out net)
             pos = match.start()
             net_search = self.content[:pos]
-            net_match = re.findall(r'\(network\s+"([^"]+)"', net_search)
-            net_name = net_match[-1] if net_match else ""
+            net_match = re.findall(
+                r'\((?:network|net)\s+(?:"([^"]+)"|([^\s()]+))', net_search
+            )
+            net_name = "".join(net_match[-1]) if net_match else ""
 
             via = SESVia(net_name=net_name, position=(x, y), padstack=padstack)
             self.session.add_via(via)
@@ -360,6 +363,15 @@ class SESImporter:
         "4": "In4.Cu",
     }
 
+    # Millimetres per SES unit; parsed coordinates are in the session's unit
+    MM_PER_UNIT = {
+        "um": 0.001,
+        "mm": 1.0,
+        "cm": 10.0,
+        "mil": 0.0254,
+        "inch": 25.4,
+    }
+
     def __init__(self, pcb_file: str, ses_file: str):
         """
         Initialize the SES importer.
@@ -373,6 +385,32 @@ class SESImporter:
         self.parser = PCBParser()
         self.board = None
         self.net_map = {}  # Map net names to net codes
+        self.session: Optional[RoutingSession] = None
+
+    def parse(self, board_data: Optional[Dict[str, Any]] = None) -> RoutingSession:
+        """
+        Parse the PCB file (for its net names) and the SES file.
+
+        Call this before iter_tracks() and iter_vias().
+
+        Args:
+            board_data: Already parsed board data (``PCBBoard.pcb_data``) to
+                take the net names from instead of reading pcb_file
+
+        Returns:
+            RoutingSession object containing all routing data
+        """
+        # Parse PCB file
+        if board_data is None:
+            board_data = self.parser.parse_file(self.pcb_file)
+        self.board = board_data
+
+        # Build net name to code mapping
+        self._build_net_map()
+
+        # Parse SES file
+        self.session = SESParser(str(self.ses_file)).parse()
+        return self.session
 
     def import_routing(self, output_file: Optional[str] = None) -> str:
         """
@@ -386,24 +424,22 @@ class SESImporter:
         """
         logger.info(f"Importing routing from {self.ses_file} to {self.pcb_file}")
 
-        # Parse PCB file
-        self.board = self.parser.parse_file(self.pcb_file)
-
-        # Build net name to code mapping
-        self._build_net_map()
+        self.parse()
 
         # Remove existing tracks and vias
         self._remove_existing_routing()
 
-        # Parse SES file
-        ses_parser = SESParser(str(self.ses_file))
-        session = ses_parser.parse()
-
         # Import wires as tracks
-        self._import_wires(session.wires)
+        tracks = list(self.iter_tracks())
+        if tracks:
+            self.board["tracks"].extend(tracks)
+            logger.info(f"Imported {len(tracks)} track segments")
 
         # Import vias
-        self._import_vias(session.vias)
+        vias = list(self.iter_vias())
+        if vias:
+            self.board["vias"].extend(vias)
+            logger.info(f"Imported {len(vias)} vias")
 
         # Write output file
         if not output_file:
@@ -446,17 +482,32 @@ class SESImporter:
 
         logger.debug("Removed existing routing")
 
-    def _import_wires(self, wires: List[Wire]):
-        """Import wires as PCB tracks."""
-        tracks = []
-
-        for wire in wires:
-            # Get net code - try with and without quotes
-            net_name = wire.net_name.strip('"')
+    def _net_code(self, net_name: str) -> int:
+        """Look up a net code by name, with and without quotes (0 if unknown)."""
+        net_code = self.net_map.get(net_name.strip('"'), 0)
+        if net_code == 0:
+            # Try with the original name (with quotes if present)
             net_code = self.net_map.get(net_name, 0)
-            if net_code == 0:
-                # Try with the original name (with quotes if present)
-                net_code = self.net_map.get(wire.net_name, 0)
+        return net_code
+
+    def _mm_per_unit(self) -> float:
+        """Get the factor converting parsed SES coordinates to millimetres."""
+        scale = self.MM_PER_UNIT.get(self.session.unit)
+        if scale is None:
+            logger.warning(f"Unknown SES unit '{self.session.unit}', assuming um")
+            scale = self.MM_PER_UNIT["um"]
+        return scale
+
+    def iter_tracks(self) -> Iterator[Track]:
+        """
+        Yield the parsed wires as tracks in millimetres, one per wire segment.
+
+        Wires on unknown nets are skipped with a warning. Each track gets a
+        fresh UUID so the batch can go straight into a TrackCollection.
+        """
+        scale = self._mm_per_unit()
+        for wire in self.session.wires:
+            net_code = self._net_code(wire.net_name)
             if net_code == 0:
                 logger.warning(f"Unknown net: {wire.net_name}")
                 continue
@@ -469,35 +520,26 @@ class SESImporter:
                 start = wire.points[i]
                 end = wire.points[i + 1]
 
-                # The coordinates from the parser are in micrometers after dividing by resolution
-                # Convert from micrometers to nanometers (KiCad's internal units)
-                track = Track(
-                    start=Point(start[0] * 1000, start[1] * 1000),
-                    end=Point(end[0] * 1000, end[1] * 1000),
-                    width=wire.width * 1000,
+                yield Track(
+                    start=Point(start[0] * scale, start[1] * scale),
+                    end=Point(end[0] * scale, end[1] * scale),
+                    width=wire.width * scale,
                     layer=layer,
                     net=net_code,
                     net_name=wire.net_name,
+                    uuid=new_uuid(),
                 )
 
-                tracks.append(track)
-
-        # Add tracks to board
-        if tracks:
-            self.board["tracks"].extend(tracks)
-            logger.info(f"Imported {len(tracks)} track segments")
-
-    def _import_vias(self, vias: List[SESVia]):
-        """Import vias into the PCB."""
-        pcb_vias = []
+    def iter_vias(self) -> Iterator[Via]:
+        """
+        Yield the parsed vias as PCB vias in millimetres.
 
-        for via in vias:
-            # Get net code - try with and without quotes
-            net_name = via.net_name.strip('"')
-            net_code = self.net_map.get(net_name, 0)
-            if net_code == 0:
-                # Try with the original name (with quotes if present)
-                net_code = self.net_map.get(via.net_name, 0)
+        Vias on unknown nets are skipped with a warning. Each via gets a
+        fresh UUID so the batch can go straight into a ViaCollection.
+        """
+        scale = self._mm_per_unit()
+        for via in self.session.vias:
+            net_code = self._net_code(via.net_name)
             if net_code == 0:
                 logger.warning(f"Unknown net for via: {via.net_name}")
                 continue
@@ -512,23 +554,15 @@ class SESImporter:
                 size = float(padstack_match.group(1)) / 1000.0  # Convert to mm
                 drill = float(padstack_match.group(2)) / 1000.0
 
-            # The coordinates from the parser are in micrometers after dividing by resolution
-            # Convert from micrometers to nanometers (KiCad's internal units)
-            pcb_via = Via(
-                position=Point(via.position[0] * 1000, via.position[1] * 1000),
-                size=size * 1000,
-                drill=drill * 1000,
+            yield Via(
+                position=Point(via.position[0] * scale, via.position[1] * scale),
+                size=size,
+                drill=drill,
                 layers=["F.Cu", "B.Cu"],  # Default to through via
                 net=net_code,
+                uuid=new_uuid(),
             )
 
-            pcb_vias.append(pcb_via)
-
-        # Add vias to board
-        if pcb_vias:
-            self.board["vias"].extend(pcb_vias)
-            logger.info(f"Imported {len(pcb_vias)} vias")
-
 
 def import_ses_to_pcb(
     pcb_file: str, ses_file: str, output_file: Optional[str] = None
@@ -0,0 +1,46 @@
+"""
+Fast random UUID strings for new board elements.
+
+Parsers give every element without a uuid a fresh one, and routing creates
+tracks in bulk, so these are generated far more often than ``uuid.uuid4``
+is designed for: most of its cost is building and formatting the UUID
+object, not reading the random bytes. The strings produced here are
+version 4 UUIDs in the usual 8-4-4-4-12 form, exactly like
+``str(uuid.uuid4())``.
+
+Random bytes always come straight from ``os.urandom``; nothing is pooled,
+so forked worker processes never hand out the same values.
+"""
+
+import os
+from typing import List
+
+# Version (4) and variant (RFC 4122) bits of a random UUID
+_CLEAR_BITS = ~((0xF000 << 64) | (0xC000 << 48)) & ((1 << 128) - 1)
+_SET_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+
+def _format(value: int) -> str:
+    h = "%032x" % (value & _CLEAR_BITS | _SET_BITS)
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def new_uuid() -> str:
+    """Generate a random (version 4) UUID string."""
+    return _format(int.from_bytes(os.urandom(16), "big"))
+
+
+def new_uuids(count: int) -> List[str]:
+    """Generate random (version 4) UUID strings from a single os.urandom call.
+
+    Args:
+        count: Number of UUIDs
+
+    Returns:
+        List of UUID strings
+    """
+    raw = os.urandom(16 * count)
+    return [
+        _format(int.from_bytes(raw[i : i + 16], "big"))
+        for i in range(0, 16 * count, 16)
+    ]
@@ -0,0 +1,47 @@
+"""
+Optional Numba JIT compilation for numeric kernels.
+
+Kernels are written in the Numba-compatible subset of Python and decorated
+with :func:`jit_kernel`. When Numba is installed (``pip install
+kicad-pcb-api[fast]``) they are compiled on their first call; otherwise the
+plain Python function is left in place, so callers should check
+``NUMBA_AVAILABLE`` and take a non-kernel path when it is False.
+
+Decorating imports Numba, which costs far more than importing this package,
+so modules holding kernels should themselves be imported lazily, from inside
+the function that needs them.
+"""
+
+import importlib.util
+from typing import Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def jit_kernel(func: Optional[F] = None, *, parallel: bool = False):
+    """Wrap a function with ``numba.njit(cache=True)`` when Numba is installed.
+
+    Kernels may call other kernels. Compilation happens on the first call for
+    each argument type signature and is cached on disk. Use as ``@jit_kernel``
+    or, for kernels with ``prange`` loops, ``@jit_kernel(parallel=True)``.
+
+    Args:
+        func: Numba-compatible function taking NumPy arrays and scalars
+        parallel: Compile ``prange`` loops to run on multiple threads
+
+    Returns:
+        The Numba dispatcher, or ``func`` itself when Numba is not installed.
+        The original function stays reachable as ``py_func`` either way.
+    """
+    if func is None:
+        return lambda f: jit_kernel(f, parallel=parallel)
+
+    if not NUMBA_AVAILABLE:
+        func.py_func = func
+        return func
+
+    from numba import njit
+
+    return njit(cache=True, parallel=parallel)(func)
@@ -86,4 +86,4 @@ class ElementWrapper(ABC, Generic[T]):
     def _invalidate_indexes(self) -> None:
         """Invalidate parent collection indexes."""
         if self._collection is not None:
-            self._collection._dirty_indexes = True
+            self._collection._mark_indexes_dirty()
@@ -1,6 +1,6 @@
 """Wrapper class for footprint elements."""
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 from ..core.exceptions import ReferenceError, ValidationError
 from ..core.types import Footprint, Point
@@ -200,6 +200,25 @@ class FootprintWrapper(ElementWrapper[Footprint]):
         self._invalidate_indexes()
         self._mark_modified()
 
+    @property
+    def locked(self) -> bool:
+        """Get whether the footprint is locked in place.
+
+        Returns:
+            True if locked
+        """
+        return self._data.locked
+
+    @locked.setter
+    def locked(self, value: bool) -> None:
+        """Lock or unlock the footprint.
+
+        Args:
+            value: New lock state
+        """
+        self._data.locked = value
+        self._mark_modified()
+
     @property
     def pads(self) -> List[Any]:
         """Get the footprint pads.
@@ -209,6 +228,17 @@ class FootprintWrapper(ElementWrapper[Footprint]):
         """
         return self._data.pads
 
+    def get_pad(self, number: Union[str, int]) -> Optional[Any]:
+        """Get a pad by number, comparing numbers as strings.
+
+        Args:
+            number: Pad number (e.g. "1" or 1)
+
+        Returns:
+            The pad, or None if the footprint has no such pad
+        """
+        return self._data.get_pad(number)
+
     @property
     def nets(self) -> List[int]:
         """Get all unique net numbers from pads.
@@ -63,6 +63,7 @@ class TrackWrapper(ElementWrapper[Track]):
                 value=point,
             )
         self._data.start = point
+        self._invalidate_indexes()
         self._mark_modified()
 
     @property
@@ -88,6 +89,7 @@ class TrackWrapper(ElementWrapper[Track]):
                 value=point,
             )
         self._data.end = point
+        self._invalidate_indexes()
         self._mark_modified()
 
     @property
@@ -221,6 +223,7 @@ class TrackWrapper(ElementWrapper[Track]):
         """
         self._data.start = Point(self._data.start.x + dx, self._data.start.y + dy)
         self._data.end = Point(self._data.end.x + dx, self._data.end.y + dy)
+        self._invalidate_indexes()
         self._mark_modified()
 
     def is_horizontal(self, tolerance: float = 0.001) -> bool:
@@ -270,6 +273,7 @@ class TrackWrapper(ElementWrapper[Track]):
     def reverse(self) -> None:
         """Reverse the track direction (swap start and end)."""
         self._data.start, self._data.end = self._data.end, self._data.start
+        self._invalidate_indexes()
         self._mark_modified()
 
     def __repr__(self) -> str:
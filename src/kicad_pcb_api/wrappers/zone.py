@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from ..core.exceptions import ValidationError
 from ..core.types import Point, Zone
+from ..core.validation import COPPER_LAYERS
 from .base import ElementWrapper
 
 if TYPE_CHECKING:
@@ -60,42 +61,7 @@ class ZoneWrapper(ElementWrapper[Zone]):
             ValidationError: If layer is invalid
         """
         # Validate layer is a copper layer
-        valid_copper_layers = [
-            "F.Cu",
-            "B.Cu",
-            "In1.Cu",
-            "In2.Cu",
-            "In3.Cu",
-            "In4.Cu",
-            "In5.Cu",
-            "In6.Cu",
-            "In7.Cu",
-            "In8.Cu",
-            "In9.Cu",
-            "In10.Cu",
-            "In11.Cu",
-            "In12.Cu",
-            "In13.Cu",
-            "In14.Cu",
-            "In15.Cu",
-            "In16.Cu",
-            "In17.Cu",
-            "In18.Cu",
-            "In19.Cu",
-            "In20.Cu",
-            "In21.Cu",
-            "In22.Cu",
-            "In23.Cu",
-            "In24.Cu",
-            "In25.Cu",
-            "In26.Cu",
-            "In27.Cu",
-            "In28.Cu",
-            "In29.Cu",
-            "In30.Cu",
-        ]
-
-        if value not in valid_copper_layers:
+        if value not in COPPER_LAYERS:
             raise ValidationError(
                 f"Zone layer must be a copper layer, got: '{value}'",
                 field="layer",
@@ -49,6 +49,11 @@ class TestManagerCollectionIntegration:
         pcb2 = PCBBoard(str(file_path))
         assert len(list(pcb2.footprints)) == 4
 
+        # Step 7: Managers see the reloaded data, not the empty initial board
+        assert pcb2.validation.validate_references() == 0
+        assert pcb2.net._pcb_data is pcb2.pcb_data
+        assert len(pcb2.drc._pcb_data["footprints"]) == 4
+
     def test_placement_manager_circle_layout(self):
         """Test circular placement via placement manager."""
         pcb = PCBBoard()
@@ -133,6 +138,172 @@ class TestManagerCollectionIntegration:
         assert len(errors) >= 1  # Narrow track
         assert len(warnings) >= 1  # Wide track
 
+        # The violations list is a copy; editing it leaves the partitions intact
+        pcb.drc.violations.clear()
+        assert len(pcb.drc.violations) == violations
+        assert pcb.drc.get_errors() == errors
+
+    def test_drc_vectorized_checks_match_scalar(self, monkeypatch):
+        """Test the NumPy DRC prefilter reports the same violations."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.managers import drc as drc_module
+
+        pcb = PCBBoard()
+        for i in range(drc_module.VECTORIZE_THRESHOLD * 2):
+            width = (0.05, 0.25, 15.0)[i % 3]
+            pcb.pcb_data["tracks"].append(
+                Track(Point(i, 0), Point(i, 10), width, "F.Cu", uuid=f"track{i}")
+            )
+            size, drill = ((0.1, 0.05), (0.8, 0.4), (0.5, 0.6))[i % 3]
+            pcb.pcb_data["vias"].append(
+                Via(Point(i, 20), size, drill, ["F.Cu", "B.Cu"], uuid=f"via{i}")
+            )
+
+        vectorized_count = pcb.check_drc()
+        vectorized = [
+            (v.type, v.element1_uuid, v.description) for v in pcb.drc.violations
+        ]
+
+        monkeypatch.setattr(drc_module, "np", None)
+        scalar_count = pcb.check_drc()
+        scalar = [(v.type, v.element1_uuid, v.description) for v in pcb.drc.violations]
+
+        assert vectorized_count == scalar_count > 0
+        assert vectorized == scalar
+
+    def test_drc_clearance_between_nets(self):
+        """Test clearance check flags close copper on different nets only."""
+        pcb = PCBBoard()
+        pcb.pcb_data["tracks"].extend([
+            Track(Point(0, 0), Point(10, 0), 0.25, "F.Cu", net=1, uuid="a"),
+            # 0.15mm edge-to-edge gap to "a", different net
+            Track(Point(0, 0.4), Point(10, 0.4), 0.25, "F.Cu", net=2, uuid="b"),
+            # Same gap but same net as "a"
+            Track(Point(0, -0.4), Point(10, -0.4), 0.25, "F.Cu", net=1, uuid="c"),
+            # Overlaps "a" in plan view but on the other side of the board
+            Track(Point(0, 0.2), Point(10, 0.2), 0.25, "B.Cu", net=3, uuid="d"),
+            # Far away
+            Track(Point(50, 50), Point(60, 50), 0.25, "F.Cu", net=4, uuid="e"),
+        ])
+        pcb.pcb_data["vias"].append(
+            Via(Point(10.5, 0.2), 0.6, 0.3, ["F.Cu", "B.Cu"], net=5, uuid="v")
+        )
+
+        count = pcb.drc.check_clearance(min_clearance=0.2)
+
+        pairs = {
+            frozenset((v.element1_uuid, v.element2_uuid))
+            for v in pcb.drc.violations
+            if v.type == "clearance"
+        }
+        assert count == len(pairs)
+        assert frozenset(("a", "b")) in pairs
+        assert frozenset(("a", "c")) not in pairs
+        assert frozenset(("a", "d")) not in pairs
+        assert frozenset(("b", "v")) in pairs
+        assert frozenset(("d", "v")) in pairs
+        assert not any("e" in pair for pair in pairs)
+        assert len(pcb.drc.get_errors()) == count
+
+    def test_drc_clearance_follows_pad_shape_and_rotation(self):
+        """Test rectangular pad corners and pad rotation count towards clearance."""
+        from kicad_pcb_api.core.types import Footprint, Pad
+
+        pcb = PCBBoard()
+        footprint = Footprint(
+            library="Test", name="Pads", position=Point(0, 0), reference="U1", uuid="fp"
+        )
+        footprint.pads = [
+            # Square pad: its corner at (0.5, 0.5) is 0.18mm from via "corner"
+            Pad(
+                "1", "smd", "rect", Point(0, 0), (1.0, 1.0), ["F.Cu"], net=1, uuid="sq"
+            ),
+            # Long pad turned upright: its end is 0.15mm from via "end"
+            Pad(
+                "2",
+                "smd",
+                "rect",
+                Point(5, 0),
+                (2.0, 0.5),
+                ["F.Cu"],
+                net=2,
+                uuid="rot",
+                rotation=90,
+            ),
+        ]
+        pcb.pcb_data["footprints"].append(footprint)
+        pcb.pcb_data["vias"].extend([
+            Via(Point(0.7, 0.7), 0.2, 0.1, ["F.Cu", "B.Cu"], net=3, uuid="corner"),
+            Via(Point(5, 1.25), 0.2, 0.1, ["F.Cu", "B.Cu"], net=3, uuid="end"),
+        ])
+
+        count = pcb.drc.check_all()
+
+        pairs = {
+            frozenset((v.element1_uuid, v.element2_uuid))
+            for v in pcb.drc.violations
+            if v.type == "clearance"
+        }
+        assert pairs == {frozenset(("sq", "corner")), frozenset(("rot", "end"))}
+        assert count == len(pcb.drc.violations)
+
+    def test_drc_via_clearance_same_with_and_without_kdtree(self, monkeypatch):
+        """Test the KD-tree via-to-via pairs match the box index pairs."""
+        import random
+
+        from kicad_pcb_api.managers import drc as drc_module
+
+        rng = random.Random(7)
+        pcb = PCBBoard()
+        for i in range(300):
+            pcb.pcb_data["vias"].append(
+                Via(
+                    Point(rng.uniform(0, 20), rng.uniform(0, 20)),
+                    rng.choice((0.4, 0.6, 0.8)),
+                    0.2,
+                    ["F.Cu", "B.Cu"],
+                    net=rng.randint(1, 5),
+                    uuid=f"v{i}",
+                )
+            )
+            pcb.pcb_data["tracks"].append(
+                Track(
+                    Point(rng.uniform(0, 20), rng.uniform(0, 20)),
+                    Point(rng.uniform(0, 20), rng.uniform(0, 20)),
+                    0.25,
+                    "F.Cu",
+                    net=rng.randint(1, 5),
+                    uuid=f"t{i}",
+                )
+            )
+
+        def clearance_pairs():
+            pcb.drc.clear_violations()
+            pcb.drc.check_clearance(0.2)
+            return sorted(
+                tuple(sorted((v.element1_uuid, v.element2_uuid)))
+                for v in pcb.drc.violations
+            )
+
+        with_tree = clearance_pairs()
+        monkeypatch.setattr(drc_module, "cKDTree", None)
+        without_tree = clearance_pairs()
+
+        assert with_tree == without_tree
+        assert any(a.startswith("v") and b.startswith("v") for a, b in with_tree)
+
+    def test_pad_rotation_round_trips(self, tmp_path):
+        """Test pad orientation is read from and written to the board file."""
+        pcb = PCBBoard()
+        pcb.add_footprint("R1", "Resistor_SMD:R_0603_1608Metric", 10, 10)
+        pcb.pcb_data["footprints"][0].pads[0].rotation = 90.0
+        pcb.save(tmp_path / "rotated.kicad_pcb")
+
+        reloaded = PCBBoard(str(tmp_path / "rotated.kicad_pcb"))
+
+        pads = reloaded.pcb_data["footprints"][0].pads
+        assert [pad.rotation for pad in pads] == [90.0] + [0.0] * (len(pads) - 1)
+
     def test_validation_duplicate_references(self):
         """Test validation catches duplicate references."""
         pcb = PCBBoard()
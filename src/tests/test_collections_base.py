@@ -305,6 +305,18 @@ class TestIndexedCollectionStatistics:
 
         assert collection.is_modified is False
 
+    def test_version_counts_changes_across_mark_clean(self):
+        """Test version increases on every change and survives mark_clean."""
+        collection = TestItemCollection()
+        start = collection.version
+
+        collection.add(TestItem("uuid1", "test", 42))
+        collection.mark_clean()
+        after_add = collection.version
+        collection.remove("uuid1")
+
+        assert start < after_add < collection.version
+
 
 class TestIndexedCollectionEdgeCases:
     """Test edge cases and error conditions."""
@@ -59,6 +59,38 @@ class TestTrackCollectionBasics:
         with pytest.raises(ValueError, match="already exists"):
             collection.add(track2)
 
+    def test_extend_adds_tracks_in_order(self):
+        """Test adding a batch of tracks at once."""
+        collection = TrackCollection()
+        tracks = [
+            Track(start=Point(i, 0.0), end=Point(i + 1.0, 0.0), width=0.25,
+                  layer="F.Cu", net=1, uuid=f"track-uuid-{i}")
+            for i in range(3)
+        ]
+
+        added = collection.extend(iter(tracks))
+
+        assert added == tracks
+        assert list(collection) == tracks
+        assert collection.get("track-uuid-2") is tracks[2]
+        assert len(collection.filter_by_net(1)) == 3
+
+    def test_extend_rejects_duplicates_atomically(self):
+        """Test a batch with a duplicate UUID adds nothing."""
+        collection = TrackCollection([
+            Track(start=Point(0.0, 0.0), end=Point(1.0, 0.0), width=0.25,
+                  layer="F.Cu", uuid="track-uuid-1"),
+        ])
+        fresh = Track(start=Point(0.0, 1.0), end=Point(1.0, 1.0), width=0.25,
+                      layer="F.Cu", uuid="track-uuid-2")
+
+        with pytest.raises(ValueError, match="already exists"):
+            collection.extend([fresh, fresh])
+        with pytest.raises(ValueError, match="already exists"):
+            collection.extend([fresh, collection[0]])
+
+        assert len(collection) == 1
+
 
 class TestTrackCollectionNetIndex:
     """Test net-based indexing."""
@@ -371,6 +403,165 @@ class TestTrackCollectionLength:
         assert abs(total_length - 15.0) < 0.001
 
 
+class TestTrackCollectionArrays:
+    """Test the structure-of-arrays view."""
+
+    def _collection(self):
+        """Create a two-track collection (a 3-4-5 track and a 2mm no-net track)."""
+        return TrackCollection([
+            Track(start=Point(0.0, 0.0), end=Point(3.0, 4.0), width=0.25,
+                  layer="F.Cu", net=1, uuid="track-uuid-1"),
+            Track(start=Point(1.0, 1.0), end=Point(1.0, 3.0), width=0.5,
+                  layer="B.Cu", net=None, uuid="track-uuid-2"),
+        ])
+
+    def test_arrays_match_tracks(self):
+        """Test the arrays hold each track's fields in collection order."""
+        pytest.importorskip("numpy")
+        arrays = self._collection().arrays()
+
+        assert arrays.start_x.tolist() == [0.0, 1.0]
+        assert arrays.end_y.tolist() == [4.0, 3.0]
+        assert arrays.width.tolist() == [0.25, 0.5]
+        assert arrays.length.tolist() == pytest.approx([5.0, 2.0])
+        assert arrays.net.tolist() == [1, -1]
+        assert [arrays.layer_names[i] for i in arrays.layer] == ["F.Cu", "B.Cu"]
+        assert arrays.uuids == ["track-uuid-1", "track-uuid-2"]
+
+    def test_arrays_are_cached_until_changed(self, monkeypatch):
+        """Test the arrays are reused, and rebuilt after adds and wrapper edits."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.wrappers.track import TrackWrapper
+
+        collection = self._collection()
+        arrays = collection.arrays()
+
+        def fail(tracks):
+            raise AssertionError("tracks re-read for a cached view")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(TrackCollection, "_track_rows", staticmethod(fail))
+            assert collection.arrays() is arrays
+
+        TrackWrapper(collection[0], collection).end = Point(6.0, 8.0)
+        assert collection.arrays().length[0] == pytest.approx(10.0)
+
+        collection.clear()
+        assert len(collection.arrays().length) == 0
+
+    def test_arrays_follow_tracks_edited_directly(self):
+        """Test direct edits to Track objects are picked up after mark_modified()."""
+        pytest.importorskip("numpy")
+        collection = self._collection()
+        arrays = collection.arrays()
+
+        track = collection.get("track-uuid-1")
+        track.end = Point(6.0, 8.0)
+        track.net = 7
+        collection[1].start.y = 0.0
+        assert collection.arrays() is arrays
+
+        collection.mark_modified()
+        updated = collection.arrays()
+        assert updated is not arrays
+        assert updated.length.tolist() == pytest.approx([10.0, 3.0])
+        assert updated.net.tolist() == [7, -1]
+        assert collection.get_total_length_by_net(7) == pytest.approx(10.0)
+        assert collection.find_shorter_than(5.0) == ["track-uuid-2"]
+
+    def test_added_tracks_are_appended_to_arrays(self):
+        """Test add() and extend() extend the cached arrays to match a fresh build."""
+        pytest.importorskip("numpy")
+        collection = self._collection()
+        collection.arrays()
+
+        collection.add(Track(start=Point(0.0, 0.0), end=Point(1.0, 0.0), width=0.25,
+                             layer="In1.Cu", net=2, uuid="track-uuid-3"))
+        collection.extend([
+            Track(start=Point(2.0, 0.0), end=Point(2.0, 2.0), width=0.25,
+                  layer="F.Cu", net=1, uuid="track-uuid-4"),
+        ])
+        appended = collection.arrays()
+        rebuilt = TrackCollection(list(collection)).arrays()
+
+        assert appended.uuids == rebuilt.uuids
+        assert appended.length.tolist() == rebuilt.length.tolist()
+        assert appended.net.tolist() == rebuilt.net.tolist()
+        assert [appended.layer_names[i] for i in appended.layer] == [
+            rebuilt.layer_names[i] for i in rebuilt.layer
+        ]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_find_shorter_than(self, monkeypatch, use_numpy):
+        """Test finding short tracks, in collection order, before and after an add."""
+        from kicad_pcb_api.collections import tracks as tracks_module
+
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(tracks_module, "np", None)
+
+        collection = self._collection()  # lengths 5.0 and 2.0
+        assert collection.find_shorter_than(2.0) == []
+        assert collection.find_shorter_than(5.0) == ["track-uuid-2"]
+        assert collection.find_shorter_than(5.5) == ["track-uuid-1", "track-uuid-2"]
+
+        collection.add(Track(start=Point(0.0, 0.0), end=Point(0.0, 1.0), width=0.25,
+                             layer="F.Cu", net=1, uuid="track-uuid-3"))
+        assert collection.find_shorter_than(2.5) == ["track-uuid-2", "track-uuid-3"]
+
+    def test_find_shorter_than_reuses_length_index(self):
+        """Test the length-sorted index is kept until the collection changes."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.wrappers.track import TrackWrapper
+
+        collection = self._collection()  # lengths 5.0 and 2.0
+        collection.find_shorter_than(3.0)
+        order = collection._length_order
+        assert collection.find_shorter_than(6.0) == ["track-uuid-1", "track-uuid-2"]
+        assert collection._length_order is order
+
+        TrackWrapper(collection[1], collection).end = Point(1.0, 9.0)
+        assert collection.find_shorter_than(6.0) == ["track-uuid-1"]
+        assert collection._length_order is not order
+
+    def test_reorder_permutes_tracks_and_arrays(self):
+        """Test reorder moves tracks and cached rows together, rejecting bad orders."""
+        pytest.importorskip("numpy")
+        collection = self._collection()  # lengths 5.0 and 2.0
+        collection.arrays()
+        collection.mark_clean()
+
+        collection.reorder([1, 0])
+
+        assert [t.uuid for t in collection] == ["track-uuid-2", "track-uuid-1"]
+        assert collection.arrays().length.tolist() == pytest.approx([2.0, 5.0])
+        assert collection.find_shorter_than(3.0) == ["track-uuid-2"]
+        assert collection.is_modified
+        with pytest.raises(ValueError):
+            collection.reorder([0, 0])
+
+    def test_length_totals_without_numpy(self, monkeypatch):
+        """Test length totals agree with and without numpy."""
+        from kicad_pcb_api.collections import tracks as tracks_module
+
+        collection = self._collection()
+        vectorized = (
+            collection.get_total_length_by_net(1),
+            collection.get_total_length_by_layer("B.Cu"),
+            collection.get_length_statistics(),
+        )
+
+        monkeypatch.setattr(tracks_module, "np", None)
+        scalar = (
+            collection.get_total_length_by_net(1),
+            collection.get_total_length_by_layer("B.Cu"),
+            collection.get_length_statistics(),
+        )
+
+        assert vectorized[:2] == pytest.approx(scalar[:2])
+        assert vectorized[2] == scalar[2]
+
 class TestTrackCollectionSearch:
     """Test advanced search capabilities."""
 
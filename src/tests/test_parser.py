@@ -469,3 +469,51 @@ def test_parse_pad_with_drill(parser):
     assert pad2.drill["shape"] == "oval"
     assert pad2.drill["width"] == 1.2
     assert pad2.drill["height"] == 0.8
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '(kicad_pcb (version 20241229) (net 0 "") (at 1.5 -2 90) '
+        '(x "a\\"b\\\\c\\n\\q"))',
+        "(a t nil 1e3 nan b\xa0c (nil) ((d)))",
+        "(n 5 -5 +5 007 5. .5 -.5e-3 1E+2 1_000 1_0.5 \u0661\u0662 "
+        "inf -Infinity 0x10 1e 1.2.3)",
+        '(s "F.Cu" "F.Cu" F.Cu "(" ")" "t" t)',
+        # Syntax KiCad never writes, handed to sexpdata
+        "(a 'b [c d] e\\ f ; comment\n g)",
+    ],
+)
+def test_parse_sexp_matches_sexpdata(content):
+    """Test the fast reader returns the same structure and types as sexpdata."""
+    import math
+
+    import sexpdata
+
+    from kicad_pcb_api.parsers.reader import parse_sexp
+
+    def assert_same(expected, actual):
+        assert type(actual) is type(expected)
+        if isinstance(expected, list):
+            assert len(actual) == len(expected)
+            for e, a in zip(expected, actual):
+                assert_same(e, a)
+        elif isinstance(expected, float) and math.isnan(expected):
+            assert math.isnan(actual)
+        else:
+            assert actual == expected
+
+    assert_same(sexpdata.loads(content), parse_sexp(content))
+
+
+@pytest.mark.parametrize("content", ['(a "b)', "(a))", "((a)", "(a) (b)"])
+def test_parse_sexp_malformed_raises_like_sexpdata(content):
+    """Test malformed input raises the same error type as sexpdata."""
+    import sexpdata
+
+    from kicad_pcb_api.parsers.reader import parse_sexp
+
+    with pytest.raises(Exception) as expected:
+        sexpdata.loads(content)
+    with pytest.raises(type(expected.value)):
+        parse_sexp(content)
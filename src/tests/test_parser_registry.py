@@ -4,6 +4,8 @@ Tests for the parser registry system.
 Tests the modular parser architecture with element-specific parsers.
 """
 
+import logging
+
 import pytest
 
 from kicad_pcb_api.core.types import Footprint, Line, Net, Point, Track, Via, Zone
@@ -271,6 +273,27 @@ def test_parser_with_unknown_element():
     assert result is None
 
 
+def test_parser_registry_debug_logging(caplog):
+    """Test dispatch messages are logged only when debug logging is enabled."""
+    import sexpdata
+
+    registry = ParserRegistry()
+    registry.register("net", NetParser())
+    net_sexp = [sexpdata.Symbol("net"), 1, "GND"]
+
+    with caplog.at_level(logging.INFO, logger="kicad_pcb_api.parsers"):
+        assert registry.parse_element(net_sexp).name == "GND"
+    assert not caplog.records
+
+    with caplog.at_level(logging.DEBUG, logger="kicad_pcb_api.parsers"):
+        registry.parse_element(net_sexp)
+        registry.parse_element([sexpdata.Symbol("unknown_type")])
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Using registered parser for element type: net" in messages
+    assert "Successfully parsed net element" in messages
+    assert "No parser available for element type: unknown_type" in messages
+
+
 def test_footprint_parser_basic():
     """Test basic footprint parsing with registry."""
     registry = ParserRegistry()
@@ -298,3 +321,147 @@ def test_footprint_parser_basic():
     assert result.layer == "F.Cu"
     assert result.reference == "R1"
     assert result.value == "10k"
+
+
+def test_footprint_parser_children_keep_document_order():
+    """Test pads and properties parse in document order; first single wins."""
+    import sexpdata
+
+    S = sexpdata.Symbol
+    footprint_sexp = [
+        S("footprint"),
+        "Package_SO:SOIC-8",
+        [S("layer"), "B.Cu"],
+        [S("at"), 10.0, 20.0, 90.0],
+        [S("at"), 0.0, 0.0],
+        [S("descr"), "SOIC"],
+        [
+            S("property"),
+            "Reference",
+            "U1",
+            [S("at"), 0.0, -3.0],
+            [S("layer"), "F.SilkS"],
+        ],
+        [
+            S("pad"),
+            "2",
+            S("smd"),
+            S("rect"),
+            [S("at"), 1.0, 0.0],
+            [S("size"), 0.6, 1.5],
+            [S("net"), 2, "B"],
+        ],
+        [S("property"), "Value", "NE555", [S("at"), 0.0, 3.0], [S("layer"), "F.Fab"]],
+        [
+            S("pad"),
+            "1",
+            S("smd"),
+            S("rect"),
+            [S("at"), -1.0, 0.0],
+            [S("size"), 0.6, 1.5],
+            [S("net"), 1, "A"],
+        ],
+    ]
+
+    result = FootprintParser().parse(footprint_sexp)
+
+    assert result.position == Point(10.0, 20.0)
+    assert result.rotation == 90.0
+    assert result.layer == "B.Cu"
+    assert result.descr == "SOIC"
+    assert result.tags == ""
+    assert (result.reference, result.value) == ("U1", "NE555")
+    assert [p.number for p in result.pads] == ["2", "1"]
+    assert [p.net for p in result.pads] == [2, 1]
+    assert result.pads[1].position == Point(-1.0, 0.0)
+
+
+def test_footprint_parser_sub_elements_take_first_match():
+    """Test pad and graphic children resolve to their first occurrence."""
+    import sexpdata
+
+    S = sexpdata.Symbol
+    footprint_sexp = [
+        S("footprint"),
+        "Lib:X",
+        [S("at"), 0.0, 0.0],
+        [
+            S("fp_line"),
+            [],
+            [S("start"), 0.0, 0.0],
+            [S("end"), 1.0, 0.0],
+            [S("end"), 9.0, 9.0],
+            [S("stroke"), [S("width"), 0.12], [S("type"), S("solid")]],
+            [S("layer"), "F.SilkS"],
+        ],
+        [
+            S("pad"),
+            "1",
+            S("smd"),
+            S("rect"),
+            ["at", 5.0, 5.0],
+            [S("at"), 1.0, 2.0],
+            [S("at"), 3.0, 4.0],
+            [S("size"), 0.6, 1.5],
+            [S("uuid"), "pad-uuid"],
+        ],
+    ]
+
+    result = FootprintParser().parse(footprint_sexp)
+
+    assert result.lines[0].end == Point(1.0, 0.0)
+    assert result.lines[0].width == 0.12
+    assert result.pads[0].position == Point(1.0, 2.0)
+    assert result.pads[0].size == (0.6, 1.5)
+    assert result.pads[0].uuid == "pad-uuid"
+
+
+def test_footprint_parser_font_effects():
+    """Test property and text fonts parse, keeping defaults for missing values."""
+    import sexpdata
+
+    S = sexpdata.Symbol
+    footprint_sexp = [
+        S("footprint"),
+        "Lib:X",
+        [S("at"), 0.0, 0.0],
+        [S("property"), "Reference", "R1", [S("at"), 0.0, 0.0],
+         [S("effects"), [S("font"), [S("size"), 1.2, 0.8], [S("thickness"), 0.2]]]],
+        [S("fp_text"), S("user"), "note", [S("at"), 0.0, 0.0],
+         [S("effects"), [S("justify"), S("left")], [S("font"), [S("size"), 0.5, 0.5]]]],
+    ]
+
+    result = FootprintParser().parse(footprint_sexp)
+
+    assert (result.properties[0].size, result.properties[0].thickness) == (
+        (1.2, 0.8),
+        0.2,
+    )
+    assert (result.texts[0].size, result.texts[0].thickness) == ((0.5, 0.5), 0.15)
+
+
+def test_missing_uuids_get_fresh_version4_uuids():
+    """Test elements without a uuid get distinct, well-formed version 4 UUIDs."""
+    import uuid
+
+    import sexpdata
+
+    from kicad_pcb_api.utils.ids import new_uuids
+
+    S = sexpdata.Symbol
+    footprint_sexp = [
+        S("footprint"),
+        "Lib:X",
+        [S("at"), 0.0, 0.0],
+        [S("pad"), "1", S("smd"), S("rect"), [S("at"), 0.0, 0.0]],
+        [S("pad"), "2", S("smd"), S("rect"), [S("at"), 1.0, 0.0]],
+    ]
+
+    result = FootprintParser().parse(footprint_sexp)
+    generated = [result.uuid] + [pad.uuid for pad in result.pads] + new_uuids(3)
+
+    assert len(set(generated)) == len(generated)
+    for value in generated:
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert (parsed.version, parsed.variant) == (4, uuid.RFC_4122)
@@ -0,0 +1,35 @@
+"""
+Tests for the structural protocols and their cached check helpers.
+"""
+
+from kicad_pcb_api.core.types import Point, Track, Via
+from kicad_pcb_api.interfaces import (
+    PCBElement,
+    Routable,
+    is_pcb_element,
+    is_placeable,
+    is_routable,
+)
+from kicad_pcb_api.interfaces import protocols
+
+
+class TestProtocolHelpers:
+    """Test the memoized protocol checks."""
+
+    def test_helpers_match_isinstance(self):
+        track = Track(Point(0, 0), Point(1, 0), 0.25, "F.Cu", uuid="t1")
+        via = Via(Point(0, 0), 0.8, 0.4, ["F.Cu", "B.Cu"], uuid="v1")
+
+        for obj in (track, via, "not an element"):
+            assert is_pcb_element(obj) == isinstance(obj, PCBElement)
+            assert is_routable(obj) == isinstance(obj, Routable)
+
+        assert is_routable(track)
+        assert not is_placeable(track)
+
+    def test_result_is_cached_per_type(self):
+        track = Track(Point(0, 0), Point(1, 0), 0.25, "F.Cu")
+
+        is_routable(track)
+
+        assert protocols._protocol_cache[(Track, Routable)] is True
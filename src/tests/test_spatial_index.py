@@ -0,0 +1,55 @@
+"""
+Tests for the bounding-box spatial index.
+"""
+
+import pytest
+
+from kicad_pcb_api.core import spatial_index
+from kicad_pcb_api.core.geometry import BoundingBox
+from kicad_pcb_api.core.spatial_index import SpatialIndex
+
+
+def _backends():
+    backends = [False]
+    if spatial_index.rtree_index is not None:
+        backends.append(True)
+    return backends
+
+
+@pytest.mark.parametrize("use_rtree", _backends())
+class TestSpatialIndex:
+    """Test both index backends return the same answers."""
+
+    def test_query_finds_intersecting_boxes(self, use_rtree):
+        index = SpatialIndex(cell_size=1.0, use_rtree=use_rtree)
+        index.insert(0, BoundingBox(0, 0, 1, 1))
+        index.insert(1, BoundingBox(5, 5, 6, 6))
+        index.insert(2, BoundingBox(0.5, 0.5, 3, 3))
+
+        assert sorted(index.query(BoundingBox(0.9, 0.9, 1.1, 1.1))) == [0, 2]
+        assert index.query(BoundingBox(10, 10, 11, 11)) == []
+        assert len(index) == 3
+
+    def test_touching_boxes_intersect(self, use_rtree):
+        index = SpatialIndex(cell_size=0.5, use_rtree=use_rtree)
+        index.insert(0, BoundingBox(0, 0, 1, 1))
+
+        assert index.query(BoundingBox(1, 1, 2, 2)) == [0]
+
+    def test_candidate_pairs_yields_each_pair_once(self, use_rtree):
+        index = SpatialIndex(cell_size=0.25, use_rtree=use_rtree)
+        index.insert(0, BoundingBox(0, 0, 2, 2))
+        index.insert(1, BoundingBox(1, 1, 3, 3))
+        index.insert(2, BoundingBox(2.5, 2.5, 4, 4))
+        index.insert(3, BoundingBox(10, 10, 11, 11))
+
+        assert sorted(index.candidate_pairs()) == [(0, 1), (1, 2)]
+
+
+def test_forcing_missing_rtree_raises(monkeypatch):
+    monkeypatch.setattr(spatial_index, "rtree_index", None)
+
+    with pytest.raises(ImportError):
+        SpatialIndex(use_rtree=True)
+
+    assert SpatialIndex().backend == "grid"
@@ -13,7 +13,7 @@ import pytest
 
 from kicad_pcb_api.collections.footprints import FootprintCollection
 from kicad_pcb_api.core.exceptions import ReferenceError, ValidationError
-from kicad_pcb_api.core.types import Footprint, Point
+from kicad_pcb_api.core.types import Footprint, Pad, Point
 from kicad_pcb_api.wrappers.footprint import FootprintWrapper
 
 
@@ -278,6 +278,61 @@ class TestFootprintWrapperIndexUpdates:
         front_footprints = collection.filter_by_layer("F.Cu")
         assert len(front_footprints) == 0
 
+    def test_lock_change_updates_unlocked(self):
+        """Test that locking a footprint removes it from get_unlocked()."""
+        collection = FootprintCollection()
+        collection.add(create_test_footprint("R1"))
+        collection.add(create_test_footprint("R2", x=5.0))
+
+        assert [fp.reference for fp in collection.get_unlocked()] == ["R1", "R2"]
+        collection.mark_clean()
+
+        collection.get_by_reference("R1").locked = True
+
+        assert [fp.reference for fp in collection.get_unlocked()] == ["R2"]
+        assert collection.is_modified
+
+    def test_get_unlocked_sees_raw_footprint_lock_changes(self):
+        """Test get_unlocked() follows locked set on the Footprint, not the wrapper."""
+        raw = create_test_footprint("R1")
+        collection = FootprintCollection([raw, create_test_footprint("R2", x=5.0)])
+        assert [fp.reference for fp in collection.get_unlocked()] == ["R1", "R2"]
+
+        raw.locked = True
+
+        assert [fp.reference for fp in collection.get_unlocked()] == ["R2"]
+
+    def test_get_pad_follows_pad_list_changes(self):
+        """Test pad lookup by number tracks pads added, replaced and renumbered."""
+        fp = create_test_footprint("R1")
+        fp.pads = [
+            Pad(
+                number=str(n),
+                type="smd",
+                shape="rect",
+                position=Point(n, 0),
+                size=(1, 1),
+            )
+            for n in (1, 2)
+        ]
+        wrapper = FootprintWrapper(fp, FootprintCollection())
+
+        assert wrapper.get_pad(2) is fp.pads[1]
+        assert wrapper.get_pad("3") is None
+
+        fp.pads.append(
+            Pad(number="3", type="smd", shape="rect", position=Point(3, 0), size=(1, 1))
+        )
+        fp.pads[1] = Pad(
+            number="2", type="smd", shape="rect", position=Point(9, 0), size=(1, 1)
+        )
+        fp.pads[0].number = "4"
+
+        assert wrapper.get_pad("3") is fp.pads[2]
+        assert wrapper.get_pad("2").position == Point(9, 0)
+        assert wrapper.get_pad("1") is None
+        assert set(fp.pads_by_number) == {"4", "2", "3"}
+
 
 class TestFootprintWrapperEdgeCases:
     """Test edge cases and error handling."""
@@ -306,3 +361,39 @@ class TestFootprintWrapperEdgeCases:
         assert "10.00" in repr_str
         assert "20.00" in repr_str
         assert "F.Cu" in repr_str
+
+
+def test_pad_arrays_match_pads_and_courtyard_fallback_bbox(monkeypatch):
+    """Test the pad array view and the bounding box it feeds with and without numpy."""
+    np = pytest.importorskip("numpy")
+    from kicad_pcb_api.placement import courtyard_collision
+    from kicad_pcb_api.placement.courtyard_collision import CourtyardCollisionDetector
+
+    fp = create_test_footprint("U1")
+    fp.pads = [
+        Pad(
+            number="1",
+            type="smd",
+            shape="rect",
+            position=Point(-2.0, 0.5),
+            size=(0.6, 1.5),
+        ),
+        Pad(
+            number="2",
+            type="smd",
+            shape="rect",
+            position=Point(3.0, -1.0),
+            size=(2.0, 0.4),
+        ),
+    ]
+
+    arrays = fp.pad_arrays()
+    assert arrays.x.tolist() == [-2.0, 3.0]
+    assert arrays.height.tolist() == [1.5, 0.4]
+    assert create_test_footprint("R1").pad_arrays().x.shape == (0,)
+
+    detector = CourtyardCollisionDetector()
+    vectorized = detector._calculate_footprint_bbox(fp)
+    monkeypatch.setattr(courtyard_collision, "np", None)
+    assert vectorized == pytest.approx(detector._calculate_footprint_bbox(fp))
+    assert vectorized == pytest.approx((-2.3, -1.2, 4.0, 1.25))
@@ -8,7 +8,7 @@ statistics, and net name management.
 from unittest.mock import Mock
 import pytest
 
-from kicad_pcb_api.managers.net import NetManager
+from kicad_pcb_api.managers.net import NetManager, NetStats
 from kicad_pcb_api.core.types import Point, Pad
 
 
@@ -87,6 +87,58 @@ class TestNetManager:
         assert nets == {1}
         assert None not in nets
 
+    def test_get_all_nets_is_cached_until_board_changes(self, net_manager, mock_board):
+        """Test get_all_nets reuses its cache and notices list changes."""
+        track = Mock()
+        track.net = 1
+        mock_board.pcb_data["tracks"] = [track]
+
+        assert net_manager.get_all_nets() == {1}
+
+        # In-place net changes need an explicit invalidation
+        track.net = 2
+        assert net_manager.get_all_nets() == {1}
+        net_manager.invalidate_cache()
+        assert net_manager.get_all_nets() == {2}
+
+        # Adding elements is picked up automatically
+        via = Mock()
+        via.net = 3
+        mock_board.pcb_data["vias"].append(via)
+        assert net_manager.get_all_nets() == {2, 3}
+
+        # Callers get a copy they can modify safely
+        net_manager.get_all_nets().add(99)
+        assert 99 not in net_manager.get_all_nets()
+
+    def test_caches_follow_same_length_swap_on_real_board(self):
+        """Test replacing a track with one on another net refreshes the caches."""
+        from kicad_pcb_api.core.pcb_board import PCBBoard
+        from kicad_pcb_api.core.types import Net
+
+        board = PCBBoard()
+        old_track = board.add_track(0, 0, 5, 0, net=Net(5, "A"))
+        assert 5 in board.net.get_all_nets()
+        assert board.net.get_net_statistics()[5].track_count == 1
+
+        board.remove_track(old_track)
+        new_track = board.add_track(0, 0, 5, 0, net=Net(7, "B"))
+
+        nets = board.net.get_all_nets()
+        assert 7 in nets and 5 not in nets
+        stats = board.net.get_net_statistics()
+        assert 5 not in stats
+        assert stats[7].track_count == 1
+
+        # Renetting through the collection's wrapper bumps its version
+        (wrapper,) = board.tracks.filter_by_net(7)
+        wrapper.net = 9
+        assert 9 in board.net.get_all_nets()
+        assert 7 not in board.net.get_all_nets()
+
+        board.clear_tracks()
+        assert 9 not in board.net.get_all_nets()
+
     def test_get_net_name_finds_from_pads(self, net_manager, mock_board):
         """Test get_net_name finds net name from footprint pads."""
         footprint = Mock()
@@ -107,6 +159,31 @@ class TestNetManager:
 
         assert name is None
 
+    def test_get_net_name_prefers_pads_and_refreshes_after_rename(
+        self, net_manager, mock_board
+    ):
+        """Test get_net_name keeps pad precedence and reflects rename_net."""
+        footprint = Mock()
+        pad = Mock(spec=Pad)
+        pad.net = 7
+        pad.net_name = "SDA"
+        footprint.pads = [pad]
+
+        track = Mock()
+        track.net = 7
+        track.net_name = "TRACK_NAME"
+
+        mock_board.pcb_data["footprints"] = [footprint]
+        mock_board.pcb_data["tracks"] = [track]
+
+        assert net_manager.get_net_name(7) == "SDA"
+
+        count = net_manager.rename_net(7, "I2C_SDA")
+
+        assert count == 2
+        assert track.net_name == "I2C_SDA"
+        assert net_manager.get_net_name(7) == "I2C_SDA"
+
     def test_get_net_statistics_calculates_comprehensive_data(self, net_manager, mock_board):
         """Test get_net_statistics calculates all statistics correctly."""
         # Create footprint with pads on net 1
@@ -140,11 +217,99 @@ class TestNetManager:
         stats = net_manager.get_net_statistics()
 
         assert 1 in stats
-        assert stats[1]["name"] == "GND"
-        assert stats[1]["track_count"] == 2
-        assert stats[1]["via_count"] == 1
-        assert stats[1]["pad_count"] == 2
-        assert stats[1]["total_track_length"] == 10.0  # 5 + 5
+        assert isinstance(stats[1], NetStats)
+        assert stats[1]["track_count"] == stats[1].track_count  # dict-style access
+        assert stats[1].name == "GND"
+        assert stats[1].track_count == 2
+        assert stats[1].via_count == 1
+        assert stats[1].pad_count == 2
+        assert stats[1].total_track_length == 10.0  # 5 + 5
+        assert stats[1] == {
+            "name": "GND",
+            "track_count": 2,
+            "via_count": 1,
+            "pad_count": 2,
+            "total_track_length": 10.0,
+        }
+        assert stats[1].get("missing") is None
+        assert "keys" not in stats[1]
+
+    def test_get_net_statistics_buckets_multiple_nets(self, net_manager, mock_board):
+        """Test get_net_statistics attributes each element to its own net."""
+        footprint = Mock()
+        pad1 = Mock(spec=Pad)
+        pad1.net = 1
+        pad1.net_name = "GND"
+        pad2 = Mock(spec=Pad)
+        pad2.net = 2
+        pad2.net_name = "VCC"
+        pad3 = Mock(spec=Pad)
+        pad3.net = None
+        pad3.net_name = None
+        footprint.pads = [pad1, pad2, pad3]
+
+        track1 = Mock()
+        track1.net = 1
+        track1.start = Point(0, 0)
+        track1.end = Point(3, 4)  # Length = 5
+        track2 = Mock()
+        track2.net = 2
+        track2.start = Point(0, 0)
+        track2.end = Point(6, 8)  # Length = 10
+
+        via = Mock()
+        via.net = 2
+
+        net = Mock()
+        net.number = 3
+
+        mock_board.pcb_data["nets"] = [net]
+        mock_board.pcb_data["footprints"] = [footprint]
+        mock_board.pcb_data["tracks"] = [track1, track2]
+        mock_board.pcb_data["vias"] = [via]
+
+        stats = net_manager.get_net_statistics()
+
+        assert set(stats) == {1, 2, 3}
+        assert stats[1].name == "GND"
+        assert stats[1].track_count == 1
+        assert stats[1].via_count == 0
+        assert stats[1].total_track_length == 5.0
+        assert stats[2].name == "VCC"
+        assert stats[2].via_count == 1
+        assert stats[2].total_track_length == 10.0
+        assert stats[3].pad_count == 0
+        assert stats[3].track_count == 0
+
+    def test_get_net_statistics_vectorized_matches_scalar(
+        self, net_manager, mock_board, monkeypatch
+    ):
+        """Test the NumPy track-length path agrees with the pure-Python path."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.managers import net as net_module
+
+        tracks = []
+        for i in range(net_module.VECTORIZE_TRACK_THRESHOLD + 10):
+            track = Mock()
+            track.net = None if i % 7 == 0 else i % 3 + 1
+            track.net_name = f"N{track.net}" if track.net else None
+            track.start = Point(float(i), 0.0)
+            track.end = Point(float(i) + 3.0, 4.0)
+            tracks.append(track)
+        mock_board.pcb_data["tracks"] = tracks
+
+        vectorized = net_manager.get_net_statistics()
+
+        monkeypatch.setattr(net_module, "np", None)
+        scalar = net_manager.get_net_statistics()
+
+        assert set(vectorized) == set(scalar) == {1, 2, 3}
+        for net, expected in scalar.items():
+            assert vectorized[net].name == expected.name
+            assert vectorized[net].track_count == expected.track_count
+            assert vectorized[net].total_track_length == pytest.approx(
+                expected.total_track_length
+            )
 
     def test_find_unconnected_pads_identifies_net_zero(self, net_manager, mock_board):
         """Test find_unconnected_pads identifies pads with net 0 or None."""
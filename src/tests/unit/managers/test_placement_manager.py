@@ -10,7 +10,8 @@ import pytest
 import math
 
 from kicad_pcb_api.managers.placement import PlacementManager
-from kicad_pcb_api.core.types import Point
+from kicad_pcb_api.core.types import Footprint, Point, Rectangle
+from kicad_pcb_api.placement.bbox import BoundingBox
 
 
 @pytest.fixture
@@ -97,6 +98,27 @@ class TestPlacementManager:
 
         assert count == 2  # Only R1 and R3 placed
 
+    def test_place_in_grid_vectorized_matches_scalar(
+        self, placement_manager, mock_board, monkeypatch
+    ):
+        """Test the NumPy grid coordinates agree with the pure-Python path."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.managers import placement as placement_module
+
+        references = [f"R{i}" for i in range(placement_module.VECTORIZE_THRESHOLD + 5)]
+        footprints = {ref: Mock(position=Point(0, 0)) for ref in references}
+        mock_board.footprints.get_by_reference = lambda ref: footprints.get(ref)
+
+        placement_manager.place_in_grid(references, 1.5, 2.5, 0.1, 0.3, 7)
+        vectorized = [footprints[ref].position for ref in references]
+
+        monkeypatch.setattr(placement_module, "np", None)
+        placement_manager.place_in_grid(references, 1.5, 2.5, 0.1, 0.3, 7)
+        scalar = [footprints[ref].position for ref in references]
+
+        assert vectorized == scalar
+        assert all(type(p.x) is float for p in vectorized)
+
     def test_place_in_circle_arranges_components_in_circle(self, placement_manager, mock_board):
         """Test place_in_circle arranges components in circular pattern."""
         # Create mock footprints
@@ -126,6 +148,29 @@ class TestPlacementManager:
         assert abs(footprints["R3"].position.x - 40.0) < 0.01
         assert abs(footprints["R3"].position.y - 50.0) < 0.01
 
+    def test_place_in_circle_vectorized_matches_scalar(
+        self, placement_manager, mock_board, monkeypatch
+    ):
+        """Test the NumPy trig tables agree with the pure-Python path."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.managers import placement as placement_module
+
+        references = [f"R{i}" for i in range(placement_module.VECTORIZE_THRESHOLD + 5)]
+        footprints = {ref: Mock(position=Point(0, 0), rotation=0) for ref in references}
+        mock_board.footprints.get_by_reference = lambda ref: footprints.get(ref)
+
+        placement_manager.place_in_circle(references, 50.0, 50.0, 10.0)
+        vectorized = [(fp.position, fp.rotation) for fp in footprints.values()]
+
+        monkeypatch.setattr(placement_module, "np", None)
+        placement_manager.place_in_circle(references, 50.0, 50.0, 10.0)
+        scalar = [(fp.position, fp.rotation) for fp in footprints.values()]
+
+        for (v_pos, v_rot), (s_pos, s_rot) in zip(vectorized, scalar):
+            assert v_pos.x == pytest.approx(s_pos.x)
+            assert v_pos.y == pytest.approx(s_pos.y)
+            assert v_rot == pytest.approx(s_rot)
+
     def test_place_in_circle_returns_zero_for_empty_list(self, placement_manager):
         """Test place_in_circle returns 0 for empty references list."""
         count = placement_manager.place_in_circle(
@@ -197,6 +242,34 @@ class TestPlacementManager:
         assert footprints["R2"].position.y == 25
         assert footprints["R3"].position.y == 15
 
+    def test_snap_to_grid_vectorized_matches_scalar(
+        self, placement_manager, mock_board, monkeypatch
+    ):
+        """Test the NumPy snapping path agrees with the pure-Python path."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.managers import placement as placement_module
+
+        n = placement_module.VECTORIZE_THRESHOLD + 5
+        start = {f"R{i}": Point(i * 0.37 - 3.1, i * 0.25 + 0.125) for i in range(n)}
+        footprints = {
+            ref: Mock(position=pos, locked=False) for ref, pos in start.items()
+        }
+        footprints["R3"].locked = True
+        mock_board.footprints.get_by_reference = lambda ref: footprints.get(ref)
+        references = list(start) + ["MISSING"]
+
+        assert placement_manager.snap_to_grid(references, 0.5, Point(0.1, 0.2)) == n - 1
+        vectorized = [fp.position for fp in footprints.values()]
+
+        for ref, pos in start.items():
+            footprints[ref].position = pos
+        monkeypatch.setattr(placement_module, "np", None)
+        placement_manager.snap_to_grid(references, 0.5, Point(0.1, 0.2))
+        scalar = [fp.position for fp in footprints.values()]
+
+        assert vectorized == scalar
+        assert footprints["R3"].position == start["R3"]
+
     def test_distribute_horizontally_spaces_evenly(self, placement_manager, mock_board):
         """Test distribute_horizontally spaces components evenly."""
         footprints = {
@@ -247,6 +320,32 @@ class TestPlacementManager:
         # X coordinates should remain unchanged
         assert all(fp.position.x == 25 for fp in footprints.values())
 
+    def test_distribute_vectorized_matches_scalar(
+        self, placement_manager, mock_board, monkeypatch
+    ):
+        """Test the NumPy linspace coordinates agree with the pure-Python path."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.managers import placement as placement_module
+
+        references = [f"R{i}" for i in range(placement_module.VECTORIZE_THRESHOLD + 5)]
+        footprints = {ref: Mock(position=Point(0, 0)) for ref in references}
+        mock_board.footprints.get_by_reference = lambda ref: footprints.get(ref)
+
+        placement_manager.distribute_horizontally(references, 1.5, 98.3)
+        placement_manager.distribute_vertically(references, -4.0, 7.1)
+        vectorized = [footprints[ref].position for ref in references]
+
+        monkeypatch.setattr(placement_module, "np", None)
+        placement_manager.distribute_horizontally(references, 1.5, 98.3)
+        placement_manager.distribute_vertically(references, -4.0, 7.1)
+        scalar = [footprints[ref].position for ref in references]
+
+        for v, s in zip(vectorized, scalar):
+            assert v.x == pytest.approx(s.x)
+            assert v.y == pytest.approx(s.y)
+        assert vectorized[-1] == Point(98.3, 7.1)
+        assert all(type(p.x) is float for p in vectorized)
+
     def test_distribute_returns_zero_for_less_than_two_components(self, placement_manager, mock_board):
         """Test distribute operations return 0 for < 2 components."""
         footprints = {"R1": Mock(position=Point(0, 0))}
@@ -257,3 +356,241 @@ class TestPlacementManager:
 
         assert count_h == 0
         assert count_v == 0
+
+    @pytest.mark.parametrize("backend", ["numba", "numpy", "python"])
+    def test_check_collisions_broad_phase_finds_all_overlaps(
+        self, placement_manager, mock_board, monkeypatch, backend
+    ):
+        """Test both broad phases (Numba kernel, spatial index) find every collision."""
+        _select_backend(monkeypatch, backend)
+
+        # A 6x6 grid of 2x2mm courtyards at 1.9mm pitch: neighbours overlap
+        footprints = [
+            _courtyard_footprint(f"U{i}", (i % 6) * 1.9, (i // 6) * 1.9)
+            for i in range(36)
+        ]
+        mock_board.footprints = _footprint_collection(footprints)
+
+        # 2 * 6 * 5 edge neighbours plus 2 * 5 * 5 diagonals
+        assert placement_manager.check_collisions(spacing=0.1) == 110
+
+    def test_check_collisions_stops_at_max_collisions(
+        self, placement_manager, mock_board
+    ):
+        """Test check_collisions stops counting once max_collisions is reached."""
+        footprints = [_courtyard_footprint(f"U{i}", i * 0.5, 0) for i in range(6)]
+        mock_board.footprints = _footprint_collection(footprints)
+
+        # Touching courtyards count, so every pair up to 2mm apart collides
+        assert placement_manager.check_collisions() == 14
+        assert placement_manager.check_collisions(max_collisions=3) == 3
+        assert placement_manager.check_collisions(max_collisions=0) == 0
+        assert placement_manager.check_collisions(max_collisions=-1) == 0
+
+    def test_check_and_validate_resolve_references_from_collection(
+        self, placement_manager, mock_board
+    ):
+        """Test referenced footprints are looked up in the board's collection."""
+        mock_board.footprints = _footprint_collection(
+            [
+                _courtyard_footprint("U1", 10, 10),
+                _courtyard_footprint("U2", 11, 10),
+                _courtyard_footprint("U3", 12, 10),
+            ]
+        )
+
+        assert placement_manager.check_collisions(references=["U1", "U2"]) == 1
+        assert placement_manager.validate_placements(
+            references=["U2", "U3", "U9"], board_outline=BoundingBox(0, 0, 100, 100)
+        ) == {"U2": ["Collision with U3"]}
+
+    @pytest.mark.parametrize("backend", ["numba", "numpy", "python"])
+    def test_validate_placements_reports_collisions_in_pair_order(
+        self, placement_manager, mock_board, monkeypatch, backend
+    ):
+        """Test collision errors come out in the same order as an all-pairs scan."""
+        _select_backend(monkeypatch, backend)
+        footprints = [
+            _courtyard_footprint("U1", 10, 10),
+            _courtyard_footprint("U2", 50, 50),
+            _courtyard_footprint("U3", 11, 10),
+            _courtyard_footprint("U4", 10, 11),
+        ]
+        mock_board.footprints = _footprint_collection(footprints)
+
+        errors = placement_manager.validate_placements(
+            board_outline=BoundingBox(0, 0, 100, 100)
+        )
+
+        assert errors == {
+            "U1": ["Collision with U3", "Collision with U4"],
+            "U3": ["Collision with U4"],
+        }
+
+    @pytest.mark.parametrize("backend", ["numba", "numpy", "python"])
+    def test_validate_placements_reports_edge_and_rotation_errors(
+        self, placement_manager, mock_board, monkeypatch, backend
+    ):
+        """Test per-component edge clearance and rotation checks."""
+        _select_backend(monkeypatch, backend)
+        footprints = [
+            _courtyard_footprint("U1", 1, 50),
+            _courtyard_footprint("U2", 50, 50),
+            _courtyard_footprint("U3", 50, 99),
+            _courtyard_footprint("U4", 70, 70),
+        ]
+        footprints[3].rotation = 400
+        footprints[1].rotation = -90
+        footprints.append(_courtyard_footprint("U5", 50.5, 99.5))
+        footprints[4].rotation = 360
+        mock_board.footprints = _footprint_collection(footprints)
+
+        errors = placement_manager.validate_placements(
+            board_outline=BoundingBox(0, 0, 100, 100)
+        )
+
+        edge = "Component too close to board edge (min clearance: 2.0mm)"
+        assert errors == {
+            "U1": [edge],
+            "U2": ["Invalid rotation: -90 (should be 0-360)"],
+            "U3": [edge, "Collision with U5"],
+            "U4": ["Invalid rotation: 400 (should be 0-360)"],
+            "U5": [edge, "Invalid rotation: 360 (should be 0-360)"],
+        }
+
+    @pytest.mark.parametrize(
+        "ideal, search_radius, outline",
+        [
+            (Point(10, 10), 50.0, None),
+            (Point(10, 10), 50.0, BoundingBox(0, 0, 30, 30)),
+            (Point(2, 2), 50.0, BoundingBox(0, 0, 30, 30)),
+            (Point(10, 10), 1.0, None),
+        ],
+    )
+    def test_find_valid_position_kernel_matches_detector(
+        self, placement_manager, mock_board, monkeypatch, ideal, search_radius, outline
+    ):
+        """Test the compiled spiral search lands where the Python search does."""
+        from kicad_pcb_api.managers import placement as placement_module
+
+        _select_backend(monkeypatch, "numba")
+        # A cluster of parts around (10, 10) that blocks the ideal spot
+        footprints = [
+            _courtyard_footprint(f"U{i}", 8 + (i % 3) * 2.5, 8 + (i // 3) * 2.5)
+            for i in range(9)
+        ]
+        footprints.append(_courtyard_footprint("NEW", 0, 0, size=3.0))
+        footprints[-1].rotation = 30.0
+        by_ref = {fp.reference: fp for fp in footprints}
+        mock_board.footprints = _footprint_collection(footprints)
+
+        compiled = placement_manager.find_valid_position(
+            "NEW", ideal, search_radius=search_radius, board_outline=outline
+        )
+        assert by_ref["NEW"].position == Point(0, 0)
+
+        monkeypatch.setattr(placement_module, "NUMBA_AVAILABLE", False)
+        python = placement_manager.find_valid_position(
+            "NEW", ideal, search_radius=search_radius, board_outline=outline
+        )
+
+        if python is None:
+            assert compiled is None
+        else:
+            assert compiled.x == pytest.approx(python.x)
+            assert compiled.y == pytest.approx(python.y)
+
+
+    @pytest.mark.parametrize("references", [None, ["R3", "R1", "R9", "R0", "R2"]])
+    def test_auto_place_takes_unlocked_footprints_from_collection(
+        self, placement_manager, mock_board, monkeypatch, references
+    ):
+        """Test auto_place hands the placer the unlocked footprints themselves."""
+        from kicad_pcb_api.managers import placement as placement_module
+
+        footprints = [_courtyard_footprint(f"R{i}", 0, 0) for i in range(4)]
+        footprints[1].locked = True
+        mock_board.footprints = _footprint_collection(footprints)
+
+        received = []
+
+        class RecordingPlacer:
+            def __init__(self, **kwargs):
+                pass
+
+            def place(self, components, connections, board_width, board_height):
+                received.extend(c.footprint for c in components)
+                return {c.reference: (c.position.x, c.position.y) for c in components}
+
+        monkeypatch.setattr(placement_module, "HierarchicalPlacer", RecordingPlacer)
+
+        count = placement_manager.auto_place(references=references)
+
+        assert count == 3
+        if references is None:
+            assert received == [footprints[0], footprints[2], footprints[3]]
+        else:
+            assert received == [footprints[3], footprints[0], footprints[2]]
+        assert all(type(fp) is Footprint for fp in received)
+
+    def test_small_boards_skip_numba_kernels(
+        self, placement_manager, mock_board, monkeypatch
+    ):
+        """Test boards below VECTORIZE_THRESHOLD stay on the Python loops."""
+        pytest.importorskip("numba")
+        from kicad_pcb_api.placement import kernels
+
+        def fail(*args):
+            raise AssertionError("Numba kernel used for a small board")
+
+        monkeypatch.setattr(kernels, "aabb_pair_filter", fail)
+        monkeypatch.setattr(kernels, "validate_placement_kernel", fail)
+        monkeypatch.setattr(PlacementManager, "_spiral_search_compiled", fail)
+        footprints = [_courtyard_footprint(f"U{i}", i * 1.5, 0) for i in range(5)]
+        mock_board.footprints = _footprint_collection(footprints)
+
+        assert placement_manager.check_collisions() == 4
+        assert len(placement_manager.validate_placements()) == 5
+        assert placement_manager.find_valid_position("U0", Point(50, 50)) == Point(
+            50, 50
+        )
+
+
+def _select_backend(monkeypatch, backend):
+    """Force PlacementManager onto its Numba, NumPy-only or pure-Python path.
+
+    The vectorized backends are forced on for boards of any size, so the
+    small fixture boards exercise them.
+    """
+    from kicad_pcb_api.managers import placement as placement_module
+
+    if backend == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(placement_module, "NUMBA_AVAILABLE", False)
+    if backend == "python":
+        monkeypatch.setattr(placement_module, "np", None)
+    else:
+        monkeypatch.setattr(placement_module, "VECTORIZE_THRESHOLD", 0)
+
+
+def _footprint_collection(footprints):
+    """Put footprints in a real FootprintCollection, as PCBBoard.footprints does."""
+    from kicad_pcb_api.collections.footprints import FootprintCollection
+
+    collection = FootprintCollection()
+    collection.extend(footprints)
+    return collection
+
+
+def _courtyard_footprint(reference, x, y, size=2.0):
+    """Create a footprint with a square F.CrtYd courtyard centred on (x, y)."""
+    half = size / 2
+    return Footprint(
+        library="Test",
+        name="Square",
+        position=Point(x, y),
+        reference=reference,
+        uuid=f"uuid-{reference}",
+        rectangles=[Rectangle(Point(-half, -half), Point(half, half), "F.CrtYd")],
+    )
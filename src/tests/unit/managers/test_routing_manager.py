@@ -8,8 +8,11 @@ length statistics, and track optimization.
 from unittest.mock import Mock, MagicMock, patch
 import pytest
 
+from kicad_pcb_api.collections.footprints import FootprintCollection
+from kicad_pcb_api.collections.tracks import TrackCollection
+from kicad_pcb_api.collections.vias import ViaCollection
 from kicad_pcb_api.managers.routing import RoutingManager
-from kicad_pcb_api.core.types import Point, Track
+from kicad_pcb_api.core.types import Footprint, Pad, Point, Track
 
 
 @pytest.fixture
@@ -38,7 +41,7 @@ class TestRoutingManager:
 
         assert manager.board is mock_board
 
-    @patch('uuid.uuid4')
+    @patch('kicad_pcb_api.managers.routing.new_uuid')
     def test_add_track_creates_track_with_parameters(self, mock_uuid, routing_manager, mock_board):
         """Test add_track creates track with correct parameters."""
         mock_uuid.return_value = "test-uuid-1"
@@ -78,10 +81,10 @@ class TestRoutingManager:
         assert uuid_result is not None
         mock_board.tracks.add.assert_called_once()
 
-    @patch('uuid.uuid4')
+    @patch('kicad_pcb_api.managers.routing.new_uuids')
     def test_route_manhattan_creates_horizontal_then_vertical(self, mock_uuid, routing_manager, mock_board):
         """Test route_manhattan creates horizontal then vertical segments."""
-        mock_uuid.side_effect = ["uuid-1", "uuid-2"]
+        mock_uuid.return_value = ["uuid-1", "uuid-2"]
 
         start = Point(10, 10)
         end = Point(30, 40)
@@ -107,10 +110,10 @@ class TestRoutingManager:
         assert track2.start == Point(30, 10)
         assert track2.end == Point(30, 40)  # Same X, different Y
 
-    @patch('uuid.uuid4')
+    @patch('kicad_pcb_api.managers.routing.new_uuids')
     def test_route_manhattan_skips_segment_when_no_movement_needed(self, mock_uuid, routing_manager, mock_board):
         """Test route_manhattan skips segments when no movement needed."""
-        mock_uuid.side_effect = ["uuid-1"]
+        mock_uuid.return_value = ["uuid-1", "uuid-2"]
 
         # Only horizontal movement
         start = Point(10, 20)
@@ -122,49 +125,63 @@ class TestRoutingManager:
             layer="F.Cu"
         )
 
-        assert len(uuids) == 1
+        assert uuids == ["uuid-1"]
         assert mock_board.tracks.add.call_count == 1
 
-    def test_get_total_track_length_by_net_calculates_correctly(self, routing_manager, mock_board):
-        """Test get_total_track_length_by_net calculates total correctly."""
-        # Create mock tracks with length property
-        track1 = Mock()
-        track1.net = 5
-        track1.length = 10.0
+    def test_route_multi_point_chains_segments_with_unique_uuids(
+        self, routing_manager, mock_board
+    ):
+        """Test route_multi_point adds one track per leg, each with its own v4 UUID."""
+        import uuid
 
-        track2 = Mock()
-        track2.net = 5
-        track2.length = 15.0
+        points = [Point(0, 0), Point(5, 0), Point(5, 5), Point(10, 5)]
 
-        track3 = Mock()
-        track3.net = 3
-        track3.length = 20.0
+        uuids = routing_manager.route_multi_point(
+            points, width=0.25, layer="F.Cu", net=4
+        )
 
-        mock_board.tracks.__iter__ = Mock(return_value=iter([track1, track2, track3]))
+        mock_board.tracks.extend.assert_called_once()
+        added = list(mock_board.tracks.extend.call_args[0][0])
+        assert [(t.start, t.end) for t in added] == list(zip(points, points[1:]))
+        assert [t.uuid for t in added] == uuids
+        assert len(set(uuids)) == 3
+        assert all(uuid.UUID(u).version == 4 for u in uuids)
+        assert all(t.net == 4 for t in added)
+
+    def test_get_total_track_length_by_net_calculates_correctly(
+        self, routing_manager, mock_board
+    ):
+        """Test get_total_track_length_by_net calculates total correctly."""
+        mock_board.tracks = TrackCollection([
+            _straight_track(net=5, length=10.0, uuid="t1"),
+            _straight_track(net=5, length=15.0, uuid="t2"),
+            _straight_track(net=3, length=20.0, uuid="t3"),
+        ])
 
         length = routing_manager.get_total_track_length_by_net(5)
 
         assert length == 25.0
 
-    def test_get_length_statistics_by_net_groups_and_calculates(self, routing_manager, mock_board):
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_get_length_statistics_by_net_groups_and_calculates(
+        self, routing_manager, mock_board, monkeypatch, use_numpy
+    ):
         """Test get_length_statistics_by_net groups by net and calculates stats."""
-        track1 = Mock()
-        track1.net = 1
-        track1.length = 10.0
-
-        track2 = Mock()
-        track2.net = 1
-        track2.length = 20.0
-
-        track3 = Mock()
-        track3.net = 2
-        track3.length = 15.0
-
-        track4 = Mock()
-        track4.net = None
-        track4.length = 5.0
-
-        mock_board.tracks.__iter__ = Mock(return_value=iter([track1, track2, track3, track4]))
+        from kicad_pcb_api.collections import tracks as tracks_module
+        from kicad_pcb_api.managers import routing as routing_module
+
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(routing_module, "np", None)
+            monkeypatch.setattr(tracks_module, "np", None)
+
+        mock_board.tracks = TrackCollection([
+            _straight_track(net=1, length=10.0, uuid="t1"),
+            _straight_track(net=1, length=20.0, uuid="t2"),
+            _straight_track(net=2, length=15.0, uuid="t3"),
+            _straight_track(net=None, length=5.0, uuid="t4"),
+        ])
 
         stats = routing_manager.get_length_statistics_by_net()
 
@@ -182,21 +199,42 @@ class TestRoutingManager:
         # Track with None net should not be in stats
         assert None not in stats
 
-    def test_find_stubs_identifies_short_tracks(self, routing_manager, mock_board):
-        """Test find_stubs identifies tracks shorter than threshold."""
-        track1 = Mock()
-        track1.uuid = "stub-1"
-        track1.length = 0.05
+    def test_get_length_statistics_by_net_vectorized_matches_fallback(
+        self, routing_manager, mock_board, monkeypatch
+    ):
+        """Test the NumPy group-by matches the Python one on interleaved nets."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.managers import routing as routing_module
 
-        track2 = Mock()
-        track2.uuid = "normal-1"
-        track2.length = 5.0
+        mock_board.tracks = TrackCollection(_random_tracks(200, size=10))
 
-        track3 = Mock()
-        track3.uuid = "stub-2"
-        track3.length = 0.08
+        vectorized = routing_manager.get_length_statistics_by_net()
+        monkeypatch.setattr(routing_module, "np", None)
+        fallback = routing_manager.get_length_statistics_by_net()
 
-        mock_board.tracks.__iter__ = Mock(return_value=iter([track1, track2, track3]))
+        assert list(vectorized) == list(fallback)
+        for net, expected in fallback.items():
+            assert vectorized[net] == pytest.approx(expected)
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_find_stubs_identifies_short_tracks(
+        self, routing_manager, mock_board, monkeypatch, use_numpy
+    ):
+        """Test find_stubs identifies tracks shorter than threshold."""
+        from kicad_pcb_api.collections import tracks as tracks_module
+        from kicad_pcb_api.managers import routing as routing_module
+
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(routing_module, "np", None)
+            monkeypatch.setattr(tracks_module, "np", None)
+
+        mock_board.tracks = TrackCollection([
+            _straight_track(net=1, length=0.05, uuid="stub-1"),
+            _straight_track(net=1, length=5.0, uuid="normal-1"),
+            _straight_track(net=1, length=0.08, uuid="stub-2"),
+        ])
 
         stubs = routing_manager.find_stubs(min_stub_length=0.1)
 
@@ -205,35 +243,146 @@ class TestRoutingManager:
         assert "stub-2" in stubs
         assert "normal-1" not in stubs
 
-    def test_optimize_track_order_sorts_by_layer_and_net(self, routing_manager, mock_board):
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_get_net_routing_stats_summarizes_net(
+        self, routing_manager, mock_board, monkeypatch, use_numpy
+    ):
+        """Test get_net_routing_stats counts, sums and averages one net's tracks."""
+        from kicad_pcb_api.collections import tracks as tracks_module
+        from kicad_pcb_api.managers import routing as routing_module
+
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(routing_module, "np", None)
+            monkeypatch.setattr(tracks_module, "np", None)
+
+        mock_board.tracks = TrackCollection([
+            _straight_track(net=2, length=4.0, uuid="t1", width=0.2),
+            _straight_track(net=2, length=6.0, uuid="t2", width=0.4, layer="B.Cu"),
+            _straight_track(net=3, length=9.0, uuid="t3"),
+        ])
+        mock_board.vias = [Mock(net=2), Mock(net=3)]
+
+        stats = routing_manager.get_net_routing_stats(2)
+
+        assert stats["track_count"] == 2
+        assert stats["via_count"] == 1
+        assert stats["total_length"] == pytest.approx(10.0)
+        assert sorted(stats["layers_used"]) == ["B.Cu", "F.Cu"]
+        assert stats["average_track_width"] == pytest.approx(0.3)
+
+    def test_get_net_routing_stats_cached_until_tracks_change(
+        self, routing_manager, mock_board, monkeypatch
+    ):
+        """Test per-net queries are cached until a track is added or edited."""
+        mock_board.tracks = TrackCollection([
+            _straight_track(net=2, length=4.0, uuid="t1"),
+            _straight_track(net=3, length=9.0, uuid="t2"),
+        ])
+        mock_board.vias = ViaCollection()
+        calls = []
+        original = TrackCollection.get_total_length_by_net
+
+        def counting(collection, net):
+            calls.append(net)
+            return original(collection, net)
+
+        monkeypatch.setattr(TrackCollection, "get_total_length_by_net", counting)
+
+        first = routing_manager.get_net_routing_stats(2)
+        first["layers_used"].append("mutated")
+        assert routing_manager.get_net_routing_stats(2) == {
+            **first,
+            "layers_used": ["F.Cu"],
+        }
+        assert routing_manager.get_total_track_length_by_net(2) == pytest.approx(4.0)
+        assert routing_manager.get_total_track_length_by_net(2) == pytest.approx(4.0)
+        assert calls == [2]
+
+        mock_board.tracks.add(_straight_track(net=2, length=6.0, uuid="t3"))
+
+        assert routing_manager.get_net_routing_stats(2)["track_count"] == 2
+        assert routing_manager.get_total_track_length_by_net(2) == pytest.approx(10.0)
+        assert calls == [2, 2]
+
+        (wrapper,) = mock_board.tracks.filter_by_net(3)
+        wrapper.net = 2
+
+        assert routing_manager.get_net_routing_stats(2)["track_count"] == 3
+        assert routing_manager.get_total_track_length_by_net(2) == pytest.approx(19.0)
+        assert calls == [2, 2, 2]
+
+    def test_results_follow_tracks_edited_directly(self, routing_manager, mock_board):
+        """Test results see edits to raw Track objects once they are recorded."""
+        mock_board.tracks = TrackCollection([
+            Track(
+                start=Point(10.0 * i, 0), end=Point(10.0 * i + 5.0, 0), width=0.25,
+                layer="F.Cu", net=i + 1, uuid=f"t{i}",
+            )
+            for i in range(40)
+        ])
+        mock_board.vias = ViaCollection()
+
+        assert routing_manager.validate_routing(check_connectivity=False)[
+            "clearance_violations"
+        ] == []
+        assert routing_manager.get_total_track_length_by_net(1) == pytest.approx(5.0)
+        assert routing_manager.get_net_routing_stats(1)[
+            "total_length"
+        ] == pytest.approx(5.0)
+        assert routing_manager.find_stubs(0.1) == []
+
+        for track in mock_board.tracks:
+            track.start = Point(0, 0)
+            track.end = Point(0.05, 0)
+        mock_board.tracks.mark_modified()
+
+        errors = routing_manager.validate_routing(check_connectivity=False)
+        assert len(errors["clearance_violations"]) > 0
+        assert routing_manager.get_total_track_length_by_net(1) == pytest.approx(0.05)
+        assert routing_manager.get_net_routing_stats(1)[
+            "total_length"
+        ] == pytest.approx(0.05)
+        assert len(routing_manager.find_stubs(0.1)) == 40
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_optimize_track_order_sorts_by_layer_and_net(
+        self, routing_manager, mock_board, monkeypatch, use_numpy
+    ):
         """Test optimize_track_order sorts tracks by layer and net."""
-        # Create mock tracks
-        track1 = Mock()
-        track1.data = Mock(layer="B.Cu", net=3)
-
-        track2 = Mock()
-        track2.data = Mock(layer="F.Cu", net=1)
-
-        track3 = Mock()
-        track3.data = Mock(layer="F.Cu", net=2)
-
-        track4 = Mock()
-        track4.data = Mock(layer="F.Cu", net=None)
-
-        tracks = [track1, track2, track3, track4]
-        mock_board.tracks.__iter__ = Mock(return_value=iter(tracks))
-        mock_board.tracks._items = []
-        mock_board.tracks._dirty_indexes = False
+        from kicad_pcb_api.collections import tracks as tracks_module
+        from kicad_pcb_api.managers import routing as routing_module
+
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(routing_module, "np", None)
+            monkeypatch.setattr(tracks_module, "np", None)
+
+        mock_board.tracks = TrackCollection([
+            _straight_track(net=3, length=1.0, uuid="t1", layer="F.Cu"),
+            _straight_track(net=1, length=2.0, uuid="t2", layer="B.Cu"),
+            _straight_track(net=2, length=3.0, uuid="t3", layer="F.Cu"),
+            _straight_track(net=None, length=4.0, uuid="t4", layer="F.Cu"),
+            _straight_track(net=1, length=5.0, uuid="t5", layer="F.Cu"),
+        ])
+        if use_numpy:
+            mock_board.tracks.arrays()
 
         routing_manager.optimize_track_order()
 
-        # Verify sorting was applied
-        assert mock_board.tracks._dirty_indexes is True
-        assert len(mock_board.tracks._items) == 4
+        assert [t.uuid for t in mock_board.tracks] == ["t2", "t4", "t5", "t3", "t1"]
+        assert mock_board.tracks.get("t3") is not None
+        assert [w.uuid for w in mock_board.tracks.filter_by_net(1)] == ["t2", "t5"]
+        if use_numpy:
+            arrays = mock_board.tracks.arrays()
+            assert arrays.uuids == ["t2", "t4", "t5", "t3", "t1"]
+            assert arrays.length.tolist() == pytest.approx([2.0, 4.0, 5.0, 3.0, 1.0])
 
     def test_get_length_statistics_handles_empty_board(self, routing_manager, mock_board):
         """Test get_length_statistics_by_net handles board with no tracks."""
-        mock_board.tracks.__iter__ = Mock(return_value=iter([]))
+        mock_board.tracks = TrackCollection()
 
         stats = routing_manager.get_length_statistics_by_net()
 
@@ -261,3 +410,328 @@ class TestRoutingManager:
         assert track1.net_name == "SIGNAL"
         assert track2.net == 7
         assert track2.net_name == "SIGNAL"
+
+    def test_validate_routing_vectorized_clearance_matches_scalar(
+        self, routing_manager, mock_board, monkeypatch
+    ):
+        """Test the NumPy clearance check reports the same violations, in order."""
+        pytest.importorskip("numpy")
+        from kicad_pcb_api.managers import routing as routing_module
+
+        monkeypatch.setattr(routing_module, "NUMBA_AVAILABLE", False)
+        monkeypatch.setattr(routing_module, "SCIPY_AVAILABLE", False)
+        tracks = _random_tracks(routing_module.VECTORIZE_THRESHOLD + 36, size=10)
+        mock_board.tracks = TrackCollection(tracks)
+
+        vectorized = routing_manager.validate_routing(
+            check_connectivity=False, min_clearance=1.0
+        )["clearance_violations"]
+
+        monkeypatch.setattr(routing_module, "np", None)
+        scalar = routing_manager.validate_routing(
+            check_connectivity=False, min_clearance=1.0
+        )["clearance_violations"]
+
+        assert len(scalar) > 0
+        assert vectorized == scalar
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_validate_routing_reports_nets_with_pads_but_no_tracks(
+        self, routing_manager, mock_board, monkeypatch, use_numpy
+    ):
+        """Test connectivity check lists pad nets that have no tracks."""
+        from kicad_pcb_api.collections import tracks as tracks_module
+        from kicad_pcb_api.managers import routing as routing_module
+
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(routing_module, "np", None)
+            monkeypatch.setattr(tracks_module, "np", None)
+
+        pads = [
+            Pad(
+                number=str(n),
+                type="smd",
+                shape="rect",
+                position=Point(n, 0),
+                size=(1, 1),
+                net=net,
+            )
+            for n, net in enumerate([1, 2, 3, 0, None])
+        ]
+        mock_board.footprints = FootprintCollection(
+            [
+                Footprint(
+                    library="L",
+                    name="N",
+                    position=Point(0, 0),
+                    reference="U1",
+                    uuid="fp1",
+                    pads=pads,
+                )
+            ]
+        )
+        mock_board.tracks = TrackCollection([
+            _straight_track(net=1, length=1.0, uuid="t1"),
+            _straight_track(net=None, length=1.0, uuid="t2"),
+            _straight_track(net=4, length=1.0, uuid="t3"),
+        ])
+
+        errors = routing_manager.validate_routing(check_clearances=False)
+
+        assert sorted(errors["unrouted_nets"]) == [
+            "Net 2 has no routing",
+            "Net 3 has no routing",
+        ]
+
+    def test_validate_routing_flags_tracks_off_copper(
+        self, routing_manager, mock_board
+    ):
+        """Test layer check accepts every copper layer and flags the rest."""
+        mock_board.tracks = TrackCollection([
+            _straight_track(net=1, length=1.0, uuid="t1", layer="In12.Cu"),
+            _straight_track(net=1, length=1.0, uuid="t2", layer="F.SilkS"),
+        ])
+
+        errors = routing_manager.validate_routing(
+            check_clearances=False, check_connectivity=False
+        )
+
+        assert errors["layer_violations"] == ["Track on invalid layer: F.SilkS"]
+
+    def test_auto_route_freerouting_replaces_routing_from_ses(
+        self, monkeypatch, tmp_path
+    ):
+        """Test SES routing replaces the board's tracks and vias in mm, and saves."""
+        from kicad_pcb_api.core.pcb_board import PCBBoard
+        from kicad_pcb_api.core.types import Net
+        from kicad_pcb_api.managers import routing as routing_module
+
+        board = PCBBoard()
+        gnd = board.add_net("GND")
+        board.add_track(0, 0, 5, 5, net=Net(gnd, "GND"))
+        board.save(tmp_path / "board.kicad_pcb")
+        (tmp_path / "board.ses").write_text(
+            """(session "board.ses"
+  (base_design "board.dsn")
+  (routes
+    (resolution um 10)
+    (network_out
+      (net GND
+        (wire (path F.Cu 2500 0 0 100000 0 100000 50000))
+        (wire (path F.Cu 2500 0 0 20000 0))
+        (via "Via[0-1]_800:400_um" 100000 50000)
+      )
+      (net UNKNOWN
+        (wire (path F.Cu 2500 0 0 20000 0))
+      )
+    )
+  )
+)
+"""
+        )
+        runner = Mock()
+        runner.return_value.route.return_value = (True, "")
+        monkeypatch.setattr(routing_module, "FreeroutingRunner", runner)
+
+        assert board.routing.auto_route_freerouting(
+            dsn_file=str(tmp_path / "board.dsn"), keep_temp_files=True
+        )
+
+        tracks = list(board.tracks)
+        assert tracks == board.pcb_data["tracks"]
+        assert [(t.start.x, t.start.y, t.end.x, t.end.y) for t in tracks] == [
+            (0, 0, 10, 0), (10, 0, 10, 5), (0, 0, 2, 0)
+        ]
+        assert all(t.net == gnd and t.width == 0.25 and t.uuid for t in tracks)
+        assert len({t.uuid for t in tracks}) == 3
+        vias = list(board.vias)
+        assert vias == board.pcb_data["vias"]
+        assert [(v.net, v.position.x, v.position.y, v.size, v.drill) for v in vias] == [
+            (gnd, 10, 5, 0.8, 0.4)
+        ]
+
+        board.save(tmp_path / "routed.kicad_pcb")
+        reloaded = PCBBoard(str(tmp_path / "routed.kicad_pcb"))
+        assert len(reloaded.tracks) == 3
+        assert [v.position.x for v in reloaded.vias] == [10]
+
+    def test_auto_route_freerouting_checks_java_while_exporting(
+        self, routing_manager, monkeypatch
+    ):
+        """Test the Java check is started before the DSN export, not after it."""
+        from kicad_pcb_api.managers import routing as routing_module
+
+        calls = Mock()
+        calls.runner.return_value.route.return_value = (False, "no jar")
+        monkeypatch.setattr(routing_module, "FreeroutingRunner", calls.runner)
+        monkeypatch.setattr(routing_module, "DSNExporter", calls.exporter)
+
+        assert routing_manager.auto_route_freerouting() is False
+
+        names = [name for name, _, _ in calls.mock_calls]
+        assert names.index("runner().start_java_check") < names.index(
+            "exporter().export"
+        )
+        assert names.index("exporter().export") < names.index("runner().route")
+
+    def test_same_layer_pairs_lists_sorted_different_net_pairs(self):
+        """Test the layer-partitioned pair list matches an all-pairs scan, in order."""
+        tracks = _random_tracks(60, size=10)
+
+        expected = [
+            (i, j)
+            for i in range(len(tracks))
+            for j in range(i + 1, len(tracks))
+            if tracks[i].layer == tracks[j].layer and tracks[i].net != tracks[j].net
+        ]
+
+        assert RoutingManager._same_layer_pairs(tracks) == expected
+
+    @pytest.mark.parametrize("use_rtree", [True, False])
+    def test_validate_routing_spatial_prefilter_matches_brute_force(
+        self, routing_manager, mock_board, monkeypatch, use_rtree
+    ):
+        """Test the spatial-index broad phase finds every clearance violation."""
+        from kicad_pcb_api.core import spatial_index
+        from kicad_pcb_api.managers import routing as routing_module
+
+        if use_rtree:
+            pytest.importorskip("rtree")
+        else:
+            monkeypatch.setattr(spatial_index, "rtree_index", None)
+        monkeypatch.setattr(routing_module, "NUMBA_AVAILABLE", False)
+        monkeypatch.setattr(routing_module, "SCIPY_AVAILABLE", False)
+
+        tracks = _random_tracks(300, size=40, max_length=3)
+        mock_board.tracks = TrackCollection(tracks)
+
+        indexed = routing_manager.validate_routing(
+            check_connectivity=False, min_clearance=0.5
+        )["clearance_violations"]
+
+        monkeypatch.setattr(routing_module, "SPATIAL_INDEX_THRESHOLD", len(tracks) + 1)
+        brute_force = routing_manager.validate_routing(
+            check_connectivity=False, min_clearance=0.5
+        )["clearance_violations"]
+
+        assert len(brute_force) > 0
+        assert indexed == brute_force
+
+    def test_validate_routing_kernel_matches_spatial_index(
+        self, routing_manager, mock_board, monkeypatch
+    ):
+        """Test the Numba clearance kernel reports the same violations, in order."""
+        pytest.importorskip("numba")
+        from kicad_pcb_api.managers import routing as routing_module
+
+        tracks = _random_tracks(300, size=40, max_length=3)
+        mock_board.tracks = TrackCollection(tracks)
+
+        compiled = routing_manager.validate_routing(
+            check_connectivity=False, min_clearance=0.5
+        )["clearance_violations"]
+
+        monkeypatch.setattr(routing_module, "NUMBA_AVAILABLE", False)
+        monkeypatch.setattr(routing_module, "SCIPY_AVAILABLE", False)
+        indexed = routing_manager.validate_routing(
+            check_connectivity=False, min_clearance=0.5
+        )["clearance_violations"]
+
+        assert len(indexed) > 0
+        assert compiled == indexed
+
+    def test_validate_routing_kdtree_matches_spatial_index(
+        self, routing_manager, mock_board, monkeypatch
+    ):
+        """Test the KD-tree clearance check reports the same violations, in order."""
+        pytest.importorskip("scipy")
+        from kicad_pcb_api.managers import routing as routing_module
+
+        monkeypatch.setattr(routing_module, "NUMBA_AVAILABLE", False)
+        tracks = _random_tracks(300, size=40, max_length=3)
+        # Zero-length tracks and shared endpoints between same-net tracks
+        tracks.append(
+            Track(
+                start=Point(5, 5),
+                end=Point(5, 5),
+                width=0.25,
+                layer="F.Cu",
+                net=1,
+                uuid="z1",
+            )
+        )
+        tracks.append(
+            Track(
+                start=Point(5, 5),
+                end=Point(6, 5),
+                width=0.25,
+                layer="F.Cu",
+                net=1,
+                uuid="z2",
+            )
+        )
+        tracks.append(
+            Track(
+                start=Point(5.2, 5),
+                end=Point(7, 5),
+                width=0.25,
+                layer="F.Cu",
+                net=2,
+                uuid="z3",
+            )
+        )
+        mock_board.tracks = TrackCollection(tracks)
+
+        kdtree = routing_manager.validate_routing(
+            check_connectivity=False, min_clearance=0.5
+        )["clearance_violations"]
+
+        monkeypatch.setattr(routing_module, "SCIPY_AVAILABLE", False)
+        indexed = routing_manager.validate_routing(
+            check_connectivity=False, min_clearance=0.5
+        )["clearance_violations"]
+
+        assert len(indexed) > 0
+        assert kdtree == indexed
+
+
+def _random_tracks(count, size, max_length=None, seed=7):
+    """Create reproducible random tracks on two layers within a size x size mm area."""
+    import random
+
+    rng = random.Random(seed)
+    tracks = []
+    for k in range(count):
+        start = Point(rng.uniform(0, size), rng.uniform(0, size))
+        if max_length is None:
+            end = Point(rng.uniform(0, size), rng.uniform(0, size))
+        else:
+            end = Point(
+                start.x + rng.uniform(-max_length, max_length),
+                start.y + rng.uniform(-max_length, max_length),
+            )
+        tracks.append(
+            Track(
+                start=start,
+                end=end,
+                width=0.25,
+                layer=rng.choice(["F.Cu", "B.Cu"]),
+                net=rng.choice([None, 1, 2, 3]),
+                uuid=f"random-{k}",
+            )
+        )
+    return tracks
+
+
+def _straight_track(net, length, uuid, width=0.25, layer="F.Cu"):
+    """Create a horizontal track of the given length."""
+    return Track(
+        start=Point(0, 0),
+        end=Point(length, 0),
+        width=width,
+        layer=layer,
+        net=net,
+        uuid=uuid,
+    )
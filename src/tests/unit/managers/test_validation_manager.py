@@ -94,6 +94,54 @@ class TestValidationManager:
         assert issues == 0
         assert len(validation_manager.issues) == 0
 
+    def test_validate_references_finds_invalid_formats(
+        self, validation_manager, mock_board
+    ):
+        """Test validate_references warns about malformed references, in order."""
+        footprints = []
+        for i, ref in enumerate(["R1", "REF**", "", "U1A", "C10", "r2"]):
+            footprint = Mock()
+            footprint.reference = ref
+            footprint.uuid = f"uuid-{i}"
+            footprints.append(footprint)
+        mock_board.pcb_data["footprints"] = footprints
+
+        issues = validation_manager.validate_references()
+
+        assert issues == 4
+        assert (
+            validation_manager.issues[0].description
+            == "Footprint has no reference designator"
+        )
+        assert [i.element_uuid for i in validation_manager.issues[1:]] == [
+            "uuid-1",
+            "uuid-3",
+            "uuid-5",
+        ]
+        assert all(i.severity == "warning" for i in validation_manager.issues[1:])
+
+    def test_find_invalid_references_matches_per_reference_check(self):
+        """Test the batch format scan agrees with matching references one by one."""
+        from kicad_pcb_api.core.validation import (
+            REFERENCE_PATTERN,
+            find_invalid_references,
+        )
+
+        references = ["R1", "", "U1A", "SW12", "J_1", "Q7\nX", "C3", "d4", "LED1"]
+        expected = [
+            i
+            for i, ref in enumerate(references)
+            if ref and not REFERENCE_PATTERN.match(ref)
+        ]
+
+        assert find_invalid_references(references) == expected
+        assert find_invalid_references([r for r in references if "\n" not in r]) == [
+            2,
+            4,
+            6,
+        ]
+        assert find_invalid_references([]) == []
+
     def test_validate_nets_finds_inconsistent_net_names(self, validation_manager, mock_board):
         """Test validate_nets finds inconsistent net names for same net number."""
         footprint1 = Mock()
@@ -175,6 +223,49 @@ class TestValidationManager:
 
         assert issues == 0
 
+    @pytest.mark.parametrize("use_rtree", [True, False])
+    def test_validate_placement_min_spacing_matches_brute_force(
+        self, validation_manager, mock_board, monkeypatch, use_rtree
+    ):
+        """Test the spatial-index spacing check matches comparing all pairs."""
+        import math
+        import random
+
+        from kicad_pcb_api.core import spatial_index
+
+        if use_rtree:
+            pytest.importorskip("rtree")
+        else:
+            monkeypatch.setattr(spatial_index, "rtree_index", None)
+
+        rng = random.Random(3)
+        footprints = [
+            Mock(
+                reference=f"R{k}",
+                uuid=f"uuid-{k}",
+                position=Point(rng.uniform(0, 30), rng.uniform(0, 30)),
+            )
+            for k in range(150)
+        ]
+        mock_board.pcb_data["footprints"] = footprints
+
+        count = validation_manager.validate_placement(min_spacing=1.5)
+
+        expected = [
+            fp.uuid
+            for k, fp in enumerate(footprints)
+            if any(
+                math.hypot(
+                    fp.position.x - other.position.x, fp.position.y - other.position.y
+                )
+                < 1.5
+                for other in footprints[:k]
+            )
+        ]
+        assert count > 0
+        assert [issue.element_uuid for issue in validation_manager.issues] == expected
+        assert all("apart" in issue.description for issue in validation_manager.issues)
+
     def test_validate_layers_finds_tracks_on_non_copper(self, validation_manager, mock_board):
         """Test validate_layers finds tracks on non-copper layers."""
         track = Mock()
@@ -229,6 +320,44 @@ class TestValidationManager:
         assert issues == 0
         assert len(validation_manager.issues) == 0
 
+    def test_validate_all_matches_individual_checks_in_order(
+        self, validation_manager, mock_board
+    ):
+        """Test the fused footprint pass reports the same issues, grouped as before."""
+        footprints = []
+        for ref, x, net_name in [
+            ("R1", 0, "A"),
+            ("R1", 5, "B"),
+            ("", 0, "A"),
+            ("R2", 5.0004, "C"),
+        ]:
+            footprint = Mock(
+                reference=ref, uuid=f"uuid-{len(footprints)}", position=Point(x, 0)
+            )
+            footprint.pads = [Mock(net=1, net_name=net_name)]
+            footprints.append(footprint)
+        mock_board.pcb_data["footprints"] = footprints
+        mock_board.pcb_data["tracks"] = [
+            Mock(layer="F.SilkS", uuid="t1"),
+            Mock(layer="In12.Cu", uuid="t2"),
+        ]
+
+        count = validation_manager.validate_all()
+        fused = [(i.category, i.description) for i in validation_manager.issues]
+
+        validation_manager.clear_issues()
+        validation_manager.validate_references()
+        validation_manager.validate_nets()
+        validation_manager.validate_placement()
+        validation_manager.validate_layers()
+        separate = [(i.category, i.description) for i in validation_manager.issues]
+
+        assert fused == separate
+        assert count == len(fused) == 7
+        assert [c for c, _ in fused] == ["reference"] * 2 + ["net"] * 2 + [
+            "placement"
+        ] * 2 + ["layer"]
+
     def test_get_errors_filters_error_severity(self, validation_manager):
         """Test get_errors returns only error-level issues."""
         validation_manager._issues = [